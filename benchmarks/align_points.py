@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+Times VMobject.align_points, as Transform.begin calls it, between a path of
+few curves and one of many, along with insert_n_curves on the path of few
+curves and align_points between two paths made of many subpaths. Each
+timing is the median of several repeats, on fresh copies of the paths.
+
+Run from the root of the repository:
+    python benchmarks/align_points.py [num_curves ...] [--repeat N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from manimlib.mobject.types.vectorized_mobject import VMobject
+
+DEFAULT_NUM_CURVES = [10, 100, 1000, 10000]
+
+
+def get_polygon(num_vertices, num_subpaths=1):
+    """
+    Returns a VMobject made of num_subpaths closed polygons, with
+    num_vertices corners in all.
+    """
+    vmobject = VMobject()
+    vertices_per_subpath = max(num_vertices // num_subpaths, 3)
+    for index in range(num_subpaths):
+        angles = np.linspace(0, 2 * np.pi, vertices_per_subpath + 1)
+        corners = np.array([np.cos(angles), np.sin(angles), 0 * angles]).T
+        vmobject.start_new_path(corners[0] + 3 * index)
+        vmobject.add_points_as_corners(corners[1:] + 3 * index)
+    return vmobject
+
+
+def time_call(func, make_args, repeat):
+    times = []
+    for _ in range(repeat):
+        args = make_args()
+        start_time = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start_time)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("num_curves", type=int, nargs="*", default=DEFAULT_NUM_CURVES)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print(f"{'curves':>8} {'align':>10} {'insert':>10} {'subpaths':>10}")
+    for num_curves in args.num_curves:
+        few = get_polygon(4)
+        many = get_polygon(num_curves)
+        few_subpaths = get_polygon(num_curves // 4, max(num_curves // 100, 1))
+        many_subpaths = get_polygon(num_curves, max(num_curves // 10, 1))
+        align_time = time_call(
+            VMobject.align_points,
+            lambda: (few.copy(), many.copy()),
+            args.repeat,
+        )
+        insert_time = time_call(
+            VMobject.insert_n_curves,
+            lambda: (few.copy(), num_curves - few.get_num_curves()),
+            args.repeat,
+        )
+        subpaths_time = time_call(
+            VMobject.align_points,
+            lambda: (few_subpaths.copy(), many_subpaths.copy()),
+            args.repeat,
+        )
+        print(
+            f"{num_curves:>8} {align_time * 1000:8.2f}ms "
+            f"{insert_time * 1000:8.2f}ms {subpaths_time * 1000:8.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
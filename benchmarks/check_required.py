@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""
+Times a scene which shifts a VGroup of many submobjects, along with some of
+those submobjects, on every play.  Each shift goes through
+manimlib.web.utils.check_required by way of register_transformation.
+
+Run from the root of the repository:
+    python benchmarks/check_required.py [num_submobjects] [num_plays]
+"""
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from manimlib import get_scene
+
+SCENE_CODE = """
+from manimlib.imports import *
+
+class ShiftLargeVGroup(Scene):
+    def construct(self):
+        group = VGroup(*[VectorizedPoint() for _ in range({num_submobjects})])
+        self.add(group)
+        for _ in range({num_plays}):
+            group.shift(0.01 * RIGHT)
+            for submob in group.submobjects[::50]:
+                submob.shift(0.01 * UP)
+            self.wait(0.1)
+"""
+
+
+def main():
+    num_submobjects = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    num_plays = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    code = SCENE_CODE.format(
+        num_submobjects=num_submobjects,
+        num_plays=num_plays,
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        scene = get_scene(code, ["ShiftLargeVGroup"])
+        start = time.perf_counter()
+        scene.render()
+        elapsed = time.perf_counter() - start
+    print(f"{num_submobjects} submobjects, {num_plays} plays: {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
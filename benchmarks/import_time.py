@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""
+Reports how long "from manimlib.imports import *" takes in a fresh
+interpreter, parsed from the output of python -X importtime. The median of
+several runs is reported, along with the modules which took the longest, and
+the same import followed by loading every module in manimlib.lazy_imports for
+comparison.
+
+Run from the root of the repository:
+    python benchmarks/import_time.py [num_runs] [--json PATH]
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+REPO_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORT_TIME_REGEX = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+STATEMENTS = {
+    "imports": "from manimlib.imports import *",
+    "imports + lazy modules": (
+        "from manimlib.imports import *\n"
+        "import importlib, manimlib.lazy_imports\n"
+        "for name in manimlib.lazy_imports.LAZY_MODULES:\n"
+        "    importlib.import_module(name)"
+    ),
+}
+
+
+def parse_import_times(output):
+    """
+    Returns a dict mapping each module imported to its (self, cumulative)
+    import times in microseconds.
+    """
+    times = {}
+    for line in output.splitlines():
+        match = IMPORT_TIME_REGEX.match(line)
+        if match:
+            times[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return times
+
+
+def time_import(statement):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=REPO_DIRECTORY,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_import_times(result.stderr)
+
+
+def get_report(statement, num_runs):
+    runs = [time_import(statement) for _ in range(num_runs)]
+    modules = set.intersection(*(set(times) for times in runs))
+    median_times = {
+        module: (
+            statistics.median(times[module][0] for times in runs),
+            statistics.median(times[module][1] for times in runs),
+        )
+        for module in modules
+    }
+    return {
+        "num_modules": len(modules),
+        "num_manimlib_modules": sum(
+            1 for module in modules if module.startswith("manimlib")
+        ),
+        "total_us": statistics.median(
+            sum(self_time for self_time, _ in times.values())
+            for times in runs
+        ),
+        "manimlib_self_us": statistics.median(
+            sum(
+                self_time
+                for module, (self_time, _) in times.items()
+                if module.startswith("manimlib")
+            )
+            for times in runs
+        ),
+        "slowest_modules": sorted(
+            median_times.items(),
+            key=lambda item: item[1][0],
+            reverse=True,
+        )[:15],
+    }
+
+
+def print_report(name, report):
+    print(
+        f"{name}: {report['total_us'] / 1000:.1f}ms in {report['num_modules']} "
+        f"modules ({report['num_manimlib_modules']} from manimlib, "
+        f"{report['manimlib_self_us'] / 1000:.1f}ms)"
+    )
+    for module, (self_time, cumulative_time) in report["slowest_modules"]:
+        print(f"    {self_time / 1000:8.2f}ms {cumulative_time / 1000:8.2f}ms  {module}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("num_runs", type=int, nargs="?", default=5)
+    parser.add_argument("--json", metavar="PATH", help="Also write the reports to PATH")
+    args = parser.parse_args()
+    reports = {}
+    for name, statement in STATEMENTS.items():
+        reports[name] = get_report(statement, args.num_runs)
+        print_report(name, reports[name])
+    if args.json is not None:
+        with open(args.json, "w") as f:
+            json.dump(reports, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
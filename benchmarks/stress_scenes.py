@@ -0,0 +1,86 @@
+"""
+Synthetic scenes for benchmarks/suite.py, which stress the parts of the
+library that the example scenes barely exercise.
+"""
+from manimlib.imports import *
+
+
+class ManyDots(Scene):
+    def construct(self):
+        dots = VGroup(*[
+            Dot(radius=0.02).move_to(
+                (i % 100 - 50) * 0.12 * RIGHT + (i // 100 - 50) * 0.07 * UP
+            )
+            for i in range(10000)
+        ])
+        self.add(dots)
+        self.play(dots.shift, RIGHT)
+        self.play(ApplyMethod(dots.set_color, RED))
+
+
+class DenseNumberPlaneApplyFunction(Scene):
+    def construct(self):
+        plane = NumberPlane(x_line_frequency=0.25, y_line_frequency=0.25)
+        plane.prepare_for_nonlinear_transform()
+        self.add(plane)
+        self.play(ApplyPointwiseFunction(
+            lambda p: p + np.array([np.sin(p[1]), np.sin(p[0]), 0]),
+            plane,
+        ))
+
+
+class DenseNumberPlaneApplyVectorizedFunction(Scene):
+    def construct(self):
+        plane = NumberPlane(x_line_frequency=0.25, y_line_frequency=0.25)
+        plane.prepare_for_nonlinear_transform()
+        self.add(plane)
+        self.play(ApplyPointwiseFunction(
+            vectorized_function(
+                lambda p: p + np.array([np.sin(p[..., 1]), np.sin(p[..., 0]), 0 * p[..., 2]]).T
+            ),
+            plane,
+        ))
+
+
+class StreamLinesScene(Scene):
+    def construct(self):
+        stream_lines = StreamLines(
+            lambda p: np.array([p[1], -p[0], 0]) / 3,
+            virtual_time=2,
+            color_by_arc_length=False,
+        )
+        self.add(stream_lines)
+        self.play(stream_lines.scale, 0.5)
+
+
+class ParametricSurfaceScene(Scene):
+    def construct(self):
+        surface = ParametricSurface(
+            lambda u, v: np.array([
+                np.cos(TAU * u) * (2 + np.cos(TAU * v)),
+                np.sin(TAU * u) * (2 + np.cos(TAU * v)),
+                np.sin(TAU * v),
+            ]),
+            resolution=24,
+        )
+        self.add(surface)
+        self.play(Rotate(surface, PI / 2, axis=RIGHT))
+
+
+class LongDecimalCounter(Scene):
+    def construct(self):
+        decimal = DecimalNumber(0, num_decimal_places=3)
+        self.add(decimal)
+        self.play(ChangeDecimalToValue(decimal, 1000, run_time=10))
+
+
+class DeepNestedCopies(Scene):
+    def construct(self):
+        group = VGroup(Square(), Circle())
+        for _ in range(8):
+            group = VGroup(group, group.copy().shift(0.1 * RIGHT))
+        self.add(group)
+        for _ in range(5):
+            copy = group.copy()
+            self.play(copy.shift, UP)
+            self.remove(copy)
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+"""
+Renders every scene of example_scenes.py and benchmarks/stress_scenes.py, each
+in a fresh process, and records for each one
+
+    wall_time           seconds taken by get_scene and render (the median
+                        of the repeats)
+    peak_rss_kib        peak resident set size of the process
+    num_registrations   calls to register_mobject
+    diff_bytes          size of the rendered results as JSON
+
+Scenes which raise are recorded with their error instead.
+
+Run from the root of the repository:
+    python benchmarks/suite.py run [--output PATH] [--repeat N] [scene ...]
+    python benchmarks/suite.py compare BASELINE RESULTS [--threshold 0.1]
+
+compare prints the change in each metric, flags those which grew by more
+than the threshold (a fraction) as well as scenes which stopped rendering,
+and exits with status 1 if there were any.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIRECTORY)
+
+SCENE_FILES = [
+    os.path.join(REPO_DIRECTORY, "example_scenes.py"),
+    os.path.join(REPO_DIRECTORY, "benchmarks", "stress_scenes.py"),
+]
+METRICS = ["wall_time", "peak_rss_kib", "num_registrations", "diff_bytes"]
+DEFAULT_OUTPUT = "benchmark_results.json"
+
+
+def measure_scene(path, scene_name):
+    """
+    Renders scene_name in this process and returns its metrics.
+    """
+    import manimlib
+    from manimlib.render_cache import CACHED_SCENE_ATTRIBUTES
+    from manimlib.web.stream import encode_value
+    with open(path) as f:
+        code = f.read()
+    with contextlib.redirect_stdout(io.StringIO()):
+        start_time = time.perf_counter()
+        scene = manimlib.get_scene(code, [scene_name])
+        if scene is None:
+            # get_scene prints the traceback and moves on.
+            return {"error": "Failed to construct the scene"}
+        scene.render()
+        wall_time = time.perf_counter() - start_time
+    results = {attr: getattr(scene, attr) for attr in CACHED_SCENE_ATTRIBUTES}
+    return {
+        "wall_time": wall_time,
+        # ru_maxrss is in KiB on Linux.
+        "peak_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "num_registrations": scene.session.num_mobject_registrations,
+        "diff_bytes": len(json.dumps(results, default=encode_value)),
+    }
+
+
+def run_measurement(path, scene_name):
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "measure", path, scene_name],
+        cwd=REPO_DIRECTORY,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        return {"error": lines[-1] if lines else f"Exited with {result.returncode}"}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def get_scene_names(path):
+    import manimlib
+    with open(path) as f:
+        code = f.read()
+    with contextlib.redirect_stdout(io.StringIO()):
+        return manimlib.get_scene_choices(code)
+
+
+def run_suite(scene_names=None, repeat=3):
+    results = {}
+    for path in SCENE_FILES:
+        for scene_name in get_scene_names(path):
+            if scene_names and scene_name not in scene_names:
+                continue
+            runs = [run_measurement(path, scene_name) for _ in range(repeat)]
+            errors = [run["error"] for run in runs if "error" in run]
+            if errors:
+                entry = {"error": errors[0]}
+                print(f"{scene_name:>32}: error: {errors[0]}")
+            else:
+                entry = {
+                    "wall_time": statistics.median(run["wall_time"] for run in runs),
+                    "peak_rss_kib": max(run["peak_rss_kib"] for run in runs),
+                    "num_registrations": runs[0]["num_registrations"],
+                    "diff_bytes": runs[0]["diff_bytes"],
+                }
+                print(
+                    f"{scene_name:>32}: {entry['wall_time']:8.3f}s "
+                    f"{entry['peak_rss_kib'] / 1024:8.1f}MiB "
+                    f"{entry['num_registrations']:8} registrations "
+                    f"{entry['diff_bytes']:10} bytes"
+                )
+            results[scene_name] = entry
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "scenes": results,
+    }
+
+
+def compare_results(baseline, results, threshold):
+    """
+    Prints the changes from baseline to results and returns the number of
+    regressions.
+    """
+    num_regressions = 0
+    for scene_name, entry in results["scenes"].items():
+        if scene_name not in baseline["scenes"]:
+            print(f"{scene_name:>32}: new")
+            continue
+        baseline_entry = baseline["scenes"][scene_name]
+        if "error" in entry:
+            if "error" not in baseline_entry:
+                num_regressions += 1
+                print(f"{scene_name:>32}: REGRESSION now fails: {entry['error']}")
+            else:
+                print(f"{scene_name:>32}: still fails")
+            continue
+        if "error" in baseline_entry:
+            print(f"{scene_name:>32}: fixed")
+            continue
+        changes = []
+        for metric in METRICS:
+            old_value = baseline_entry[metric]
+            new_value = entry[metric]
+            change = (new_value - old_value) / old_value if old_value else 0
+            flag = ""
+            if change > threshold:
+                num_regressions += 1
+                flag = " REGRESSION"
+            changes.append(f"{metric} {change:+.1%}{flag}")
+        print(f"{scene_name:>32}: " + ", ".join(changes))
+    return num_regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run")
+    run_parser.add_argument("scene_names", nargs="*")
+    run_parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    run_parser.add_argument("--repeat", type=int, default=3)
+    compare_parser = subparsers.add_parser("compare")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("results")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    measure_parser = subparsers.add_parser("measure")
+    measure_parser.add_argument("path")
+    measure_parser.add_argument("scene_name")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        results = run_suite(args.scene_names, repeat=args.repeat)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"Wrote {args.output}")
+    elif args.command == "compare":
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.results) as f:
+            results = json.load(f)
+        num_regressions = compare_results(baseline, results, args.threshold)
+        print(f"{num_regressions} regressions above {args.threshold:.0%}")
+        sys.exit(1 if num_regressions else 0)
+    elif args.command == "measure":
+        print(json.dumps(measure_scene(args.path, args.scene_name)))
+
+
+if __name__ == "__main__":
+    main()
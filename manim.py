@@ -1,13 +1,125 @@
 #!/usr/bin/env python
 from manimlib import get_scene
+from manimlib.profiling import Profiler
+from manimlib.render_cache import RenderCache
+import argparse
+import contextlib
 import pprint
 import sys
 
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("file", help="Path to the file containing the Scene")
+    parser.add_argument(
+        "scene_names",
+        nargs="*",
+        help="Name of the Scene to render, or of the Scenes to collect TeX "
+             "strings from with --prewarm-tex (all of them by default)",
+    )
+    parser.add_argument(
+        "--stream",
+        metavar="PATH",
+        help="Stream a line of JSON to PATH for each play or wait instead "
+             "of printing the diffs at the end. Use - for stdout.",
+    )
+    parser.add_argument(
+        "--keyframes-only",
+        action="store_true",
+        help="Only evaluate animations at their start and end, unless a "
+             "Mobject has a time-based updater",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        metavar="DIR",
+        help="Reuse the results of identical renders stored in DIR, and "
+             "store new ones there",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print the time spent in each phase of each play and wait, "
+             "along with the Mobjects, points and peak memory of the Scene",
+    )
+    parser.add_argument(
+        "--profile-trace",
+        metavar="PATH",
+        help="Write the phases of each play and wait to PATH as a Chrome "
+             "trace",
+    )
+    parser.add_argument(
+        "--prewarm-tex",
+        action="store_true",
+        help="Instead of rendering, add the points of every TeX string the "
+             "Scenes request to the cache, running latex in parallel",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Number of processes to use with --prewarm-tex",
+    )
+    args = parser.parse_args()
+    if not args.prewarm_tex and len(args.scene_names) != 1:
+        parser.error("exactly one Scene name is required")
+    return args
+
+def report_profile(profiler, args):
+    if profiler is None:
+        return
+    profiler.stop()
+    if args.profile:
+        profiler.print_summary(file=sys.stderr)
+    if args.profile_trace is not None:
+        profiler.write_chrome_trace(args.profile_trace)
+
 def main():
-    with open(sys.argv[1], "r") as f:
+    args = parse_args()
+    with open(args.file, "r") as f:
         code = f.read()
-    scene = get_scene(code, [sys.argv[2]])
+
+    if args.prewarm_tex:
+        from manimlib.web.tex_prewarm import prewarm_tex_cache
+        prewarm_tex_cache(
+            code,
+            scene_names=args.scene_names or None,
+            processes=args.jobs,
+        )
+        return
+
+    if args.profile or args.profile_trace is not None:
+        profiler = Profiler()
+    else:
+        profiler = None
+
+    if args.stream is not None:
+        sink = sys.stdout if args.stream == "-" else args.stream
+        # Keep anything else the Scene prints out of the stream.
+        with contextlib.redirect_stdout(sys.stderr):
+            scene = get_scene(
+                code,
+                args.scene_names,
+                diff_sink=sink,
+                keyframes_only=args.keyframes_only,
+                profiler=profiler,
+            )
+            scene.render()
+        report_profile(profiler, args)
+        return
+
+    if args.cache_dir is not None:
+        render_cache = RenderCache(args.cache_dir)
+    else:
+        render_cache = None
+    scene = get_scene(
+        code,
+        args.scene_names,
+        keyframes_only=args.keyframes_only,
+        render_cache=render_cache,
+        profiler=profiler,
+    )
     scene.render()
+    report_profile(profiler, args)
+    if render_cache is not None:
+        print(f"Render cache: {render_cache.get_stats()}", file=sys.stderr)
 
     pp = pprint.PrettyPrinter(indent=2)
     print("scene.initial_mobject_dict")
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+from manimlib.worker import (
+    DEFAULT_MAX_JOBS_PER_WORKER,
+    serve_stdio,
+    serve_unix_socket,
+)
+import argparse
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Render the scenes sent as lines of JSON without "
+                    "importing the library for each one",
+    )
+    parser.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="Serve jobs on a UNIX socket at PATH with a pool of workers "
+             "instead of reading them from stdin",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes to use with --socket",
+    )
+    parser.add_argument(
+        "--max-jobs",
+        type=int,
+        default=DEFAULT_MAX_JOBS_PER_WORKER,
+        help="Number of jobs after which a worker is replaced",
+    )
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    if args.socket is not None:
+        serve_unix_socket(
+            args.socket,
+            num_workers=args.workers,
+            max_jobs_per_worker=args.max_jobs,
+        )
+    else:
+        serve_stdio()
+
+if __name__ == "__main__":
+    main()
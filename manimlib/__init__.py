@@ -7,9 +7,9 @@ from manimlib.extract_scene import (
     get_scene_classes_from_module,
     get_scenes_to_render,
 )
+from manimlib.render_cache import get_render_cache_key
 
-def get_scene(code, scene_names):
-    module = manimlib.config.get_module(code)
+def get_scene(code, scene_names, diff_sink=None, keyframes_only=False, render_cache=None, profiler=None):
     config = {
         'scene_names': scene_names,
         'open_video_upon_completion' : True,
@@ -42,9 +42,24 @@ def get_scene(code, scene_names):
             'start_at_animation_number' : None,
             'end_at_animation_number' : None,
             'leave_progress_bars' : False,
+            'keyframes_only' : keyframes_only,
         }
     }
 
+    if diff_sink is not None:
+        # Streamed records aren't cached.
+        config['scene_kwargs']['diff_sink'] = diff_sink
+    elif render_cache is not None:
+        key = get_render_cache_key(code, scene_names, config['scene_kwargs'])
+        cached_scene = render_cache.load(key)
+        if cached_scene is not None:
+            return cached_scene
+        config['scene_kwargs']['render_cache'] = render_cache
+        config['scene_kwargs']['render_cache_key'] = key
+    if profiler is not None:
+        config['scene_kwargs']['profiler'] = profiler
+
+    module = manimlib.config.get_module(code)
     all_scene_classes = get_scene_classes_from_module(module)
     scene_classes_to_render = get_scenes_to_render(all_scene_classes, config)
 
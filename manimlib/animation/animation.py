@@ -26,6 +26,10 @@ class Animation(object):
         # with lagged start times
         "lag_ratio": DEFAULT_ANIMATION_LAG_RATIO,
         "suspend_mobject_updating": True,
+        # Whether the state this animation leaves its mobject in depends on
+        # the alphas it was interpolated at before, e.g. because it applies
+        # a change on each frame. Such animations can't skip frames.
+        "path_dependent": False,
     }
 
     def __init__(self, mobject, **kwargs):
@@ -147,6 +151,16 @@ class Animation(object):
         lower = index * lag_ratio
         return np.clip((value - lower), 0, 1)
 
+    def get_sub_alphas(self, alpha, num_submobjects):
+        """
+        Returns an array holding get_sub_alpha for each index.
+        """
+        lag_ratio = self.lag_ratio
+        full_length = (num_submobjects - 1) * lag_ratio + 1
+        value = alpha * full_length
+        lower = np.arange(num_submobjects) * lag_ratio
+        return np.clip((value - lower), 0, 1)
+
     # Getters and setters
     def set_run_time(self, run_time):
         self.run_time = run_time
@@ -168,3 +182,6 @@ class Animation(object):
 
     def is_remover(self):
         return self.remover
+
+    def is_path_dependent(self):
+        return self.path_dependent
@@ -63,6 +63,11 @@ class AnimationGroup(Animation):
         for anim in self.animations:
             anim.update_mobjects(dt)
 
+    def is_path_dependent(self):
+        return self.path_dependent or any(
+            anim.is_path_dependent() for anim in self.animations
+        )
+
     def init_run_time(self):
         self.build_animations_with_timings()
         if self.anims_with_timings:
@@ -115,6 +120,8 @@ class AnimationGroup(Animation):
 class Succession(AnimationGroup):
     CONFIG = {
         "lag_ratio": 1,
+        # Each animation is only begun once a frame reaches it.
+        "path_dependent": True,
     }
 
     def begin(self):
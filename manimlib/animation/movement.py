@@ -1,6 +1,10 @@
 from manimlib.web.utils import serialize_args, serialize_config
+import numpy as np
+
 from manimlib.animation.animation import Animation
 from manimlib.utils.rate_functions import linear
+from manimlib.utils.simple_functions import is_vectorized_function
+from manimlib.utils.simple_functions import vectorized_function
 
 
 class Homotopy(Animation):
@@ -24,6 +28,16 @@ class Homotopy(Animation):
         super().__init__(mobject, **kwargs)
 
     def function_at_time_t(self, t):
+        if is_vectorized_function(self.homotopy):
+            # Then the coordinates are arrays, and so are those returned.
+            # A single point gives scalar coordinates, and is returned as one.
+            def function(points):
+                points = np.asarray(points)
+                return np.stack(
+                    np.broadcast_arrays(*self.homotopy(*points.T, t)),
+                    axis=-1,
+                )
+            return vectorized_function(function)
         return lambda p: self.homotopy(*p, t)
 
     def interpolate_submobject(self, submob, start, alpha):
@@ -62,6 +76,8 @@ class PhaseFlow(Animation):
         "virtual_time": 1,
         "rate_func": linear,
         "suspend_mobject_updating": False,
+        # Each frame flows the points on from where the last one left them.
+        "path_dependent": True,
     }
 
     def __init__(self, function, mobject, **kwargs):
@@ -78,7 +94,8 @@ class PhaseFlow(Animation):
         if hasattr(self, "last_alpha"):
             dt = self.virtual_time * (alpha - self.last_alpha)
             self.mobject.apply_function(
-                lambda p: p + dt * self.function(p)
+                lambda p: p + dt * self.function(p),
+                vectorized=is_vectorized_function(self.function),
             )
         self.last_alpha = alpha
 
@@ -9,6 +9,7 @@ from manimlib.constants import OUT
 from manimlib.constants import DEGREES
 from manimlib.mobject.mobject import Group
 from manimlib.mobject.mobject import Mobject
+from manimlib.mobject.types.vectorized_mobject import interpolate_vmobjects
 from manimlib.utils.config_ops import digest_config
 from manimlib.utils.paths import path_along_arc
 from manimlib.utils.paths import straight_path
@@ -34,6 +35,8 @@ class Transform(Animation):
             })
         super().__init__(mobject, **kwargs)
         self.target_mobject = target_mobject
+        # Kept by interpolate_vmobjects between frames
+        self.interpolation_cache = {}
         self.init_path_func()
 
     def get_args(self):
@@ -60,6 +63,7 @@ class Transform(Animation):
         # Note, this potentially changes the structure
         # of both mobject and target_mobject
         self.mobject.align_data(self.target_copy)
+        self.interpolation_cache.clear()
         super().begin()
 
     def create_target(self):
@@ -106,6 +110,19 @@ class Transform(Animation):
             ]
         ])
 
+    def interpolate_mobject(self, alpha):
+        # Unless interpolate_submobject is overridden, the families can be
+        # interpolated all at once when they're made of VMobjects.
+        if type(self).interpolate_submobject is Transform.interpolate_submobject:
+            families = list(self.get_all_families_zipped())
+            sub_alphas = self.get_sub_alphas(alpha, len(families))
+            if interpolate_vmobjects(
+                *zip(*families), sub_alphas, self.path_func,
+                cache=self.interpolation_cache,
+            ):
+                return
+        super().interpolate_mobject(alpha)
+
     def interpolate_submobject(self, submob, start, target_copy, alpha):
         submob.interpolate(
             start, target_copy,
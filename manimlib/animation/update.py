@@ -12,6 +12,8 @@ class UpdateFromFunc(Animation):
     """
     CONFIG = {
         "suspend_mobject_updating": False,
+        # update_function is called once per frame, like an updater.
+        "path_dependent": True,
     }
 
     def __init__(self, mobject, update_function, **kwargs):
@@ -29,6 +31,11 @@ class UpdateFromFunc(Animation):
 
 
 class UpdateFromAlphaFunc(UpdateFromFunc):
+    CONFIG = {
+        # update_function is given alpha, which is all it depends on.
+        "path_dependent": False,
+    }
+
     def interpolate_mobject(self, alpha):
         self.update_function(self.mobject, alpha)
 
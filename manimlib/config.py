@@ -165,6 +165,9 @@ def parse_cli():
 
 def get_module(code):
     module = types.ModuleType("input_scenes")
+    # Resolve the names manimlib.imports only imports once they're used.
+    import manimlib.lazy_imports
+    module.__builtins__ = manimlib.lazy_imports.get_lazy_builtins()
     try:
         exec(code, module.__dict__)
         return module
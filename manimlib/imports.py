@@ -11,6 +11,9 @@ addressible by changing this file.
 
 Note: One should NOT import from this file for main library code, it is meant only
 as a convenience for scripts creating scenes for videos.
+
+Rarely used modules, listed in manimlib.lazy_imports, are only imported once one
+of their names is used.
 """
 
 
@@ -19,59 +22,25 @@ from manimlib.constants import *
 from manimlib.animation.animation import *
 from manimlib.animation.composition import *
 from manimlib.animation.creation import *
-from manimlib.animation.fading import *
-from manimlib.animation.growing import *
-from manimlib.animation.indication import *
-from manimlib.animation.movement import *
-from manimlib.animation.numbers import *
-from manimlib.animation.rotation import *
-from manimlib.animation.specialized import *
 from manimlib.animation.transform import *
-from manimlib.animation.update import *
 
 from manimlib.camera.camera import *
-from manimlib.camera.mapping_camera import *
-from manimlib.camera.moving_camera import *
-from manimlib.camera.three_d_camera import *
-
-from manimlib.mobject.coordinate_systems import *
-from manimlib.mobject.changing import *
-from manimlib.mobject.frame import *
-from manimlib.mobject.functions import *
+
 from manimlib.mobject.geometry import *
-from manimlib.mobject.matrix import *
 from manimlib.mobject.mobject import *
-from manimlib.mobject.number_line import *
-from manimlib.mobject.numbers import *
-from manimlib.mobject.probability import *
 from manimlib.mobject.shape_matchers import *
-from manimlib.mobject.svg.brace import *
-from manimlib.mobject.svg.drawings import *
 from manimlib.mobject.svg.svg_mobject import *
 from manimlib.mobject.svg.tex_mobject import *
 from manimlib.mobject.three_d_utils import *
-from manimlib.mobject.three_dimensions import *
 from manimlib.mobject.types.image_mobject import *
 from manimlib.mobject.types.point_cloud_mobject import *
 from manimlib.mobject.types.vectorized_mobject import *
-from manimlib.mobject.mobject_update_utils import *
-from manimlib.mobject.value_tracker import *
-from manimlib.mobject.vector_field import *
 
-from manimlib.scene.graph_scene import *
-from manimlib.scene.moving_camera_scene import *
-from manimlib.scene.reconfigurable_scene import *
 from manimlib.scene.scene import *
-from manimlib.scene.sample_space_scene import *
-from manimlib.scene.graph_scene import *
-from manimlib.scene.three_d_scene import *
-from manimlib.scene.vector_space_scene import *
-from manimlib.scene.zoomed_scene import *
 
 from manimlib.utils.bezier import *
 from manimlib.utils.color import *
 from manimlib.utils.config_ops import *
-from manimlib.utils.debug import *
 from manimlib.utils.images import *
 from manimlib.utils.iterables import *
 from manimlib.utils.file_ops import *
@@ -97,3 +66,49 @@ import sys
 import math
 
 from colour import Color
+
+# The remaining modules are only imported once one of their names is used,
+# which __getattr__ resolves with the table in manimlib.lazy_imports.
+# "from manimlib.imports import *" asks for __all__, which lists those names
+# too, so star-importing this module provides the same names as before.
+# Scene code run by manimlib.config.get_module star-imports only the other
+# names, and resolves these through its builtins once they're used.
+
+import manimlib.lazy_imports
+
+
+def __getattr__(name):
+    if name == "__all__":
+        return _get_star_import_names()
+    module_name = manimlib.lazy_imports.get_lazy_name_table().get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(manimlib.lazy_imports.get_lazy_name_table()))
+
+
+def _get_eager_names():
+    """
+    Returns the names "from manimlib.imports import *" provides which aren't
+    those of the lazily imported modules.
+    """
+    lazy_names = manimlib.lazy_imports.get_lazy_name_table()
+    return [
+        name for name in globals()
+        if not name.startswith("_") and name not in lazy_names
+    ]
+
+
+def _get_star_import_names():
+    """
+    Returns the names "from manimlib.imports import *" provides, including
+    those of the lazily imported modules.
+    """
+    lazy_names = manimlib.lazy_imports.get_lazy_name_table()
+    return _get_eager_names() + list(lazy_names)
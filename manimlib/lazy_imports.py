@@ -0,0 +1,401 @@
+"""
+Table of the names manimlib.imports provides without importing the modules
+that define them until they're used.
+
+LAZY_IMPORTS maps each of those modules to the names it provides. The table
+is generated by importing every module; after adding to or changing the
+public names of a module in LAZY_MODULES, regenerate it by running
+
+    python -m manimlib.lazy_imports
+"""
+import builtins
+import importlib
+import re
+import sys
+import types
+
+# Modules of manimlib.imports which are only imported once one of their names
+# is used, in the order in which they used to be star-imported.
+LAZY_MODULES = [
+    "manimlib.animation.fading",
+    "manimlib.animation.growing",
+    "manimlib.animation.indication",
+    "manimlib.animation.movement",
+    "manimlib.animation.numbers",
+    "manimlib.animation.rotation",
+    "manimlib.animation.specialized",
+    "manimlib.animation.update",
+    "manimlib.camera.mapping_camera",
+    "manimlib.camera.moving_camera",
+    "manimlib.camera.three_d_camera",
+    "manimlib.mobject.coordinate_systems",
+    "manimlib.mobject.changing",
+    "manimlib.mobject.frame",
+    "manimlib.mobject.functions",
+    "manimlib.mobject.matrix",
+    "manimlib.mobject.number_line",
+    "manimlib.mobject.numbers",
+    "manimlib.mobject.probability",
+    "manimlib.mobject.svg.brace",
+    "manimlib.mobject.svg.drawings",
+    "manimlib.mobject.three_dimensions",
+    "manimlib.mobject.mobject_update_utils",
+    "manimlib.mobject.value_tracker",
+    "manimlib.mobject.vector_field",
+    "manimlib.scene.graph_scene",
+    "manimlib.scene.moving_camera_scene",
+    "manimlib.scene.reconfigurable_scene",
+    "manimlib.scene.sample_space_scene",
+    "manimlib.scene.three_d_scene",
+    "manimlib.scene.vector_space_scene",
+    "manimlib.scene.zoomed_scene",
+    "manimlib.utils.debug",
+]
+
+#### GENERATED_TABLE_START ####
+LAZY_IMPORTS = {
+    'manimlib.animation.fading': [
+        'DEFAULT_FADE_LAG_RATIO',
+        'FadeIn',
+        'FadeInFrom',
+        'FadeInFromDown',
+        'FadeInFromLarge',
+        'FadeInFromPoint',
+        'FadeOut',
+        'FadeOutAndShift',
+        'FadeOutAndShiftDown',
+        'VFadeIn',
+        'VFadeInThenOut',
+        'VFadeOut',
+    ],
+    'manimlib.animation.growing': [
+        'GrowArrow',
+        'GrowFromCenter',
+        'GrowFromEdge',
+        'GrowFromPoint',
+        'SpinInFromNothing',
+    ],
+    'manimlib.animation.indication': [
+        'AnimationOnSurroundingRectangle',
+        'ApplyWave',
+        'CircleIndicate',
+        'Flash',
+        'FocusOn',
+        'Indicate',
+        'ShowCreationThenDestruction',
+        'ShowCreationThenDestructionAround',
+        'ShowCreationThenFadeAround',
+        'ShowCreationThenFadeOut',
+        'ShowPassingFlash',
+        'ShowPassingFlashAround',
+        'TurnInsideOut',
+        'WiggleOutThenIn',
+    ],
+    'manimlib.animation.movement': [
+        'ComplexHomotopy',
+        'Homotopy',
+        'MoveAlongPath',
+        'PhaseFlow',
+        'SmoothedVectorizedHomotopy',
+    ],
+    'manimlib.animation.numbers': [
+        'ChangeDecimalToValue',
+        'ChangingDecimal',
+    ],
+    'manimlib.animation.rotation': [
+        'Rotate',
+        'Rotating',
+    ],
+    'manimlib.animation.specialized': [
+        'Broadcast',
+        'MoveCar',
+    ],
+    'manimlib.animation.update': [
+        'MaintainPositionRelativeTo',
+        'UpdateFromAlphaFunc',
+        'UpdateFromFunc',
+    ],
+    'manimlib.camera.mapping_camera': [
+        'MappingCamera',
+        'OldMultiCamera',
+        'SplitScreenCamera',
+    ],
+    'manimlib.camera.moving_camera': [
+        'CameraFrame',
+        'MovingCamera',
+    ],
+    'manimlib.camera.three_d_camera': [
+        'ThreeDCamera',
+    ],
+    'manimlib.mobject.coordinate_systems': [
+        'Axes',
+        'ComplexPlane',
+        'CoordinateSystem',
+        'NumberPlane',
+        'ThreeDAxes',
+        'numbers',
+    ],
+    'manimlib.mobject.changing': [
+        'AnimatedBoundary',
+        'TracedPath',
+    ],
+    'manimlib.mobject.frame': [
+        'FullScreenFadeRectangle',
+        'FullScreenRectangle',
+        'PictureInPictureFrame',
+        'ScreenRectangle',
+    ],
+    'manimlib.mobject.functions': [
+        'FunctionGraph',
+        'ParametricFunction',
+    ],
+    'manimlib.mobject.matrix': [
+        'DecimalMatrix',
+        'IntegerMatrix',
+        'Matrix',
+        'MobjectMatrix',
+        'VECTOR_LABEL_SCALE_FACTOR',
+        'get_det_text',
+        'matrix_to_mobject',
+        'matrix_to_tex_string',
+        'vector_coordinate_label',
+    ],
+    'manimlib.mobject.number_line': [
+        'NumberLine',
+        'UnitInterval',
+    ],
+    'manimlib.mobject.numbers': [
+        'DecimalNumber',
+        'Integer',
+    ],
+    'manimlib.mobject.probability': [
+        'BarChart',
+        'EPSILON',
+        'SampleSpace',
+    ],
+    'manimlib.mobject.svg.brace': [
+        'Brace',
+        'BraceLabel',
+        'BraceText',
+    ],
+    'manimlib.mobject.svg.drawings': [
+        'AoPSLogo',
+        'BitcoinLogo',
+        'Bubble',
+        'Car',
+        'Clock',
+        'ClockPassesTime',
+        'DeckOfCards',
+        'DoubleSpeechBubble',
+        'Guitar',
+        'Headphones',
+        'Laptop',
+        'Lightbulb',
+        'Logo',
+        'PartyHat',
+        'PatreonLogo',
+        'PlayingCard',
+        'SpeechBubble',
+        'Speedometer',
+        'SuitSymbol',
+        'SunGlasses',
+        'ThoughtBubble',
+        'VectorizedEarth',
+        'VideoIcon',
+        'VideoSeries',
+    ],
+    'manimlib.mobject.three_dimensions': [
+        'Cube',
+        'ParametricSurface',
+        'Prism',
+        'Sphere',
+        'ThreeDVMobject',
+    ],
+    'manimlib.mobject.mobject_update_utils': [
+        'always',
+        'always_redraw',
+        'always_rotate',
+        'always_shift',
+        'assert_is_mobject_method',
+        'cycle_animation',
+        'f_always',
+        'turn_animation_into_updater',
+    ],
+    'manimlib.mobject.value_tracker': [
+        'ComplexValueTracker',
+        'ExponentialValueTracker',
+        'ValueTracker',
+    ],
+    'manimlib.mobject.vector_field': [
+        'AnimatedStreamLines',
+        'DEFAULT_SCALAR_FIELD_COLORS',
+        'ShowPassingFlashWithThinningStrokeWidth',
+        'StreamLines',
+        'VectorField',
+        'get_color_field_image_file',
+        'get_colored_background_image',
+        'get_rgb_gradient_function',
+        'move_along_vector_field',
+        'move_points_along_vector_field',
+        'move_submobjects_along_vector_field',
+    ],
+    'manimlib.scene.graph_scene': [
+        'GraphScene',
+    ],
+    'manimlib.scene.moving_camera_scene': [
+        'MovingCameraScene',
+    ],
+    'manimlib.scene.reconfigurable_scene': [
+        'ReconfigurableScene',
+    ],
+    'manimlib.scene.sample_space_scene': [
+        'SampleSpaceScene',
+    ],
+    'manimlib.scene.three_d_scene': [
+        'SpecialThreeDScene',
+        'ThreeDScene',
+    ],
+    'manimlib.scene.vector_space_scene': [
+        'LinearTransformationScene',
+        'VectorScene',
+        'X_COLOR',
+        'Y_COLOR',
+        'Z_COLOR',
+    ],
+    'manimlib.scene.zoomed_scene': [
+        'MultiCamera',
+        'ZoomedScene',
+    ],
+    'manimlib.utils.debug': [
+        'get_submobject_index_labels',
+        'print_family',
+    ],
+}
+#### GENERATED_TABLE_END ####
+
+lazy_name_table = None
+
+
+def get_lazy_name_table():
+    """
+    Returns a dict mapping each name in LAZY_IMPORTS to its module.
+    """
+    global lazy_name_table
+    if lazy_name_table is None:
+        lazy_name_table = {
+            name: module_name
+            for module_name, names in LAZY_IMPORTS.items()
+            for name in names
+        }
+    return lazy_name_table
+
+
+class LazyBuiltins(dict):
+    """
+    Builtins for code executed by get_module. Names the code uses which are
+    neither its own nor builtins are resolved from the lazily imported names
+    of manimlib.imports, so that "from manimlib.imports import *" still
+    provides them, although there it only provides the other names, as
+    import_deferring_lazy_names sees to.
+    """
+    def __missing__(self, name):
+        if name not in get_lazy_name_table():
+            raise KeyError(name)
+        import manimlib.imports
+        return getattr(manimlib.imports, name)
+
+
+def import_deferring_lazy_names(name, globals=None, locals=None, fromlist=(),
+                                level=0):
+    """
+    __import__ for code executed by get_module. Star-importing
+    manimlib.imports gets a stand-in module, whose __all__ leaves out the
+    lazily imported names so that their modules aren't imported.
+    """
+    module = builtins.__import__(name, globals, locals, fromlist, level)
+    if name != "manimlib.imports" or level != 0 or "*" not in (fromlist or ()):
+        return module
+    stand_in = types.ModuleType(module.__name__)
+    stand_in.__all__ = module._get_eager_names()
+    for eager_name in stand_in.__all__:
+        setattr(stand_in, eager_name, getattr(module, eager_name))
+    return stand_in
+
+
+def get_lazy_builtins():
+    lazy_builtins = LazyBuiltins(vars(builtins))
+    lazy_builtins["__import__"] = import_deferring_lazy_names
+    return lazy_builtins
+
+
+def get_star_import_names(module):
+    if hasattr(module, "__all__"):
+        return list(module.__all__)
+    return [name for name in vars(module) if not name.startswith("_")]
+
+
+def generate_lazy_imports():
+    """
+    Returns the LAZY_IMPORTS table, mapping each module in LAZY_MODULES to
+    the names that star-importing every module in order would have taken
+    from it, skipping those manimlib.imports already provides.
+    """
+    import manimlib.imports
+    eager_namespace = dict(vars(manimlib.imports))
+    modules = [importlib.import_module(name) for name in LAZY_MODULES]
+    # Each name comes from the last module providing it, unless it's defined
+    # in an earlier module which provides the same object.
+    providers = {}
+    for module in modules:
+        for name in get_star_import_names(module):
+            value = getattr(module, name)
+            if name in providers and getattr(providers[name], name) is value:
+                continue
+            providers[name] = module
+    table = {}
+    for name, module in providers.items():
+        value = getattr(module, name)
+        if name in eager_namespace:
+            if eager_namespace[name] is not value:
+                print(
+                    f"Warning: {module.__name__}.{name} differs from the "
+                    f"name manimlib.imports already provides",
+                    file=sys.stderr,
+                )
+            continue
+        defining_module = sys.modules.get(getattr(value, "__module__", None))
+        if defining_module in modules and getattr(defining_module, name, None) is value:
+            module = defining_module
+        table.setdefault(module.__name__, []).append(name)
+    return {
+        module_name: sorted(table[module_name])
+        for module_name in LAZY_MODULES
+        if module_name in table
+    }
+
+
+def main():
+    table = generate_lazy_imports()
+    with open(__file__) as f:
+        source = f.read()
+    table_lines = ["LAZY_IMPORTS = {"]
+    for module_name, names in table.items():
+        table_lines.append(f"    {module_name!r}: [")
+        table_lines.extend(f"        {name!r}," for name in names)
+        table_lines.append("    ],")
+    table_lines.append("}")
+    table_source = "\n".join(table_lines)
+    source = re.sub(
+        r"(#### GENERATED_TABLE_START ####\n).*(\n#### GENERATED_TABLE_END ####)",
+        lambda match: match.group(1) + table_source + match.group(2),
+        source,
+        flags=re.S,
+    )
+    with open(__file__, "w") as f:
+        f.write(source)
+    num_names = sum(len(names) for names in table.values())
+    print(f"Wrote {num_names} names from {len(table)} modules to {__file__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -302,6 +302,7 @@ class NumberPlane(Axes):
         "y_line_frequency": 1,
         "faded_line_ratio": 1,
         "make_smooth_after_applying_functions": True,
+        "use_packed_points": True,
     }
 
     def __init__(self, **kwargs):
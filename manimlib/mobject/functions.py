@@ -2,9 +2,27 @@ from manimlib.web.utils import serialize_args, serialize_config
 from manimlib.constants import *
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.config_ops import digest_config
+from manimlib.utils.simple_functions import is_vectorized_function
+from manimlib.utils.simple_functions import vectorized_function
 import math
 
 
+def _get_distances_to_segments(points, starts, ends):
+    """
+    Returns the distance from each of points to the segment from the
+    corresponding one of starts to that of ends.
+    """
+    vects = ends - starts
+    lengths_squared = (vects**2).sum(axis=1)
+    alphas = np.divide(
+        ((points - starts) * vects).sum(axis=1), lengths_squared,
+        out=np.zeros(len(points)),
+        where=(lengths_squared > 0),
+    )
+    closest_points = starts + np.clip(alphas, 0, 1)[:, np.newaxis] * vects
+    return np.sqrt(((points - closest_points)**2).sum(axis=1))
+
+
 class ParametricFunction(VMobject):
     CONFIG = {
         "t_min": 0,
@@ -13,6 +31,15 @@ class ParametricFunction(VMobject):
         "dt": 1e-8,
         # TODO, be smarter about figuring these out?
         "discontinuities": [],
+        # Whether to sample more finely than step_size where the curve
+        # bends further than adaptive_sampling_tolerance from the lines
+        # joining the samples, and then only keep as many samples as are
+        # needed for those lines to stay within it of all the others.
+        "use_adaptive_sampling": False,
+        # Half a pixel at the default resolution
+        "adaptive_sampling_tolerance": 0.5 * FRAME_WIDTH / DEFAULT_PIXEL_WIDTH,
+        # The most times a step can be halved to sample more finely
+        "max_adaptive_refinements": 8,
     }
 
     def __init__(self, function=None, **kwargs):
@@ -33,6 +60,16 @@ class ParametricFunction(VMobject):
     def get_point_from_function(self, t):
         return self.function(t)
 
+    def get_points_from_function(self, t_range):
+        """
+        Returns an array holding the point of the curve at each t in
+        t_range, computed in one call if the function is vectorized.
+        """
+        t_range = np.array(t_range, dtype=float)
+        if is_vectorized_function(self.function):
+            return np.array(self.function(t_range), dtype=float)
+        return np.array([self.function(t) for t in t_range], dtype=float)
+
     def get_step_size(self, t=None):
         if self.step_size == "auto":
             """
@@ -73,17 +110,113 @@ class ParametricFunction(VMobject):
             t_range = list(np.arange(t1, t2, self.get_step_size(t1)))
             if t_range[-1] != t2:
                 t_range.append(t2)
-            points = np.array([self.function(t) for t in t_range])
-            valid_indices = np.apply_along_axis(
-                np.all, 1, np.isfinite(points)
-            )
+            t_range = np.array(t_range)
+            points = self.get_points_from_function(t_range)
+            valid_indices = np.isfinite(points).all(axis=1)
+            t_range = t_range[valid_indices]
             points = points[valid_indices]
+            if self.use_adaptive_sampling and len(points) > 2:
+                t_range, points = self.get_adaptive_samples(t_range, points)
             if len(points) > 0:
                 self.start_new_path(points[0])
                 self.add_points_as_corners(points[1:])
         self.make_smooth()
         return self
 
+    def get_adaptive_samples(self, t_range, points):
+        """
+        Given the points of the curve at each t in t_range, returns the
+        times and points of the samples to keep, along with those to add,
+        as described for use_adaptive_sampling. Refining the samples and
+        simplifying them each use half the tolerance, so that together the
+        lines joining the samples kept stay within it of the curve.
+        """
+        t_range, points = self.get_refined_samples(t_range, points)
+        kept = self.get_simplified_sample_indices(points)
+        return t_range[kept], points[kept]
+
+    def get_refined_samples(self, t_range, points):
+        """
+        Quarters each step between the samples for as long as the curve,
+        at any of the three points which would split it, strays further
+        than half the tolerance from it. Checking more than the middle of each
+        step keeps curves which oscillate over it from being missed.
+        """
+        tolerance = self.adaptive_sampling_tolerance / 2
+        alphas = np.array([0.25, 0.5, 0.75])
+        is_refined = np.ones(len(points) - 1, dtype=bool)
+        # Quartering a step halves it twice.
+        for _ in range(self.max_adaptive_refinements // 2):
+            indices = np.flatnonzero(is_refined)
+            if len(indices) == 0:
+                break
+            t_starts = t_range[indices, np.newaxis]
+            t_ends = t_range[indices + 1, np.newaxis]
+            inner_ts = t_starts + alphas * (t_ends - t_starts)
+            inner_points = self.get_points_from_function(inner_ts.flatten())
+            inner_points = inner_points.reshape((len(indices), len(alphas), -1))
+            distances = _get_distances_to_segments(
+                inner_points.reshape((-1, inner_points.shape[2])),
+                np.repeat(points[indices], len(alphas), axis=0),
+                np.repeat(points[indices + 1], len(alphas), axis=0),
+            ).reshape(inner_ts.shape)
+            is_split = np.isfinite(inner_points).all(axis=(1, 2)) & (
+                distances > tolerance
+            ).any(axis=1)
+            indices = indices[is_split]
+            if len(indices) == 0:
+                break
+            t_range = np.insert(
+                t_range, np.repeat(indices + 1, len(alphas)),
+                inner_ts[is_split].flatten(),
+            )
+            points = np.insert(
+                points, np.repeat(indices + 1, len(alphas)),
+                inner_points[is_split].reshape((-1, points.shape[1])),
+                axis=0,
+            )
+            # Each quarter of each step split is checked again.
+            was_split = np.zeros(len(is_refined), dtype=bool)
+            was_split[indices] = True
+            is_refined = np.repeat(was_split, 1 + len(alphas) * was_split)
+        return t_range, points
+
+    def get_simplified_sample_indices(self, points):
+        """
+        Returns the indices of the samples to keep for the lines joining
+        them to pass within half the tolerance of all the others. Segments of
+        the samples which their first and last samples don't approximate
+        well enough are halved, top-down over all segments at once.
+        """
+        tolerance = self.adaptive_sampling_tolerance / 2
+        num_samples = len(points)
+        size = 2**int(np.log2(num_samples - 1))
+        starts = np.arange(0, num_samples - 1, size)
+        ends = np.minimum(starts + size, num_samples - 1)
+        kept_starts = []
+        while len(starts) > 0:
+            inner_counts = ends - starts - 1
+            segments = np.repeat(np.arange(len(starts)), inner_counts)
+            offsets = np.cumsum(inner_counts) - inner_counts
+            inner = np.arange(len(segments)) - offsets[segments] + starts[segments] + 1
+            distances = _get_distances_to_segments(
+                points[inner], points[starts[segments]], points[ends[segments]]
+            )
+            max_distances = np.zeros(len(starts))
+            has_inner = inner_counts > 0
+            if len(distances) > 0:
+                max_distances[has_inner] = np.maximum.reduceat(
+                    distances, offsets[has_inner]
+                )
+            is_close = max_distances <= tolerance
+            kept_starts.append(starts[is_close])
+            middles = (starts + ends)[~is_close] // 2
+            starts, ends = (
+                np.concatenate([starts[~is_close], middles]),
+                np.concatenate([middles, ends[~is_close]]),
+            )
+        return np.sort(np.concatenate([*kept_starts, [num_samples - 1]]))
+
 
 class FunctionGraph(ParametricFunction):
     CONFIG = {
@@ -100,8 +233,13 @@ class FunctionGraph(ParametricFunction):
                 **kwargs,
             })
         digest_config(self, kwargs)
-        self.parametric_function = \
-            lambda t: np.array([t, function(t), 0])
+        if is_vectorized_function(function):
+            self.parametric_function = vectorized_function(
+                lambda t: np.array([t, function(t), 0 * t]).T
+            )
+        else:
+            self.parametric_function = \
+                lambda t: np.array([t, function(t), 0])
         ParametricFunction.__init__(
             self,
             self.parametric_function,
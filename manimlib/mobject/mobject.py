@@ -6,11 +6,13 @@ import operator as op
 import os
 import random
 import sys
+import weakref as _weakref
 
 from colour import Color
 import numpy as np
 
 import manimlib.constants as consts
+import manimlib.web.utils
 from manimlib.constants import *
 from manimlib.container.container import Container
 from manimlib.utils.color import color_gradient
@@ -19,6 +21,7 @@ from manimlib.utils.iterables import list_update
 from manimlib.utils.iterables import remove_list_redundancies
 from manimlib.utils.paths import straight_path
 from manimlib.utils.simple_functions import get_parameters
+from manimlib.utils.simple_functions import is_vectorized_function
 from manimlib.utils.space_ops import angle_of_vector
 from manimlib.utils.space_ops import get_norm
 from manimlib.utils.space_ops import rotation_matrix
@@ -29,6 +32,50 @@ from manimlib.web.utils import (
 )
 
 
+class _PointsDescriptor(object):
+    """
+    Counts the assignments of the points of Mobjects. Having no __get__, it
+    leaves reading them a plain lookup in the __dict__ of the Mobject.
+    """
+    # The number of times the points of any Mobject were assigned, by which
+    # get_packed_points can tell that none were since it last checked.
+    num_assignments = 0
+
+    def __set__(self, mob, points):
+        _PointsDescriptor.num_assignments += 1
+        mob.__dict__["points"] = points
+
+
+# Random odd weights of the bits of the coordinates of points, as
+# _get_points_fingerprint sums them. It's extended as longer arrays of points
+# come along.
+_fingerprint_weights = np.zeros(0, dtype=np.uint64)
+_fingerprint_random_state = np.random.default_rng(0)
+
+
+def _get_points_fingerprint(points):
+    """
+    Returns the number of points along with a weighted sum of the bits of
+    their coordinates, which tells whether they were changed, including in
+    place, since a cached value was computed from them. The sum wraps
+    around, and changing any one coordinate always changes it, as the
+    weights are odd. Changing several leaves it as it was only by a chance
+    of one in 2**64.
+    """
+    global _fingerprint_weights
+    coordinates = np.ascontiguousarray(points, dtype=float).reshape(-1)
+    bits = coordinates.view(np.uint64)
+    if len(bits) > len(_fingerprint_weights):
+        num_new_weights = max(len(bits), 2 * len(_fingerprint_weights), 1024)
+        _fingerprint_weights = np.concatenate([
+            _fingerprint_weights,
+            _fingerprint_random_state.integers(
+                0, 2**63, num_new_weights, dtype=np.uint64,
+            ) * np.uint64(2) + np.uint64(1),
+        ])
+    return (len(points), int(np.dot(bits, _fingerprint_weights[:len(bits)])))
+
+
 # TODO: Explain array_attrs
 
 class Mobject(Container):
@@ -40,6 +87,9 @@ class Mobject(Container):
         "name": None,
         "dim": 3,
         "target": None,
+        # Whether to keep the points of the family in one contiguous array,
+        # so that transforming the whole family is a single array operation.
+        "use_packed_points": False,
     }
 
     def __init__(self, **kwargs):
@@ -56,6 +106,26 @@ class Mobject(Container):
             self.kwargs = kwargs
         #### EULERTOUR_INIT_START ####
         self.transformations = []
+        # Mobjects which have this one in their submobject list
+        self.parents = _weakref.WeakSet()
+        # Tuple of the Mobjects in the family of this one, or None until it
+        # is computed by get_cached_family.
+        self._family = None
+        # Maps whether only anchors were considered to the bounding box of
+        # the family of this Mobject computed by get_bounding_box, along with
+        # what it was computed from, as get_bounding_box checks it against.
+        self._bounding_boxes = {}
+        # The same for the bounding boxes of the points of this Mobject
+        # alone, along with the fingerprint of those points.
+        self._points_boxes = {}
+        # The array made by get_packed_points, along with the family, the
+        # points of each member and the anchor mask when it was made, and
+        # the value of _PointsDescriptor.num_assignments when it was last
+        # found valid, or None.
+        self._packed_points = None
+        # The array made by get_points_buffer, along with the view of it
+        # which points were last set to, or None.
+        self._points_buffer = None
         Container.__init__(self, **kwargs)
         self.submobjects = []
         self.color = Color(self.color)
@@ -76,6 +146,75 @@ class Mobject(Container):
     def __str__(self):
         return str(self.name)
 
+    def __getstate__(self):
+        # Parents are not carried over to copies, which instead become
+        # parents of their own submobjects in __setstate__. Neither are the
+        # caches and buffers below, which would otherwise be deep copied or
+        # pickled along with the points, only to be reset.
+        state = dict(self.__dict__)
+        for key in [
+            "parents",
+            "_family",
+            "_bounding_boxes",
+            "_points_boxes",
+            "_packed_points",
+            "_points_buffer",
+        ]:
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.parents = _weakref.WeakSet()
+        # A shallow copy would otherwise share the family of the original.
+        self._family = None
+        self._bounding_boxes = {}
+        self._points_boxes = {}
+        self._packed_points = None
+        self._points_buffer = None
+        for submob in self.__dict__.get("_submobjects", []):
+            submob.parents.add(self)
+
+    points = _PointsDescriptor()
+
+    @property
+    def submobjects(self):
+        return self._submobjects
+
+    @submobjects.setter
+    def submobjects(self, submobjects):
+        """
+        The submobject list should only be changed by assigning to it,
+        rather than editing it in place, so that parent pointers stay
+        up to date.
+        """
+        old_submobjects = self.__dict__.get("_submobjects", [])
+        self._submobjects = submobjects
+        old_ids = set(map(id, old_submobjects))
+        new_ids = set(map(id, submobjects))
+        removed = [sm for sm in old_submobjects if id(sm) not in new_ids]
+        added = [sm for sm in submobjects if id(sm) not in old_ids]
+        for submob in removed:
+            submob.parents.discard(self)
+        for submob in added:
+            submob.parents.add(self)
+        self.invalidate_family()
+        manimlib.web.utils.register_submobjects_change(self, removed, added)
+
+    def invalidate_family(self):
+        """
+        Drops the cached family of this Mobject and of its ancestors. The
+        ancestors of a Mobject whose family isn't cached can't have theirs
+        cached either, so those are skipped.
+        """
+        to_invalidate = [self]
+        while to_invalidate:
+            mob = to_invalidate.pop()
+            if mob.__dict__.get("_family") is None and mob is not self:
+                continue
+            mob._family = None
+            to_invalidate.extend(mob.parents)
+
     def reset_points(self):
         self.points = np.zeros((0, self.dim))
 
@@ -99,9 +238,10 @@ class Mobject(Container):
         return self
 
     def remove(self, *mobjects):
-        for mobject in mobjects:
-            if mobject in self.submobjects:
-                self.submobjects.remove(mobject)
+        self.submobjects = [
+            submob for submob in self.submobjects
+            if submob not in mobjects
+        ]
         return self
 
     def get_array_attrs(self):
@@ -267,6 +407,10 @@ class Mobject(Container):
         total_vector = reduce(op.add, vectors)
         if not np.allclose(total_vector, ORIGIN):
             register_transformation(self, 'shift', total_vector)
+        packed_points = self.get_packed_points()
+        if packed_points is not None:
+            packed_points += total_vector
+            return self
         for mob in self.family_members_with_points():
             mob.points = mob.points.astype('float')
             mob.points += total_vector
@@ -319,13 +463,27 @@ class Mobject(Container):
         )
         return self
 
-    def apply_function(self, function, **kwargs):
+    def apply_function(self, function, vectorized=None, **kwargs):
+        """
+        Moves each point p of the family to function(p). If vectorized,
+        which defaults to whether function was marked as vectorized, the
+        points of the whole family are instead passed to it all at once,
+        as an array of shape (N, 3).
+        """
+        if vectorized is None:
+            vectorized = is_vectorized_function(function)
         # Default to applying matrix about the origin, not mobjects center
         if len(kwargs) == 0:
             kwargs["about_point"] = ORIGIN
+        if vectorized:
+            points_function = function
+        else:
+            def points_function(points):
+                return np.apply_along_axis(function, 1, points)
         self.apply_points_function_about_point(
-            lambda points: np.apply_along_axis(function, 1, points),
+            points_function,
             transform=(('func', function)),
+            join_family_points=True,
             **kwargs
         )
         return self
@@ -352,7 +510,22 @@ class Mobject(Container):
         )
         return self
 
-    def apply_complex_function(self, function, **kwargs):
+    def apply_complex_function(self, function, vectorized=None, **kwargs):
+        if vectorized is None:
+            vectorized = is_vectorized_function(function)
+        if vectorized:
+            # Takes a single point, as when the web replays it, as well as
+            # an array of them.
+            def R3_func(points):
+                new_points = np.array(points, dtype=float)
+                xy_complex = function(
+                    new_points[..., 0] + 1j * new_points[..., 1]
+                )
+                new_points[..., 0] = np.real(xy_complex)
+                new_points[..., 1] = np.imag(xy_complex)
+                return new_points
+            return self.apply_function(R3_func, vectorized=True, **kwargs)
+
         def R3_func(point):
             x, y, z = point
             xy_complex = function(complex(x, y))
@@ -361,7 +534,7 @@ class Mobject(Container):
                 xy_complex.imag,
                 z
             ]
-        return self.apply_function(R3_func)
+        return self.apply_function(R3_func, **kwargs)
 
     def wag(self, direction=RIGHT, axis=DOWN, wag_factor=1.0):
         for mob in self.family_members_with_points():
@@ -399,13 +572,37 @@ class Mobject(Container):
     # Note, much of these are now redundant with default behavior of
     # above methods
 
-    def apply_points_function_about_point(self, func, transform=None, about_point=None, about_edge=None):
-        if transform is not None:
-            register_transformation(self, *transform)
+    def apply_points_function_about_point(self, func, transform=None, about_point=None, about_edge=None,
+                                          join_family_points=False):
+        """
+        Replaces the points of each member of the family with func of them,
+        taken relative to about_point. If join_family_points, func is called
+        once on the points of all members joined together, which must give
+        back as many points, and is never called on no points at all.
+        """
         if about_point is None:
             if about_edge is None:
                 about_edge = ORIGIN
             about_point = self.get_critical_point(about_edge)
+        if transform is not None:
+            register_transformation(self, *transform, about_point=about_point)
+        packed_points = self.get_packed_points()
+        if packed_points is not None:
+            packed_points -= about_point
+            packed_points[:] = func(packed_points)
+            packed_points += about_point
+            return self
+        if join_family_points:
+            mobs = self.family_members_with_points()
+            if len(mobs) == 0:
+                return self
+            lengths = np.array([len(mob.points) for mob in mobs])
+            ends = np.cumsum(lengths)
+            points = np.concatenate([mob.points for mob in mobs]) - about_point
+            points = np.asarray(func(points)) + about_point
+            for mob, start, end in zip(mobs, ends - lengths, ends):
+                mob.points = points[start:end]
+            return self
         for mob in self.get_family():
             mob.points -= about_point
             mob.points = func(mob.points)
@@ -769,8 +966,102 @@ class Mobject(Container):
     def get_num_points(self):
         return len(self.points)
 
+    def get_bounding_box(self, anchors_only=False):
+        """
+        Returns a 3x2 array holding the minimum and maximum coordinates in
+        each dimension of the points of the family (or only their anchors),
+        or None if there are none. It is kept until the submobjects of a
+        member of the family change, or their points do, even in place, as
+        _get_points_fingerprint tells.
+        """
+        cached = self._bounding_boxes.get(anchors_only)
+        packed_points = self.get_packed_points()
+        if packed_points is not None:
+            # The whole family is in one array, so there's no need to go
+            # through the submobjects.
+            fingerprint = _get_points_fingerprint(packed_points)
+            if cached is not None and cached[1] is packed_points \
+                    and cached[2] == fingerprint:
+                return cached[0]
+            points = packed_points
+            if anchors_only:
+                points = points[self._packed_points[3]]
+            box = None
+            if len(points) > 0:
+                # Reducing each column on its own is much faster than along
+                # axis 0 for an array this narrow.
+                box = np.array([
+                    [column.min(), column.max()]
+                    for column in points.T
+                ])
+                box.setflags(write=False)
+            self._bounding_boxes[anchors_only] = (
+                box, packed_points, fingerprint,
+            )
+            return box
+        family = self.get_cached_family()
+        fingerprints = tuple(
+            _get_points_fingerprint(mob.points) for mob in family
+        )
+        if cached is not None and cached[1] is family \
+                and cached[2] == fingerprints:
+            return cached[0]
+        boxes = [
+            box for box in (
+                mob.get_points_box(anchors_only, fingerprint)
+                for mob, fingerprint in zip(family, fingerprints)
+            )
+            if box is not None
+        ]
+        if boxes:
+            boxes = np.array(boxes)
+            box = np.array([boxes[:, :, 0].min(0), boxes[:, :, 1].max(0)]).T
+            box.setflags(write=False)
+        else:
+            box = None
+        self._bounding_boxes[anchors_only] = (box, family, fingerprints)
+        return box
+
+    def get_points_box(self, anchors_only, fingerprint):
+        """
+        Returns the bounding box of the points of this Mobject alone, as
+        get_bounding_box does for its family, given the fingerprint of the
+        points.
+        """
+        cached = self._points_boxes.get(anchors_only)
+        if cached is not None and cached[1] == fingerprint:
+            return cached[0]
+        points = self.points
+        if anchors_only:
+            points = points[self.get_anchor_mask()]
+        box = None
+        if len(points) > 0:
+            box = np.array([points.min(0), points.max(0)]).T
+        self._points_boxes[anchors_only] = (box, fingerprint)
+        return box
+
+    def get_anchor_mask(self):
+        """
+        Returns a boolean array marking the points which are anchors.
+        """
+        return np.ones(len(self.points), dtype=bool)
+
+    def get_boundary_box(self):
+        """
+        Returns the bounding box of get_points_defining_boundary.
+        """
+        return self.get_bounding_box()
+
     def get_extremum_along_dim(self, points=None, dim=0, key=0):
         if points is None:
+            box = self.get_boundary_box()
+            if box is not None:
+                if key < 0:
+                    return box[dim, 0]
+                elif key == 0:
+                    return (box[dim, 0] + box[dim, 1]) / 2
+                else:
+                    return box[dim, 1]
             points = self.get_points_defining_boundary()
         values = points[:, dim]
         if key < 0:
@@ -787,13 +1078,16 @@ class Mobject(Container):
         center.  This returns one of them.
         """
         result = np.zeros(self.dim)
-        all_points = self.get_points_defining_boundary()
-        if len(all_points) == 0:
+        box = self.get_boundary_box()
+        if box is None:
             return result
         for dim in range(self.dim):
-            result[dim] = self.get_extremum_along_dim(
-                all_points, dim=dim, key=direction[dim]
-            )
+            if direction[dim] < 0:
+                result[dim] = box[dim, 0]
+            elif direction[dim] == 0:
+                result[dim] = (box[dim, 0] + box[dim, 1]) / 2
+            else:
+                result[dim] = box[dim, 1]
         return result
 
     # Pseudonyms for more general get_critical_point method
@@ -834,10 +1128,10 @@ class Mobject(Container):
         return self.get_edge_center(IN)
 
     def length_over_dim(self, dim):
-        return (
-            self.reduce_across_dimension(np.max, np.max, dim) -
-            self.reduce_across_dimension(np.min, np.min, dim)
-        )
+        box = self.get_bounding_box()
+        if box is None:
+            return 0
+        return box[dim, 1] - box[dim, 0]
 
     def get_width(self):
         return self.length_over_dim(0)
@@ -980,12 +1274,70 @@ class Mobject(Container):
         return result + self.submobjects
 
     def get_family(self):
-        sub_families = list(map(Mobject.get_family, self.submobjects))
-        all_mobjects = [self] + list(it.chain(*sub_families))
-        return remove_list_redundancies(all_mobjects)
+        return list(self.get_cached_family())
+
+    def get_cached_family(self):
+        """
+        Returns the family of this Mobject as a tuple, which is kept until
+        the submobjects of a member of the family change.
+        """
+        family = self._family
+        if family is None:
+            sub_families = [
+                Mobject.get_cached_family(submob)
+                for submob in self.submobjects
+            ]
+            all_mobjects = [self] + list(it.chain(*sub_families))
+            family = tuple(remove_list_redundancies(all_mobjects))
+            self._family = family
+        return family
+
+    def get_packed_points(self):
+        """
+        If use_packed_points is set, returns an array holding the points of
+        every member of the family, whose points are views of its slices.
+        Editing it edits the points of the whole family at once. The array
+        is kept until the family changes or the points of a member are
+        assigned, after which it's rebuilt on the next call. Returns None if
+        use_packed_points isn't set or the family has no points.
+        """
+        if not self.use_packed_points:
+            return None
+        family = self.get_cached_family()
+        packed = self._packed_points
+        if packed is not None and packed[1] is family:
+            num_assignments = _PointsDescriptor.num_assignments
+            if packed[4] == num_assignments:
+                return packed[0]
+            if all(map(
+                op.is_, map(op.attrgetter("points"), family), packed[2]
+            )):
+                self._packed_points = (*packed[:4], num_assignments)
+                return packed[0]
+        with_points = [mob for mob in family if len(mob.points) > 0]
+        if not with_points:
+            self._packed_points = None
+            return None
+        packed_points = np.concatenate([
+            mob.points for mob in with_points
+        ]).astype('float')
+        start = 0
+        for mob in with_points:
+            end = start + len(mob.points)
+            mob.points = packed_points[start:end]
+            start = end
+        self._packed_points = (
+            packed_points,
+            family,
+            tuple(mob.points for mob in family),
+            np.concatenate([mob.get_anchor_mask() for mob in with_points]),
+            _PointsDescriptor.num_assignments,
+        )
+        return packed_points
 
     def family_members_with_points(self):
-        return [m for m in self.get_family() if m.get_num_points() > 0]
+        # Points change without the family changing, so this isn't cached.
+        return [m for m in self.get_cached_family() if len(m.points) > 0]
 
     def arrange(self, direction=RIGHT, center=True, **kwargs):
         for m1, m2 in zip(self.submobjects, self.submobjects[1:]):
@@ -1016,14 +1368,16 @@ class Mobject(Container):
     def sort(self, point_to_num_func=lambda p: p[0], submob_func=None):
         if submob_func is None:
             submob_func = lambda m: point_to_num_func(m.get_center())
-        self.submobjects.sort(key=submob_func)
+        self.submobjects = sorted(self.submobjects, key=submob_func)
         return self
 
     def shuffle(self, recursive=False):
         if recursive:
             for submob in self.submobjects:
                 submob.shuffle(recursive=True)
-        random.shuffle(self.submobjects)
+        submobjects = list(self.submobjects)
+        random.shuffle(submobjects)
+        self.submobjects = submobjects
 
     # Just here to keep from breaking old scenes.
     def arrange_submobjects(self, *args, **kwargs):
@@ -1111,10 +1465,7 @@ class Mobject(Container):
         # print(np.arange(target) * curr) [0 2 4]
         repeat_indices = (np.arange(target) * curr) // target
         # print(repeat_indices) [0 0 1]
-        split_factors = [
-            sum(repeat_indices == i)
-            for i in range(curr)
-        ]
+        split_factors = np.bincount(repeat_indices, minlength=curr)
         # print(split_factors) [2, 1]
         new_submobs = []
         for submob, sf in zip(self.submobjects, split_factors):
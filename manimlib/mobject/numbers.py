@@ -4,6 +4,46 @@ from manimlib.mobject.svg.tex_mobject import SingleStringTexMobject
 from manimlib.mobject.types.vectorized_mobject import VMobject
 
 
+# The most glyph templates _glyph_templates holds
+_MAX_GLYPH_TEMPLATES = 256
+# Maps a given (TeX string, TeX template, style) key to an unregistered
+# SingleStringTexMobject, so that each glyph of a DecimalNumber only goes
+# through tex_to_points once, from least to most recently used.
+_glyph_templates = {}
+
+
+def _get_glyph_template(tex_string, **kwargs):
+    template_tex_file_body = kwargs.get(
+        "template_tex_file_body",
+        SingleStringTexMobject.CONFIG["template_tex_file_body"],
+    )
+    style = tuple(sorted(
+        (key, repr(value))
+        for key, value in kwargs.items()
+        if key not in ["template_tex_file_body", "skip_registration"]
+    ))
+    key = (tex_string, template_tex_file_body, style)
+    if key in _glyph_templates:
+        # Moved to the end, as the most recently used
+        _glyph_templates[key] = _glyph_templates.pop(key)
+        return _glyph_templates[key]
+    _glyph_templates[key] = SingleStringTexMobject(
+        tex_string,
+        **{**kwargs, "skip_registration": True},
+    )
+    if len(_glyph_templates) > _MAX_GLYPH_TEMPLATES:
+        del _glyph_templates[next(iter(_glyph_templates))]
+    return _glyph_templates[key]
+
+
+def _get_glyph(tex_string, **kwargs):
+    """
+    Returns a copy of the glyph template for tex_string, which is much cheaper
+    than building a new SingleStringTexMobject.
+    """
+    return _get_glyph_template(tex_string, **kwargs).copy()
+
+
 class DecimalNumber(VMobject):
     CONFIG = {
         "num_decimal_places": 2,
@@ -28,29 +68,19 @@ class DecimalNumber(VMobject):
         self.number = number
         self.initial_config = kwargs
 
-        if isinstance(number, complex):
-            formatter = self.get_complex_formatter()
-        else:
-            formatter = self.get_formatter()
-        num_string = formatter.format(number)
-
-        rounded_num = np.round(number, self.num_decimal_places)
-        if num_string.startswith("-") and rounded_num == 0:
-            if self.include_sign:
-                num_string = "+" + num_string[1:]
-            else:
-                num_string = num_string[1:]
+        num_string = self.get_num_string(number)
+        self.num_string = num_string
 
         if 'skip_registration' not in kwargs or not kwargs['skip_registration']:
             kwargs['skip_registration'] = True
         self.add(*[
-            SingleStringTexMobject(char, **kwargs)
+            _get_glyph(char, **kwargs)
             for char in num_string
         ])
 
         # Add non-numerical bits
         if self.show_ellipsis:
-            self.add(SingleStringTexMobject("\\dots", skip_registration=True))
+            self.add(_get_glyph("\\dots", skip_registration=True))
 
         if num_string.startswith("-"):
             minus = self.submobjects[0]
@@ -60,7 +90,7 @@ class DecimalNumber(VMobject):
             )
 
         if self.unit is not None:
-            self.unit_sign = SingleStringTexMobject(
+            self.unit_sign = _get_glyph(
                 self.unit,
                 skip_registration=True,
                 color=self.color,
@@ -72,6 +102,27 @@ class DecimalNumber(VMobject):
             aligned_edge=DOWN
         )
 
+        self.align_special_characters(num_string)
+        #
+        if self.include_background_rectangle:
+            self.add_background_rectangle()
+
+    def get_num_string(self, number):
+        if isinstance(number, complex):
+            formatter = self.get_complex_formatter()
+        else:
+            formatter = self.get_formatter()
+        num_string = formatter.format(number)
+
+        rounded_num = np.round(number, self.num_decimal_places)
+        if num_string.startswith("-") and rounded_num == 0:
+            if self.include_sign:
+                num_string = "+" + num_string[1:]
+            else:
+                num_string = num_string[1:]
+        return num_string
+
+    def align_special_characters(self, num_string):
         # Handle alignment of parts that should be aligned
         # to the bottom
         for i, c in enumerate(num_string):
@@ -82,9 +133,6 @@ class DecimalNumber(VMobject):
                 self[i].shift(self[i].get_height() * DOWN / 2)
         if self.unit and self.unit.startswith("^"):
             self.unit_sign.align_to(self, UP)
-        #
-        if self.include_background_rectangle:
-            self.add_background_rectangle()
 
     def get_formatter(self, **kwargs):
         """
@@ -122,7 +170,81 @@ class DecimalNumber(VMobject):
             "i"
         ])
 
+    def get_glyph_templates(self, num_string):
+        """
+        Returns the glyph templates for the submobjects a DecimalNumber
+        showing num_string would have.
+        """
+        ret = [
+            _get_glyph_template(char, **self.initial_config)
+            for char in num_string
+        ]
+        if self.show_ellipsis:
+            ret.append(_get_glyph_template("\\dots", skip_registration=True))
+        if self.unit is not None:
+            ret.append(_get_glyph_template(
+                self.unit,
+                skip_registration=True,
+                color=self.color,
+            ))
+        return ret
+
+    def can_reuse_glyphs(self, num_string, glyph_templates):
+        old_num_string = getattr(self, "num_string", None)
+        if old_num_string is None or len(old_num_string) != len(num_string):
+            return False
+        if self.include_background_rectangle:
+            return False
+        if len(self.submobjects) != len(glyph_templates):
+            return False
+        for old_char, char in zip(old_num_string, num_string):
+            if old_char != char and not (old_char.isdigit() and char.isdigit()):
+                return False
+        for glyph, template in zip(self.submobjects, glyph_templates):
+            num_paths = len(glyph.family_members_with_points())
+            if num_paths != len(template.family_members_with_points()):
+                return False
+        return True
+
+    def reuse_glyphs(self, num_string, glyph_templates):
+        """
+        Shows num_string by copying the points of the glyph templates into
+        the existing submobjects, and lays them out as set_value would lay
+        out a new DecimalNumber.
+        """
+        edge_point = self.get_critical_point(self.edge_to_fix)
+        # Make sure last digit has constant height
+        scale_factor = self[-1].get_height() / glyph_templates[-1].get_height()
+        for glyph, template in zip(self.submobjects, glyph_templates):
+            for mob, template_mob in zip(
+                glyph.family_members_with_points(),
+                template.family_members_with_points(),
+            ):
+                mob.points = template_mob.points * scale_factor
+            glyph.tex_string = template.tex_string
+        # The submobjects are moved individually, since this DecimalNumber
+        # itself didn't move.
+        for glyph1, glyph2 in zip(self.submobjects, self.submobjects[1:]):
+            glyph2.next_to(
+                glyph1, RIGHT,
+                buff=scale_factor * self.digit_to_digit_buff,
+                aligned_edge=DOWN,
+            )
+        self.align_special_characters(num_string)
+        shift_vector = edge_point - self.get_critical_point(self.edge_to_fix)
+        for glyph in self.submobjects:
+            glyph.shift(shift_vector)
+
     def set_value(self, number, **config):
+        num_string = self.get_num_string(number)
+        if not config:
+            glyph_templates = self.get_glyph_templates(num_string)
+            if self.can_reuse_glyphs(num_string, glyph_templates):
+                self.reuse_glyphs(num_string, glyph_templates)
+                self.num_string = num_string
+                self.number = number
+                return self
+
         full_config = dict(self.CONFIG)
         full_config.update(self.initial_config)
         full_config.update(config)
@@ -138,6 +260,7 @@ class DecimalNumber(VMobject):
 
         old_family = self.get_family()
         self.submobjects = new_decimal.submobjects
+        self.num_string = new_decimal.num_string
         for mob in old_family:
             # Dumb hack...due to how scene handles families
             # of animated mobjects
@@ -122,7 +122,7 @@ class BraceLabel(VMobject):
             obj = VMobject(*obj)
         self.brace = Brace(obj, self.brace_direction, **kwargs)
         self.brace.put_at_tip(self.label)
-        self.submobjects[0] = self.brace
+        self.submobjects = [self.brace, *self.submobjects[1:]]
         return self
 
     def change_label(self, *text, **kwargs):
@@ -131,7 +131,7 @@ class BraceLabel(VMobject):
             self.label.scale(self.label_scale)
 
         self.brace.put_at_tip(self.label)
-        self.submobjects[1] = self.label
+        self.submobjects = [self.submobjects[0], self.label, *self.submobjects[2:]]
         return self
 
     def change_brace_label(self, obj, *text):
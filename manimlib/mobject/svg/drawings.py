@@ -607,7 +607,8 @@ class ThoughtBubble(Bubble):
                 **kwargs,
             })
         Bubble.__init__(self, **kwargs)
-        self.submobjects.sort(
+        self.submobjects = sorted(
+            self.submobjects,
             key=lambda m: m.get_bottom()[1]
         )
 
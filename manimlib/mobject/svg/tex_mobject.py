@@ -68,9 +68,9 @@ class SingleStringTexMobject(SVGMobject):
 
     def generate_points(self):
         full_string = f"{self.prefix}{self.tex_string}{self.suffix}"
-        path_data = tex_to_points(full_string)
+        path_data = tex_to_points(full_string, self.template_tex_file_body)
         for point_list in path_data:
-            if point_list:
+            if len(point_list) > 0:
                 vmob = VMobject(skip_registration=True)
                 vmob.append_points(point_list)
                 self.add(vmob)
@@ -283,7 +283,8 @@ class TexMobject(SingleStringTexMobject):
         return self.index_of_part(part)
 
     def sort_alphabetically(self):
-        self.submobjects.sort(
+        self.submobjects = sorted(
+            self.submobjects,
             key=lambda m: m.get_tex_string()
         )
 
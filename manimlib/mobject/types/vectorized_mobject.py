@@ -1,5 +1,6 @@
 from manimlib.web.utils import serialize_args, serialize_config
 import itertools as it
+import operator as op
 import sys
 
 from colour import Color
@@ -8,18 +9,61 @@ from manimlib.constants import *
 from manimlib.mobject.mobject import Mobject
 from manimlib.mobject.three_d_utils import get_3d_vmob_gradient_start_and_end_points
 from manimlib.utils.bezier import bezier
+from manimlib.utils.bezier import evaluate_each_bezier
 from manimlib.utils.bezier import get_smooth_handle_points
 from manimlib.utils.bezier import interpolate
 from manimlib.utils.bezier import integer_interpolate
-from manimlib.utils.bezier import partial_bezier_points
+from manimlib.utils.bezier import partial_beziers
 from manimlib.utils.color import color_to_rgba
 from manimlib.utils.iterables import make_even
 from manimlib.utils.iterables import stretch_array_to_length
 from manimlib.utils.iterables import tuplify
+from manimlib.utils.paths import straight_path
 from manimlib.utils.simple_functions import clip_in_place
 from manimlib.utils.space_ops import rotate_vector
-from manimlib.utils.space_ops import get_norm
 from manimlib.web.utils import register_mobject
+import manimlib.web.utils
+
+# The most bytes the plans in _alignment_plan_cache may take up, as
+# _get_alignment_plan_size counts them
+_MAX_ALIGNMENT_PLAN_CACHE_BYTES = 64 * 2**20
+# Maps the structure of pairs of VMobjects aligned by align_points to the
+# plans VMobject.get_alignment_plan made for them, from least to most
+# recently used.
+_alignment_plan_cache = {}
+# The total size of the plans in _alignment_plan_cache
+_alignment_plan_cache_bytes = 0
+
+
+def _get_alignment_plan_size(key, plan):
+    """
+    Returns roughly how many bytes the key and plan of an entry of
+    _alignment_plan_cache take up.
+    """
+    key_size = sum(
+        sys.getsizeof(bounds) + len(bounds) * sys.getsizeof((0, 0))
+        for bounds in key[1:]
+    )
+    return key_size + sum(array.nbytes for part in plan for array in part)
+
+
+def _cache_alignment_plan(key, plan):
+    """
+    Adds plan to _alignment_plan_cache, dropping the least recently used
+    plans to keep it within _MAX_ALIGNMENT_PLAN_CACHE_BYTES. Plans too large
+    to fit at all aren't cached.
+    """
+    global _alignment_plan_cache_bytes
+    size = _get_alignment_plan_size(key, plan)
+    if size > _MAX_ALIGNMENT_PLAN_CACHE_BYTES:
+        return
+    _alignment_plan_cache[key] = (plan, size)
+    _alignment_plan_cache_bytes += size
+    while _alignment_plan_cache_bytes > _MAX_ALIGNMENT_PLAN_CACHE_BYTES:
+        oldest_key = next(iter(_alignment_plan_cache))
+        _, old_size = _alignment_plan_cache.pop(oldest_key)
+        _alignment_plan_cache_bytes -= old_size
+
 
 # TODO
 # - Change cubic curve groups to have 4 points instead of 3
@@ -115,6 +159,7 @@ class VMobject(Mobject):
         passed_color = color if (color is not None) else BLACK
         passed_opacity = opacity if (opacity is not None) else 0
         rgbas = self.generate_rgbas_array(passed_color, passed_opacity)
+        manimlib.web.utils.mark_mobject_dirty(self)
         if not hasattr(self, array_name):
             setattr(self, array_name, rgbas)
             return self
@@ -159,6 +204,7 @@ class VMobject(Mobject):
         self.update_rgbas_array(array_name, color, opacity)
         if width is not None:
             setattr(self, width_name, width)
+            manimlib.web.utils.mark_mobject_dirty(self)
         return self
 
     def set_background_stroke(self, **kwargs):
@@ -417,11 +463,39 @@ class VMobject(Mobject):
     def clear_points(self):
         self.points = np.zeros((0, self.dim))
 
+    def get_points_buffer(self, num_points):
+        """
+        Returns an array with room for at least num_points points, whose
+        first rows hold the points of this VMobject. Points can be written
+        after those before making points a view of the first rows. The array
+        is kept with room to spare, so that building a path one curve at a
+        time doesn't copy every point for each curve.
+        """
+        buffer = None
+        if self._points_buffer is not None:
+            buffer, view = self._points_buffer
+            # Points which were assigned since may not be in the buffer.
+            if self.points is not view:
+                buffer = None
+        if buffer is None or len(buffer) < num_points:
+            old_points = self.points
+            capacity = max(num_points, 2 * len(old_points))
+            buffer = np.zeros((capacity, *old_points.shape[1:]))
+            buffer[:len(old_points)] = old_points
+        return buffer
+
     def append_points(self, new_points):
         # TODO, check that number new points is a multiple of 4?
         # or else that if len(self.points) % 4 == 1, then
         # len(new_points) % 4 == 3?
-        self.points = np.append(self.points, new_points, axis=0)
+        num_points = len(self.points)
+        end = num_points + len(new_points)
+        buffer = self.get_points_buffer(end)
+        buffer[num_points:end] = new_points
+        # Only rows past every view handed out are ever written, so
+        # earlier views of the buffer keep their points.
+        self.points = buffer[:end]
+        self._points_buffer = (buffer, self.points)
         return self
 
     def start_new_path(self, point):
@@ -497,8 +571,22 @@ class VMobject(Mobject):
         )
 
     def add_points_as_corners(self, points):
-        for point in points:
-            self.add_line_to(point)
+        if len(points) == 0:
+            return points
+        self.throw_error_if_no_points()
+        nppcc = self.n_points_per_cubic_curve
+        ends = np.array(points)
+        starts = np.append([self.get_last_point()], ends[:-1], axis=0)
+        # The curves are lines, with the same points as add_line_to gives.
+        curves = np.array([
+            interpolate(starts, ends, a)
+            for a in np.linspace(0, 1, nppcc)
+        ]).transpose(1, 0, 2)
+        curves[:, 0] = starts
+        new_points = curves.reshape((-1, curves.shape[2]))
+        if self.has_new_path_started():
+            new_points = new_points[1:]
+        self.append_points(new_points)
         return points
 
     def set_points_as_corners(self, points):
@@ -548,7 +636,7 @@ class VMobject(Mobject):
 
     def add_subpath(self, points):
         assert(len(points) % 4 == 0)
-        self.points = np.append(self.points, points, axis=0)
+        self.append_points(points)
         return self
 
     def append_vectorized_mobject(self, vectorized_mobject):
@@ -560,10 +648,10 @@ class VMobject(Mobject):
             self.points = self.points[:-1]
         self.append_points(new_points)
 
-    def apply_function(self, function):
+    def apply_function(self, function, vectorized=None, **kwargs):
         factor = self.pre_function_handle_to_anchor_scale_factor
         self.scale_handle_to_anchor_distances(factor)
-        Mobject.apply_function(self, function)
+        Mobject.apply_function(self, function, vectorized=vectorized, **kwargs)
         self.scale_handle_to_anchor_distances(1. / factor)
         if self.make_smooth_after_applying_functions:
             self.make_smooth()
@@ -600,33 +688,44 @@ class VMobject(Mobject):
     # Information about line
     def get_cubic_bezier_tuples_from_points(self, points):
         nppcc = VMobject.CONFIG["n_points_per_cubic_curve"]
+        points = np.array(points)
         remainder = len(points) % nppcc
         points = points[:len(points) - remainder]
-        return np.array([
-            points[i:i + nppcc]
-            for i in range(0, len(points), nppcc)
-        ])
+        return points.reshape((-1, nppcc, *points.shape[1:]))
 
     def get_cubic_bezier_tuples(self):
         return self.get_cubic_bezier_tuples_from_points(
             self.get_points()
         )
 
-    def get_subpaths_from_points(self, points):
+    def get_subpath_bounds_from_points(self, points):
+        """
+        Returns a (start, end) pair of indices into points for each subpath
+        get_subpaths_from_points returns.
+        """
         nppcc = self.n_points_per_cubic_curve
-        split_indices = filter(
-            lambda n: not self.consider_points_equals(
-                points[n - 1], points[n]
-            ),
-            range(nppcc, len(points), nppcc)
-        )
-        split_indices = [0] + list(split_indices) + [len(points)]
+        # A new subpath starts wherever a curve doesn't start where the
+        # last one ended, as consider_points_equals would tell.
+        curve_starts = np.arange(nppcc, len(points), nppcc)
+        last_points = points[curve_starts - 1]
+        first_points = points[curve_starts]
+        are_equal = (
+            np.abs(last_points - first_points) <=
+            self.tolerance_for_point_equality + 1e-5 * np.abs(first_points)
+        ).all(axis=1)
+        split_indices = [0, *curve_starts[~are_equal].tolist(), len(points)]
         return [
-            points[i1:i2]
+            (i1, i2)
             for i1, i2 in zip(split_indices, split_indices[1:])
             if (i2 - i1) >= nppcc
         ]
 
+    def get_subpaths_from_points(self, points):
+        return [
+            points[i1:i2]
+            for i1, i2 in self.get_subpath_bounds_from_points(points)
+        ]
+
     def get_subpaths(self):
         return self.get_subpaths_from_points(self.get_points())
 
@@ -648,6 +747,25 @@ class VMobject(Mobject):
         curve = self.get_nth_curve_function(n)
         return curve(residue)
 
+    def points_from_proportions(self, alphas):
+        """
+        Returns the result of point_from_proportion for each alpha in alphas,
+        evaluating all of them at once.
+        """
+        num_cubics = self.get_num_curves()
+        assert(num_cubics > 0)
+        # The same as integer_interpolate(0, num_cubics, alpha) for each alpha
+        alphas = np.array(alphas, dtype=float)
+        scaled_alphas = num_cubics * alphas
+        indices = scaled_alphas.astype(int)
+        residues = scaled_alphas % 1
+        indices[alphas >= 1] = num_cubics - 1
+        residues[alphas >= 1] = 1.0
+        indices[alphas <= 0] = 0
+        residues[alphas <= 0] = 0
+        curves = self.get_cubic_bezier_tuples()
+        return evaluate_each_bezier(curves[indices], residues)
+
     def get_anchors_and_handles(self):
         """
         returns anchors1, handles1, handles2, anchors2,
@@ -676,21 +794,37 @@ class VMobject(Mobject):
             self.get_end_anchors(),
         ))))
 
+    def get_anchor_mask(self):
+        """
+        Returns a boolean array marking the points which get_anchors returns.
+        """
+        mask = np.zeros(len(self.points), dtype=bool)
+        if len(self.points) == 1:
+            mask[0] = True
+            return mask
+        nppcc = self.n_points_per_cubic_curve
+        end = (len(self.points) // nppcc) * nppcc
+        mask[0:end:nppcc] = True
+        mask[nppcc - 1:end:nppcc] = True
+        return mask
+
     def get_points_defining_boundary(self):
         return np.array(list(it.chain(*[
             sm.get_anchors()
             for sm in self.get_family()
         ])))
 
+    def get_boundary_box(self):
+        return self.get_bounding_box(anchors_only=True)
+
     def get_arc_length(self, n_sample_points=None):
         if n_sample_points is None:
             n_sample_points = 4 * self.get_num_curves() + 1
-        points = np.array([
-            self.point_from_proportion(a)
-            for a in np.linspace(0, 1, n_sample_points)
-        ])
+        points = self.points_from_proportions(
+            np.linspace(0, 1, n_sample_points)
+        )
         diffs = points[1:] - points[:-1]
-        norms = np.apply_along_axis(get_norm, 1, diffs)
+        norms = np.linalg.norm(diffs, axis=1)
         return np.sum(norms)
 
     # Alignment
@@ -709,34 +843,81 @@ class VMobject(Mobject):
             if mob.has_new_path_started():
                 mob.add_line_to(mob.get_last_point())
 
-        # Figure out what the subpaths are, and align
-        subpaths1 = self.get_subpaths()
-        subpaths2 = vmobject.get_subpaths()
-        n_subpaths = max(len(subpaths1), len(subpaths2))
-        # Start building new ones
-        new_path1 = np.zeros((0, self.dim))
-        new_path2 = np.zeros((0, self.dim))
+        # Figure out what the subpaths are, and align them
+        # as planned for VMobjects with such subpaths
+        plan = self.get_alignment_plan(
+            self.get_subpath_bounds_from_points(self.points),
+            vmobject.get_subpath_bounds_from_points(vmobject.points),
+        )
+        for mob, (point_indices, split_rows, split_matrices) in zip([self, vmobject], plan):
+            curves = mob.points[point_indices]
+            if len(split_rows) > 0:
+                curves[split_rows] = np.matmul(split_matrices, curves[split_rows])
+            mob.set_points(curves.reshape((-1, self.dim)))
+        return self
 
+    def get_alignment_plan(self, subpath_bounds1, subpath_bounds2):
+        """
+        Returns a plan for aligning the points of VMobjects with the given
+        subpaths, as given by get_subpath_bounds_from_points. For each of
+        them, it holds the indices of the points of each curve its aligned
+        points are cut from, which of those curves are split, and the
+        proportions at which those are cut. Plans are kept in
+        _alignment_plan_cache, so that VMobjects shaped alike are aligned
+        without working them out again.
+        """
         nppcc = self.n_points_per_cubic_curve
-
-        def get_nth_subpath(path_list, n):
-            if n >= len(path_list):
+        key = (nppcc, tuple(subpath_bounds1), tuple(subpath_bounds2))
+        if key in _alignment_plan_cache:
+            # Moved to the end, as the most recently used
+            _alignment_plan_cache[key] = _alignment_plan_cache.pop(key)
+            return _alignment_plan_cache[key][0]
+
+        n_subpaths = max(len(subpath_bounds1), len(subpath_bounds2))
+        # Indices of the points of the new subpaths
+        new_subpaths1 = []
+        new_subpaths2 = []
+        diffs1 = []
+        diffs2 = []
+
+        def get_nth_subpath(bounds, n):
+            if n >= len(bounds):
                 # Create a null path at the very end
-                return [path_list[-1][-1]] * nppcc
-            return path_list[n]
+                return np.full(nppcc, bounds[-1][1] - 1)
+            return np.arange(*bounds[n])
 
         for n in range(n_subpaths):
-            sp1 = get_nth_subpath(subpaths1, n)
-            sp2 = get_nth_subpath(subpaths2, n)
-            diff1 = max(0, (len(sp2) - len(sp1)) // nppcc)
-            diff2 = max(0, (len(sp1) - len(sp2)) // nppcc)
-            sp1 = self.insert_n_curves_to_point_list(diff1, sp1)
-            sp2 = self.insert_n_curves_to_point_list(diff2, sp2)
-            new_path1 = np.append(new_path1, sp1, axis=0)
-            new_path2 = np.append(new_path2, sp2, axis=0)
-        self.set_points(new_path1)
-        vmobject.set_points(new_path2)
-        return self
+            sp1 = get_nth_subpath(subpath_bounds1, n)
+            sp2 = get_nth_subpath(subpath_bounds2, n)
+            new_subpaths1.append(sp1)
+            new_subpaths2.append(sp2)
+            diffs1.append(max(0, (len(sp2) - len(sp1)) // nppcc))
+            diffs2.append(max(0, (len(sp1) - len(sp2)) // nppcc))
+
+        plan = []
+        # The curves of all subpaths are subdivided together
+        for diffs, new_subpaths in (diffs1, new_subpaths1), (diffs2, new_subpaths2):
+            index_quads_list = list(map(
+                self.get_cubic_bezier_tuples_from_points, new_subpaths
+            ))
+            curve_indices, a1s, a2s = self.get_curve_subdivisions(
+                list(map(len, index_quads_list)), diffs
+            )
+            # Curves which aren't split are kept as they are, and the
+            # points of the pieces of those which are are linear
+            # combinations of the points of the curves, computed by
+            # taking the pieces of curves with basis vectors as points.
+            split_rows = np.flatnonzero((a1s != 0) | (a2s != 1))
+            basis_curves = np.broadcast_to(
+                np.identity(nppcc), (len(split_rows), nppcc, nppcc)
+            )
+            plan.append((
+                np.concatenate(index_quads_list)[curve_indices],
+                split_rows,
+                partial_beziers(basis_curves, a1s[split_rows], a2s[split_rows]),
+            ))
+        _cache_alignment_plan(key, plan)
+        return plan
 
     def insert_n_curves(self, n):
         new_path_point = None
@@ -756,37 +937,65 @@ class VMobject(Mobject):
         if len(points) == 1:
             nppcc = self.n_points_per_cubic_curve
             return np.repeat(points, nppcc * n, 0)
-        bezier_quads = self.get_cubic_bezier_tuples_from_points(points)
-        curr_num = len(bezier_quads)
-        target_num = curr_num + n
+        return self.insert_curves_to_point_lists([n], [points])
+
+    def insert_curves_to_point_lists(self, ns, point_lists):
+        """
+        Does what insert_n_curves_to_point_list does for each n and points
+        of ns and point_lists, subdividing the curves of all of them at
+        once, and returns the results joined together.
+        """
+        bezier_quads_list = list(map(
+            self.get_cubic_bezier_tuples_from_points, point_lists
+        ))
+        curve_indices, a1s, a2s = self.get_curve_subdivisions(
+            list(map(len, bezier_quads_list)), ns
+        )
+        bezier_quads = np.concatenate(bezier_quads_list)
+        new_quads = partial_beziers(bezier_quads[curve_indices], a1s, a2s)
+        return new_quads.reshape((-1, self.dim))
+
+    def get_curve_subdivisions(self, curr_nums, ns):
+        """
+        For point lists made of curr_nums curves, into which ns curves are
+        to be inserted, returns the index of the curve each new curve is cut
+        from, counting the curves of all point lists in order, along with
+        the proportions of it to cut.
+        """
+        curr_nums = np.array(curr_nums, dtype=int)
+        target_nums = curr_nums + np.array(ns, dtype=int)
         # This is an array with values ranging from 0
         # up to curr_num,  with repeats such that
         # it's total length is target_num.  For example,
         # with curr_num = 10, target_num = 15, this would
         # be [0, 0, 1, 2, 2, 3, 4, 4, 5, 6, 6, 7, 8, 8, 9]
-        repeat_indices = (np.arange(target_num) * curr_num) // target_num
+        # Those of each point list are offset by the curves
+        # of the point lists before it, and joined.
+        owners = np.repeat(np.arange(len(curr_nums)), target_nums)
+        target_offsets = np.cumsum(target_nums) - target_nums
+        curr_offsets = np.cumsum(curr_nums) - curr_nums
+        local_indices = np.arange(len(owners)) - target_offsets[owners]
+        repeat_indices = curr_offsets[owners] + (
+            local_indices * curr_nums[owners]
+        ) // target_nums[owners]
 
         # If the nth term of this list is k, it means
         # that the nth curve of our path should be split
         # into k pieces.  In the above example, this would
         # be [2, 1, 2, 1, 2, 1, 2, 1, 2, 1]
-        split_factors = [
-            sum(repeat_indices == i)
-            for i in range(curr_num)
-        ]
-        new_points = np.zeros((0, self.dim))
-        for quad, sf in zip(bezier_quads, split_factors):
-            # What was once a single cubic curve defined
-            # by "quad" will now be broken into sf
-            # smaller cubic curves
-            alphas = np.linspace(0, 1, sf + 1)
-            for a1, a2 in zip(alphas, alphas[1:]):
-                new_points = np.append(
-                    new_points,
-                    partial_bezier_points(quad, a1, a2),
-                    axis=0
-                )
-        return new_points
+        split_factors = np.bincount(repeat_indices, minlength=curr_nums.sum())
+        # What was once a single cubic curve defined by
+        # bezier_quads[i] will now be broken into split_factors[i]
+        # smaller cubic curves, all of which are made at once.
+        factors = split_factors[repeat_indices]
+        piece_indices = np.arange(len(repeat_indices)) - np.repeat(
+            np.cumsum(split_factors) - split_factors, split_factors
+        )
+        # Matching np.linspace(0, 1, sf + 1)
+        steps = 1.0 / factors
+        a1s = piece_indices * steps
+        a2s = np.where(piece_indices + 1 == factors, 1.0, (piece_indices + 1) * steps)
+        return repeat_indices, a1s, a2s
 
     def align_rgbas(self, vmobject):
         attrs = ["fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"]
@@ -799,6 +1008,8 @@ class VMobject(Mobject):
             elif len(a2) > len(a1):
                 new_a1 = stretch_array_to_length(a1, len(a2))
                 setattr(self, attr, new_a1)
+        manimlib.web.utils.mark_mobject_dirty(self)
+        manimlib.web.utils.mark_mobject_dirty(vmobject)
         return self
 
     def get_point_mobject(self, center=None):
@@ -826,6 +1037,7 @@ class VMobject(Mobject):
             ))
             if alpha == 1.0:
                 setattr(self, attr, getattr(mobject2, attr))
+        manimlib.web.utils.mark_mobject_dirty(self)
 
     def pointwise_become_partial(self, vmobject, a, b):
         assert(isinstance(vmobject, VMobject))
@@ -846,19 +1058,21 @@ class VMobject(Mobject):
         if num_cubics == 0:
             return self
         if lower_index == upper_index:
-            self.append_points(partial_bezier_points(
-                bezier_quads[lower_index],
+            new_quads = partial_beziers(
+                bezier_quads[[lower_index]],
                 lower_residue, upper_residue
-            ))
+            )
         else:
-            self.append_points(partial_bezier_points(
-                bezier_quads[lower_index], lower_residue, 1
-            ))
-            for quad in bezier_quads[lower_index + 1:upper_index]:
-                self.append_points(quad)
-            self.append_points(partial_bezier_points(
-                bezier_quads[upper_index], 0, upper_residue
-            ))
+            ends = partial_beziers(
+                bezier_quads[[lower_index, upper_index]],
+                [lower_residue, 0], [1, upper_residue],
+            )
+            new_quads = np.concatenate([
+                ends[:1],
+                bezier_quads[lower_index + 1:upper_index],
+                ends[1:],
+            ])
+        self.set_points(new_quads.reshape((-1, self.dim)))
         return self
 
     def get_subcurve(self, a, b):
@@ -867,6 +1081,102 @@ class VMobject(Mobject):
         return vmob
 
 
+def interpolate_vmobjects(vmobjects, starts, ends, alphas,
+                          path_func=straight_path, cache=None):
+    """
+    Does what vmobjects[i].interpolate(starts[i], ends[i], alphas[i],
+    path_func) does for each i, interpolating each attribute of all of
+    them in one array operation. Returns False without doing anything if
+    that isn't possible, because some of vmobjects interpolate differently,
+    or the points or colors of starts and ends don't line up.
+
+    If cache is a dict, the attributes of starts and ends joined into
+    arrays are kept in it and reused by later calls passing it, for as long
+    as they hold the same values. Since that can't tell whether an array
+    was edited in place, the cache is only used while none of starts and
+    ends have updaters.
+    """
+    if len(vmobjects) == 0:
+        return True
+    for cls in set(map(type, vmobjects)):
+        if not issubclass(cls, VMobject) or \
+                cls.interpolate is not Mobject.interpolate or \
+                cls.interpolate_color is not VMobject.interpolate_color:
+            return False
+    if not all(isinstance(mob, VMobject) for mob in it.chain(starts, ends)):
+        return False
+    if cache is None or any(mob.updaters for mob in it.chain(starts, ends)):
+        cache = {}
+    alphas = np.array(alphas, dtype=float)
+
+    def get_joined_values(mobs, name, attr, join_func):
+        values = list(map(op.attrgetter(attr), mobs))
+        key = (name, attr)
+        if key in cache:
+            cached_values, joined_values = cache[key]
+            if len(cached_values) == len(values) and \
+                    all(map(op.is_, cached_values, values)):
+                return values, joined_values
+        joined_values = join_func(values)
+        cache[key] = (values, joined_values)
+        return values, joined_values
+
+    new_values = {}
+    # Attributes holding an array with a row per point or color
+    for attr in ["points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"]:
+        start_arrays, start_array = get_joined_values(
+            starts, "starts", attr, np.concatenate
+        )
+        end_arrays, end_array = get_joined_values(
+            ends, "ends", attr, np.concatenate
+        )
+        lengths = list(map(len, start_arrays))
+        if lengths != list(map(len, end_arrays)) or \
+                start_array.shape != end_array.shape:
+            return False
+        row_alphas = np.repeat(alphas, lengths)[:, np.newaxis]
+        if attr != "points":
+            new_array = interpolate(start_array, end_array, row_alphas)
+        elif np.all(alphas == alphas[0]):
+            new_array = path_func(start_array, end_array, alphas[0])
+        elif path_func is straight_path:
+            new_array = straight_path(start_array, end_array, row_alphas)
+        else:
+            # Other paths may only take one alpha at a time.
+            new_array = np.zeros(start_array.shape)
+            row_alphas = row_alphas[:, 0]
+            for alpha in np.unique(alphas):
+                rows = (row_alphas == alpha)
+                new_array[rows] = path_func(start_array[rows], end_array[rows], alpha)
+        ends_of_rows = np.cumsum(lengths).tolist()
+        new_values[attr] = map(
+            new_array.__getitem__,
+            map(slice, [0] + ends_of_rows[:-1], ends_of_rows),
+        )
+
+    # Attributes holding a number or vector per VMobject
+    def join_func(values):
+        return np.array(values, dtype=float)
+    for attr in ["stroke_width", "background_stroke_width", "sheen_direction", "sheen_factor"]:
+        start_array = get_joined_values(starts, "starts", attr, join_func)[1]
+        end_array = get_joined_values(ends, "ends", attr, join_func)[1]
+        if start_array.shape != end_array.shape:
+            return False
+        shaped_alphas = alphas.reshape((-1, *[1] * (start_array.ndim - 1)))
+        new_values[attr] = interpolate(start_array, end_array, shaped_alphas)
+
+    for attr, values in new_values.items():
+        list(map(setattr, vmobjects, it.repeat(attr), values))
+    # Like interpolate_color, take the colors of ends as they are once
+    # they're reached.
+    for index in np.flatnonzero(alphas == 1.0):
+        for attr in new_values:
+            if attr != "points":
+                setattr(vmobjects[index], attr, getattr(ends[index], attr))
+    list(map(manimlib.web.utils.mark_mobject_dirty, vmobjects))
+    return True
+
+
 class VGroup(VMobject):
     def __init__(self, *vmobjects, **kwargs):
         #### EULERTOUR_INIT_START ####
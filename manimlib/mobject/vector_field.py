@@ -17,6 +17,7 @@ from manimlib.utils.color import color_to_rgb
 from manimlib.utils.color import rgb_to_color
 from manimlib.utils.config_ops import digest_config
 from manimlib.utils.rate_functions import linear
+from manimlib.utils.simple_functions import is_vectorized_function
 from manimlib.utils.simple_functions import sigmoid
 from manimlib.utils.space_ops import get_norm
 # from manimlib.utils.space_ops import normalize
@@ -120,7 +121,8 @@ def move_submobjects_along_vector_field(mobject, func):
 def move_points_along_vector_field(mobject, func):
     def apply_nudge(self, dt):
         self.mobject.apply_function(
-            lambda p: p + func(p) * dt
+            lambda p: p + func(p) * dt,
+            vectorized=is_vectorized_function(func),
         )
     mobject.add_updater(apply_nudge)
     return mobject
@@ -143,6 +145,7 @@ class VectorField(VGroup):
         "length_func": lambda norm: 0.45 * sigmoid(norm),
         "opacity": 1.0,
         "vector_config": {},
+        "use_packed_points": True,
     }
 
     def __init__(self, func, **kwargs):
@@ -225,6 +228,7 @@ class StreamLines(VGroup):
         "max_magnitude": 1.5,
         "colors": DEFAULT_SCALAR_FIELD_COLORS,
         "cutoff_norm": 15,
+        "use_packed_points": True,
     }
 
     def __init__(self, func, **kwargs):
@@ -0,0 +1,169 @@
+"""
+Opt-in instrumentation of where the time of a render goes.
+
+A Profiler passed to a Scene as its "profiler" keeps a record for each call
+to play or wait, holding the time spent in each phase of the call, the number
+of Mobjects and points in the Scene once it returns and, if memory is traced,
+the peak memory traced by tracemalloc during it. Every record and phase is
+also kept as a Chrome trace event, so that a render can be inspected in
+chrome://tracing or Perfetto.
+"""
+import collections
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+# The phases which are timed, along with the labels they get in summaries.
+# Those from "interpolate" to "update_frame" happen within the others, and
+# their times are also part of the times of the phases they happen in.
+PHASE_LABELS = collections.OrderedDict([
+    ("compile_play_args_to_animation_list", "compile"),
+    ("serialize_animations", "serialize"),
+    ("begin_animations", "begin"),
+    ("progress_through_animations", "progress"),
+    ("interpolate", "interp"),
+    ("update_mobjects", "updaters"),
+    ("update_frame", "frame"),
+    ("finish_animations", "finish"),
+    ("compute_diff", "diff"),
+])
+
+
+class Profiler(object):
+    def __init__(self, trace_memory=True):
+        # Whether to trace the peak memory allocated during each record.
+        # Tracing slows rendering down, which also shows in the times.
+        self.trace_memory = trace_memory
+        self.records = []
+        self.trace_events = []
+        # The record of the call to play or wait in progress, or None.
+        self.current_record = None
+        self.start_time = time.perf_counter()
+
+    def get_timestamp(self, perf_counter_time):
+        # Trace events are timestamped in microseconds.
+        return (perf_counter_time - self.start_time) * 1e6
+
+    def add_trace_event(self, name, category, start_time, end_time, args=None):
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": self.get_timestamp(start_time),
+            "dur": (end_time - start_time) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        self.trace_events.append(event)
+
+    @contextlib.contextmanager
+    def record(self, kind, scene):
+        """
+        Records a call to play or wait, named by kind, on scene.
+        """
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        record = {
+            "index": len(self.records),
+            "kind": kind,
+            "seconds": 0,
+            "phases": collections.defaultdict(float),
+            "num_mobjects": 0,
+            "num_points": 0,
+            "peak_memory": None,
+        }
+        self.current_record = record
+        start_time = time.perf_counter()
+        try:
+            yield record
+        finally:
+            end_time = time.perf_counter()
+            self.current_record = None
+            record["seconds"] = end_time - start_time
+            record["phases"] = dict(record["phases"])
+            family = scene.get_mobject_family_members()
+            record["num_mobjects"] = len(family)
+            record["num_points"] = sum(len(mob.points) for mob in family)
+            if self.trace_memory:
+                record["peak_memory"] = tracemalloc.get_traced_memory()[1]
+            self.records.append(record)
+            self.add_trace_event(kind, "record", start_time, end_time, args={
+                "index": record["index"],
+                "num_mobjects": record["num_mobjects"],
+                "num_points": record["num_points"],
+                "peak_memory": record["peak_memory"],
+            })
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            end_time = time.perf_counter()
+            if self.current_record is not None:
+                self.current_record["phases"][name] += end_time - start_time
+            self.add_trace_event(name, "phase", start_time, end_time)
+
+    def stop(self):
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def get_chrome_trace(self):
+        return {
+            "traceEvents": self.trace_events,
+            "displayTimeUnit": "ms",
+        }
+
+    def write_chrome_trace(self, path):
+        with open(path, "w") as f:
+            json.dump(self.get_chrome_trace(), f)
+
+    def get_phase_totals(self):
+        totals = collections.defaultdict(float)
+        for record in self.records:
+            for name, seconds in record["phases"].items():
+                totals[name] += seconds
+        return totals
+
+    def print_summary(self, file=None):
+        """
+        Prints a table of the records, with times in milliseconds and peak
+        memory in KiB, followed by the total time of each phase.
+        """
+        if file is None:
+            file = sys.stdout
+        columns = ["#", "kind", "total"]
+        columns += list(PHASE_LABELS.values())
+        columns += ["mobs", "points", "peak KiB"]
+        print(" ".join(f"{column:>9}" for column in columns), file=file)
+        for record in self.records:
+            row = [str(record["index"]), record["kind"]]
+            row.append(f"{record['seconds'] * 1000:.2f}")
+            row += [
+                f"{record['phases'].get(name, 0) * 1000:.2f}"
+                for name in PHASE_LABELS
+            ]
+            row += [str(record["num_mobjects"]), str(record["num_points"])]
+            if record["peak_memory"] is None:
+                row.append("-")
+            else:
+                row.append(f"{record['peak_memory'] / 1024:.0f}")
+            print(" ".join(f"{value:>9}" for value in row), file=file)
+        total_seconds = sum(record["seconds"] for record in self.records)
+        print(
+            f"{len(self.records)} records in {total_seconds * 1000:.2f}ms",
+            file=file,
+        )
+        totals = self.get_phase_totals()
+        for name, label in PHASE_LABELS.items():
+            if name in totals:
+                print(f"{label:>10}: {totals[name] * 1000:10.2f}ms  {name}", file=file)
@@ -0,0 +1,234 @@
+"""
+On-disk cache of the results of rendering scenes with get_scene.
+
+Entries are keyed by a hash of the code, the requested scene names, the
+scene config, the library version and the TeX points it renders with, and
+hold the serializations a web Scene leaves behind after rendering. The cache
+is capped in size, and the least recently used entries are evicted first.
+
+Entries are pickled, and unpickling runs whatever code the file says to, so
+the cache directory must be owned by the current user and writable only by
+them. Entries which aren't are ignored.
+"""
+import hashlib
+import os
+import pickle
+import pprint
+import stat
+import threading
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+ENTRY_EXTENSION = ".pickle"
+# Attributes of a rendered web Scene which are stored in the cache.
+CACHED_SCENE_ATTRIBUTES = [
+    "initial_mobject_serializations",
+    "scene_diffs",
+    "animation_diffs",
+    "animation_info_list",
+]
+
+library_version = None
+
+
+def get_library_version():
+    """
+    Returns a hash of the library's sources, so that entries rendered by a
+    different version of the library aren't used.
+    """
+    global library_version
+    if library_version is None:
+        library_directory = os.path.dirname(os.path.abspath(__file__))
+        hasher = hashlib.sha256()
+        for directory, subdirectories, file_names in os.walk(library_directory):
+            subdirectories.sort()
+            for file_name in sorted(file_names):
+                if not file_name.endswith((".py", ".json", ".tex")):
+                    continue
+                path = os.path.join(directory, file_name)
+                hasher.update(os.path.relpath(path, library_directory).encode())
+                with open(path, "rb") as f:
+                    hasher.update(f.read())
+        library_version = hasher.hexdigest()
+    return library_version
+
+
+def get_tex_point_store_version():
+    """
+    Returns a hash of the index of the TeX point store and the size of its
+    points file. Adding or replacing points changes both, so entries
+    rendered before the store changed aren't used. This is computed for
+    every key, since the store may be filled while the process runs.
+    """
+    from manimlib.web.tex_point_store import get_default_store
+    store = get_default_store()
+    hasher = hashlib.sha256()
+    try:
+        with open(store.get_index_path(), "rb") as f:
+            hasher.update(f.read())
+        hasher.update(b"\0")
+        hasher.update(str(os.path.getsize(store.get_points_path())).encode())
+    except OSError:
+        # The store is empty.
+        pass
+    return hasher.hexdigest()
+
+
+def is_private(file_stat):
+    """
+    Returns whether the file with the given stat is owned by the current
+    user and can't be written by anyone else.
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    return file_stat.st_uid == os.getuid() and \
+        not file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def get_render_cache_key(code, scene_names, scene_config):
+    hasher = hashlib.sha256()
+    for part in [
+        code,
+        "\0".join(scene_names),
+        pprint.pformat(scene_config),
+        get_library_version(),
+        get_tex_point_store_version(),
+    ]:
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+class CachedScene(object):
+    """
+    Stands in for a web Scene whose results were found in the cache. It has
+    the same result attributes, and render() does nothing.
+    """
+    def __init__(self, results):
+        for attr in CACHED_SCENE_ATTRIBUTES:
+            setattr(self, attr, results[attr])
+
+    def render(self):
+        pass
+
+
+class RenderCache(object):
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        # Renders whose results couldn't be pickled, e.g. because they
+        # contain lambdas.
+        self.uncacheable = 0
+        self.lock = threading.Lock()
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if not is_private(os.stat(directory)):
+            raise PermissionError(
+                f"Render cache directory {directory} must be owned by the "
+                "current user and not writable by anyone else"
+            )
+
+    def get_entry_path(self, key):
+        return os.path.join(self.directory, key + ENTRY_EXTENSION)
+
+    def load(self, key):
+        """
+        Returns a CachedScene for key, or None if it isn't cached. Entries
+        which can't be unpickled are removed.
+        """
+        path = self.get_entry_path(key)
+        cached_scene = None
+        is_bad = False
+        try:
+            with open(path, "rb") as f:
+                # Entries others could have written aren't unpickled.
+                if is_private(os.fstat(f.fileno())):
+                    try:
+                        cached_scene = CachedScene(pickle.load(f))
+                    except Exception:
+                        # Unpickling a truncated or otherwise bad entry can
+                        # raise nearly anything.
+                        is_bad = True
+        except OSError:
+            pass
+        if is_bad:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        if cached_scene is None:
+            with self.lock:
+                self.misses += 1
+            return None
+        # The modification time of an entry is when it was last used.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self.lock:
+            self.hits += 1
+        return cached_scene
+
+    def store(self, key, scene):
+        results = {
+            attr: getattr(scene, attr)
+            for attr in CACHED_SCENE_ATTRIBUTES
+        }
+        try:
+            data = pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            with self.lock:
+                self.uncacheable += 1
+            return False
+        path = self.get_entry_path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        with os.fdopen(os.open(temp_path, flags, 0o600), "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        with self.lock:
+            self.stores += 1
+        self.evict()
+        return True
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache fits in
+        max_bytes.
+        """
+        entries = []
+        for file_name in os.listdir(self.directory):
+            if not file_name.endswith(ENTRY_EXTENSION):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, file_name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, file_name))
+        total_bytes = sum(size for _, size, _ in entries)
+        for mtime, size, file_name in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, file_name))
+            except OSError:
+                continue
+            total_bytes -= size
+            with self.lock:
+                self.evictions += 1
+
+    def get_hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get_stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.get_hit_rate(),
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "uncacheable": self.uncacheable,
+        }
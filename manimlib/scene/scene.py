@@ -1,3 +1,4 @@
+import contextlib as _contextlib
 import inspect
 import random
 import warnings
@@ -26,6 +27,13 @@ class PyScene(Container):
         "start_at_animation_number": None,
         "end_at_animation_number": None,
         "leave_progress_bars": False,
+        # If True, animations are only evaluated at their start and end,
+        # unless that could change the result: when one of them is path
+        # dependent, or a Mobject involved has an updater.
+        "keyframes_only": False,
+        # A manimlib.profiling.Profiler recording the time spent in each
+        # phase of play and wait, or None.
+        "profiler": None,
     }
 
     def __init__(self, **kwargs):
@@ -33,6 +41,7 @@ class PyScene(Container):
         self.camera = self.camera_class(**self.camera_config)
 
         self.mobjects = []
+        manimlib.web.utils.invalidate_scene_index()
         # TODO, remove need for foreground mobjects
         self.foreground_mobjects = []
         self.num_plays = 0
@@ -50,6 +59,16 @@ class PyScene(Container):
         self.tear_down()
         self.print_end_message()
 
+    def profile_record(self, kind):
+        if self.profiler is None:
+            return _contextlib.nullcontext()
+        return self.profiler.record(kind, self)
+
+    def profile_phase(self, name):
+        if self.profiler is None:
+            return _contextlib.nullcontext()
+        return self.profiler.phase(name)
+
     def setup(self):
         """
         This is meant to be implement by any scenes which
@@ -148,6 +167,28 @@ class PyScene(Container):
             for mob in self.get_mobject_family_members()
         ])
 
+    def can_skip_frames(self, animations):
+        """
+        Returns whether animations, once begun, can be evaluated only at
+        their end, with keyframes_only set. Path dependent animations, and
+        updaters, which run on every frame and may accumulate changes,
+        need each frame to end in the same state.
+        """
+        if not self.keyframes_only or self.should_update_mobjects():
+            return False
+        if any(animation.is_path_dependent() for animation in animations):
+            return False
+        mobjects = self.get_mobject_family_members() + [
+            submob
+            for animation in animations
+            for mob in animation.get_all_mobjects_to_update()
+            for submob in mob.get_family()
+        ]
+        return not any(
+            mob.get_updaters() and not mob.updating_suspended
+            for mob in mobjects
+        )
+
     ###
 
     def get_time(self):
@@ -183,6 +224,7 @@ class PyScene(Container):
         mobjects = [*mobjects, *self.foreground_mobjects]
         self.restructure_mobjects(to_remove=mobjects)
         self.mobjects += mobjects
+        manimlib.web.utils.register_scene_addition(mobjects)
         return self
 
     def add_mobjects_among(self, values):
@@ -206,6 +248,7 @@ class PyScene(Container):
                 parent.submobjects = [child for child in parent.submobjects if child not in mobjects_to_remove]
                 dfs.extend(parent.submobjects)
         self.mobjects = new_mobjects
+        manimlib.web.utils.invalidate_scene_index()
 
     def restructure_mobjects(self, to_remove,
                              mobject_list_name="mobjects",
@@ -221,6 +264,8 @@ class PyScene(Container):
         _list = getattr(self, mobject_list_name)
         new_list = self.get_restructured_mobject_list(_list, to_remove)
         setattr(self, mobject_list_name, new_list)
+        if mobject_list_name == "mobjects" and len(new_list) < len(_list):
+            manimlib.web.utils.invalidate_scene_index()
         return self
 
     def get_restructured_mobject_list(self, mobjects, to_remove):
@@ -269,6 +314,7 @@ class PyScene(Container):
     def clear(self):
         self.mobjects = []
         self.foreground_mobjects = []
+        manimlib.web.utils.invalidate_scene_index()
         return self
 
     def get_mobjects(self):
@@ -407,6 +453,11 @@ class PyScene(Container):
                 curr_mobjects += mob.get_family()
 
     def progress_through_animations(self, animations):
+        if self.can_skip_frames(animations):
+            # Nothing depends on the frames in between, and the first and
+            # last ones are handled by begin_animations and
+            # finish_animations.
+            return
         # Paint all non-moving objects onto the screen, so they don't
         # have to be rendered every frame
         moving_mobjects = self.get_moving_mobjects(*animations)
@@ -416,12 +467,15 @@ class PyScene(Container):
         for t in self.get_animation_time_progression(animations):
             dt = t - last_t
             last_t = t
-            for animation in animations:
-                animation.update_mobjects(dt)
-                alpha = t / animation.run_time
-                animation.interpolate(alpha)
-            self.update_mobjects(dt)
-            self.update_frame(moving_mobjects, static_image)
+            with self.profile_phase("interpolate"):
+                for animation in animations:
+                    animation.update_mobjects(dt)
+                    alpha = t / animation.run_time
+                    animation.interpolate(alpha)
+            with self.profile_phase("update_mobjects"):
+                self.update_mobjects(dt)
+            with self.profile_phase("update_frame"):
+                self.update_frame(moving_mobjects, static_image)
 
     def finish_animations(self, animations):
         for animation in animations:
@@ -444,17 +498,22 @@ class PyScene(Container):
         if len(args) == 0:
             warnings.warn("Called Scene.play with no animations")
             return
-        animations = self.compile_play_args_to_animation_list(
-            *args, **kwargs
-        )
+        with self.profile_phase("compile_play_args_to_animation_list"):
+            animations = self.compile_play_args_to_animation_list(
+                *args, **kwargs
+            )
 
-        animation_info_list.append(manimlib.web.utils.serialize_animations(animations))
-        for animation in animations:
-            manimlib.web.utils.initial_mobject_serializations[id(animation.mobject)]['required'] = True
+        with self.profile_phase("serialize_animations"):
+            animation_info_list.append(manimlib.web.utils.serialize_animations(animations))
+        manimlib.web.utils.mark_ids_required(
+            [id(animation.mobject) for animation in animations])
 
-        self.begin_animations(animations)
-        self.progress_through_animations(animations)
-        self.finish_animations(animations)
+        with self.profile_phase("begin_animations"):
+            self.begin_animations(animations)
+        with self.profile_phase("progress_through_animations"):
+            self.progress_through_animations(animations)
+        with self.profile_phase("finish_animations"):
+            self.finish_animations(animations)
 
     def idle_stream(self):
         pass
@@ -487,7 +546,8 @@ class PyScene(Container):
         return time_progression
 
     def wait(self, duration=DEFAULT_WAIT_TIME, stop_condition=None):
-        self.update_mobjects(dt=0)  # Any problems with this?
+        with self.profile_phase("update_mobjects"):
+            self.update_mobjects(dt=0)  # Any problems with this?
         if self.should_update_mobjects():
             time_progression = self.get_wait_time_progression(duration, stop_condition)
             # TODO, be smart about setting a static image
@@ -496,8 +556,10 @@ class PyScene(Container):
             for t in time_progression:
                 dt = t - last_t
                 last_t = t
-                self.update_mobjects(dt)
-                self.update_frame()
+                with self.profile_phase("update_mobjects"):
+                    self.update_mobjects(dt)
+                with self.profile_phase("update_frame"):
+                    self.update_frame()
                 if stop_condition is not None and stop_condition():
                     time_progression.close()
                     break
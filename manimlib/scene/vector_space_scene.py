@@ -27,6 +27,7 @@ from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.scene.scene import PyScene
 from manimlib.utils.rate_functions import rush_from
 from manimlib.utils.rate_functions import rush_into
+from manimlib.utils.simple_functions import vectorized_function
 from manimlib.utils.space_ops import angle_of_vector
 from manimlib.utils.space_ops import get_norm
 
@@ -439,7 +440,9 @@ class LinearTransformationScene(VectorScene):
             transposed_matrix = new_matrix
         elif transposed_matrix.shape != (3, 3):
             raise Exception("Matrix has bad dimensions")
-        return lambda point: np.dot(point, transposed_matrix)
+        return vectorized_function(
+            lambda point: np.dot(point, transposed_matrix)
+        )
 
     def get_piece_movement(self, pieces):
         start = VGroup(*pieces)
@@ -6,11 +6,95 @@ CLOSED_THRESHOLD = 0.001
 
 
 def bezier(points):
+    points = np.array(points)
     n = len(points) - 1
-    return lambda t: sum([
-        ((1 - t)**(n - k)) * (t**k) * choose(n, k) * point
-        for k, point in enumerate(points)
-    ])
+    coefficients = [choose(n, k) for k in range(n + 1)]
+
+    def result(t):
+        if np.ndim(t) > 0:
+            # Each term broadcasts t against its point, as rate functions
+            # evaluated at arrays of alphas rely on.
+            return sum([
+                coefficients[k] * ((1 - t)**(n - k)) * (t**k) * point
+                for k, point in enumerate(points)
+            ])
+        return np.dot([
+            coefficient * ((1 - t)**(n - k)) * (t**k)
+            for k, coefficient in enumerate(coefficients)
+        ], points)
+    return result
+
+
+def get_bernstein_matrix(degree, ts):
+    """
+    Returns an array of shape (len(ts), degree + 1) whose rows hold the
+    Bernstein polynomials of the given degree evaluated at each t in ts,
+    such that multiplying it with the control points of a bezier curve
+    gives the points of the curve at each t.
+    """
+    ts = np.array(ts, dtype=float).reshape((-1, 1))
+    ks = np.arange(degree + 1)
+    coefficients = np.array([choose(degree, k) for k in ks])
+    return coefficients * (ts**ks) * ((1 - ts)**(degree - ks))
+
+
+def evaluate_beziers(curves, ts):
+    """
+    Given an array of shape (M, n + 1, dim) holding the control points of M
+    bezier curves of degree n, returns an array of shape (M, len(ts), dim)
+    holding the points of each curve at each t in ts.
+    """
+    curves = np.array(curves, dtype=float)
+    return np.matmul(get_bernstein_matrix(curves.shape[1] - 1, ts), curves)
+
+
+def evaluate_each_bezier(curves, ts):
+    """
+    Like evaluate_beziers, but evaluates the ith curve only at ts[i],
+    returning an array of shape (M, dim).
+    """
+    curves = np.array(curves, dtype=float)
+    weights = get_bernstein_matrix(curves.shape[1] - 1, ts)
+    return np.einsum("mk,mkd->md", weights, curves)
+
+
+def de_casteljau_levels(curves, t):
+    """
+    Returns the levels of de Casteljau's algorithm evaluating each curve at
+    t, which is either a number or an array holding one number per curve.
+    Level i has shape (M, n + 1 - i, dim), and the last level holds the
+    points of the curves at t.
+    """
+    t = np.array(t, dtype=float).reshape((-1, 1, 1))
+    levels = [curves]
+    while levels[-1].shape[1] > 1:
+        level = levels[-1]
+        levels.append(interpolate(level[:, :-1], level[:, 1:], t))
+    return levels
+
+
+def partial_beziers(curves, a, b):
+    """
+    Given an array of shape (M, n + 1, dim) holding the control points of M
+    bezier curves, returns an array of the same shape holding the control
+    points of the portion of each curve on the interval [a, b], where a and
+    b are either numbers or arrays holding one number per curve.
+    """
+    curves = np.array(curves, dtype=float)
+    a = np.array(a, dtype=float).reshape(-1)
+    b = np.array(b, dtype=float).reshape(-1)
+    # The portion on [a, 1] ends each level of de Casteljau's algorithm at
+    # a, which is all the last point of the curve if a is 1.
+    levels = de_casteljau_levels(curves, a)
+    a_to_1 = np.stack([level[:, -1] for level in reversed(levels)], axis=1)
+    end_prop = np.divide(
+        b - a, 1 - a,
+        out=np.zeros(np.broadcast(a, b).shape),
+        where=(a != 1),
+    )
+    # Of which the portion on [0, end_prop] starts each level.
+    levels = de_casteljau_levels(a_to_1, end_prop)
+    return np.stack([level[:, 0] for level in levels], axis=1)
 
 
 def partial_bezier_points(points, a, b):
@@ -20,21 +104,8 @@ def partial_bezier_points(points, a, b):
     return an array of the same size, which
     describes the portion of the original bezier
     curve on the interval [a, b].
-
-    This algorithm is pretty nifty, and pretty dense.
     """
-    if a == 1:
-        return [points[-1]] * len(points)
-
-    a_to_1 = np.array([
-        bezier(points[i:])(a)
-        for i in range(len(points))
-    ])
-    end_prop = (b - a) / (1. - a)
-    return np.array([
-        bezier(a_to_1[:i + 1])(end_prop)
-        for i in range(len(points))
-    ])
+    return partial_beziers([points], a, b)[0]
 
 
 # Linear interpolation variants
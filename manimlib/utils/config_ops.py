@@ -1,5 +1,6 @@
 import inspect
 import itertools as it
+import weakref as _weakref
 
 
 def get_all_descendent_classes(Class):
@@ -20,33 +21,96 @@ def filtered_locals(caller_locals):
     return result
 
 
-def digest_config(obj, kwargs, caller_locals={}):
-    """
-    Sets init args and CONFIG values as local variables
+# Maps a given class to its super classes, the CONFIGs of the class and of
+# those super classes when the entry was made, the merged CONFIG of the
+# class, the IDs of the dicts within it which were created by merging, and
+# the keys of the merged CONFIG which hold such dicts. Entries don't refer
+# to the class itself, so they go away along with classes made on the fly.
+_static_config_cache = _weakref.WeakKeyDictionary()
 
-    The purpose of this function is to ensure that all
-    configuration of any object is inheritable, able to
-    be easily passed into instantiation, and is attached
-    as an attribute of the object.
+
+def _get_static_config(Class):
+    """
+    Returns the merged CONFIG of Class and its super classes, along with the
+    IDs of the dicts within it which were created by merging and the keys
+    which hold them. The result is recomputed whenever the CONFIG of one of
+    those classes is reassigned.
     """
+    entry = _static_config_cache.get(Class)
+    if entry is not None:
+        super_classes, configs = entry[:2]
+        if all(
+            getattr(Class, "CONFIG", None) is config
+            for Class, config in zip([Class, *super_classes], configs)
+        ):
+            return entry[2:]
 
     # Assemble list of CONFIGs from all super classes
-    classes_in_hierarchy = [obj.__class__]
+    hierarchy = [Class]
+    classes_in_hierarchy = [Class]
     static_configs = []
     while len(classes_in_hierarchy) > 0:
         Class = classes_in_hierarchy.pop()
         classes_in_hierarchy += Class.__bases__
+        if Class not in hierarchy:
+            hierarchy.append(Class)
         if hasattr(Class, "CONFIG"):
             static_configs.append(Class.CONFIG)
 
+    # Order matters a lot here, first dicts have higher priority
+    merged_dict_ids = set()
+    static_config = merge_dicts_recursively(
+        *reversed(static_configs),
+        merged_dict_ids=merged_dict_ids,
+    )
+    merged_keys = [
+        key for key, value in static_config.items()
+        if id(value) in merged_dict_ids
+    ]
+    configs = [getattr(Class, "CONFIG", None) for Class in hierarchy]
+    entry = (
+        hierarchy[1:], configs, static_config, merged_dict_ids, merged_keys
+    )
+    _static_config_cache[hierarchy[0]] = entry
+    return entry[2:]
+
+
+def _copy_merged_dicts(value, merged_dict_ids):
+    """
+    Copies the dicts within value which were created by merging CONFIGs, so
+    that each object gets its own, as it did before merged CONFIGs were
+    cached. Other values are shared with the CONFIGs they came from.
+    """
+    return {
+        key: _copy_merged_dicts(item, merged_dict_ids)
+        if id(item) in merged_dict_ids else item
+        for key, item in value.items()
+    }
+
+
+def digest_config(obj, kwargs, caller_locals={}):
+    """
+    Sets init args and CONFIG values as local variables
+
+    The purpose of this function is to ensure that all
+    configuration of any object is inheritable, able to
+    be easily passed into instantiation, and is attached
+    as an attribute of the object.
+    """
+
+    static_config, merged_dict_ids, merged_keys = \
+            _get_static_config(obj.__class__)
+    result = dict(static_config)
+    for key in merged_keys:
+        result[key] = _copy_merged_dicts(result[key], merged_dict_ids)
+
     # Order matters a lot here, first dicts have higher priority
     caller_locals = filtered_locals(caller_locals)
     all_dicts = [kwargs, caller_locals, obj.__dict__]
-    all_dicts += static_configs
-    obj.__dict__ = merge_dicts_recursively(*reversed(all_dicts))
+    obj.__dict__ = _update_dict_recursively(result, *reversed(all_dicts))
 
 
-def merge_dicts_recursively(*dicts):
+def merge_dicts_recursively(*dicts, merged_dict_ids=None):
     """
     Creates a dict whose keyset is the union of all the
     input dictionaries.  The value for each key is based
@@ -54,13 +118,32 @@ def merge_dicts_recursively(*dicts):
 
     dicts later in the list have higher priority
 
-    When values are dictionaries, it is applied recursively
+    When values are dictionaries, it is applied recursively.
+    If merged_dict_ids is given, the IDs of the dicts created
+    that way are added to it.
+    """
+    return _update_dict_recursively(
+        dict(),
+        *dicts,
+        merged_dict_ids=merged_dict_ids,
+    )
+
+
+def _update_dict_recursively(result, *dicts, merged_dict_ids=None):
+    """
+    Like merge_dicts_recursively, but merges dicts into result
+    in place and returns it.
     """
-    result = dict()
     all_items = it.chain(*[d.items() for d in dicts])
     for key, value in all_items:
         if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_dicts_recursively(result[key], value)
+            result[key] = merge_dicts_recursively(
+                result[key],
+                value,
+                merged_dict_ids=merged_dict_ids,
+            )
+            if merged_dict_ids is not None:
+                merged_dict_ids.add(id(result[key]))
         else:
             result[key] = value
     return result
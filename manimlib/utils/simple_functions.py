@@ -31,6 +31,27 @@ def choose(n, r, use_cache=True):
     return numer // denom
 
 
+def vectorized_function(function):
+    """
+    Marks function as one which, besides single points or numbers, takes
+    arrays of them and returns the array of its values at each, so that
+    callers like Mobject.apply_function can pass it every point at once.
+    Points come as an array of shape (N, 3), and complex numbers for
+    Mobject.apply_complex_function as a complex array of shape (N,).
+    """
+    function.is_vectorized = True
+    return function
+
+
+def is_vectorized_function(function):
+    """
+    Returns whether function was marked with vectorized_function, or is a
+    numpy ufunc, which work on arrays by construction.
+    """
+    return isinstance(function, np.ufunc) or \
+        getattr(function, "is_vectorized", False)
+
+
 def get_num_args(function):
     return len(get_parameters(function))
 
@@ -0,0 +1,56 @@
+import json
+import numpy as np
+
+
+def encode_value(value):
+    """
+    Converts the values found in diffs which json can't encode on its own.
+    """
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    elif isinstance(value, np.generic):
+        return value.item()
+    elif isinstance(value, (set, frozenset)):
+        return list(value)
+    else:
+        # E.g. functions passed to apply_function or used as stop conditions.
+        return repr(value)
+
+
+class RecordSink(object):
+    """
+    Receives the records streamed by a web Scene. The target may be a callable,
+    which is passed each record as it is, or a path or file-like object, to
+    which each record is written as a line of JSON (NDJSON).
+    """
+    def __init__(self, target):
+        self.callback = None
+        self.file = None
+        self.owns_file = False
+        if isinstance(target, RecordSink):
+            self.callback = target.write
+        elif isinstance(target, str):
+            self.file = open(target, "w")
+            self.owns_file = True
+        elif hasattr(target, "write"):
+            self.file = target
+        elif callable(target):
+            self.callback = target
+        else:
+            raise TypeError(f"Can't stream records to {target!r}")
+
+    def write(self, record):
+        if self.callback is not None:
+            self.callback(record)
+        else:
+            self.file.write(json.dumps(record, default=encode_value))
+            self.file.write("\n")
+            # Flush so that readers on the other end of a pipe get each
+            # record as soon as it is computed.
+            self.file.flush()
+
+    def close(self):
+        if self.owns_file:
+            self.file.close()
+        self.file = None
+        self.callback = None
@@ -0,0 +1,218 @@
+"""
+Content-addressed store of the points generated for TeX strings.
+
+The points of every entry are kept as float32 (x, y, z) rows in a single
+binary file, which is memory-mapped for reading. An index file maps the
+SHA-256 of each TeX string to the offset of its first row in that file and
+the number of rows in each of its subpaths. Recently read entries are kept in
+an in-process LRU cache.
+
+To convert a directory of points in the old format (one file per TeX string,
+named after it, holding a Python list of subpaths), run
+
+    python -m manimlib.web.tex_point_store <old_directory> [<store_directory>]
+"""
+import ast
+import collections
+import hashlib
+import json
+import os
+import sys
+import threading
+
+import numpy as np
+
+DEFAULT_STORE_DIRECTORY = os.path.join(os.path.dirname(__file__), "tex_point_store")
+INDEX_FILE_NAME = "index.json"
+POINTS_FILE_NAME = "points.bin"
+# float32 keeps about 7 significant digits. The coordinates of TeX points are
+# at most a few units, so storing them rounds each by up to about 2.4e-7, and
+# values computed from them (e.g. the transformations of WriteStuff, which
+# went from -1.13277724 to -1.13277727) change by around 3e-8.
+POINT_DTYPE = np.float32
+INDEX_VERSION = 1
+# The old format couldn't name a file ".", so its points were stored under
+# this name instead.
+LEGACY_CURRENT_DIR_FILE_NAME = "LINUX_CURRENT_DIR"
+
+
+def get_tex_key(tex):
+    return hashlib.sha256(tex.encode("utf-8")).hexdigest()
+
+
+class TexPointStore(object):
+    def __init__(self, directory=DEFAULT_STORE_DIRECTORY, cache_size=256):
+        self.directory = directory
+        self.cache_size = cache_size
+        # Maps a given key to its index entry, or None until the index is
+        # loaded.
+        self.entries = None
+        # Memory map of the points file, or None if it's empty or not loaded.
+        self.points = None
+        # Maps a given key to its path data, from least to most recently read.
+        self.cache = collections.OrderedDict()
+        self.lock = threading.RLock()
+
+    def get_index_path(self):
+        return os.path.join(self.directory, INDEX_FILE_NAME)
+
+    def get_points_path(self):
+        return os.path.join(self.directory, POINTS_FILE_NAME)
+
+    def load(self):
+        with self.lock:
+            self.entries = {}
+            self.points = None
+            self.cache.clear()
+            if not os.path.exists(self.get_index_path()):
+                return
+            with open(self.get_index_path()) as f:
+                index = json.load(f)
+            if index.get("version") != INDEX_VERSION:
+                raise ValueError(
+                    f"Unsupported TeX point index version {index.get('version')}"
+                )
+            self.entries = index["entries"]
+            if os.path.getsize(self.get_points_path()) > 0:
+                self.points = np.memmap(
+                    self.get_points_path(),
+                    dtype=POINT_DTYPE,
+                    mode="r",
+                ).reshape((-1, 3))
+
+    def ensure_loaded(self):
+        if self.entries is None:
+            self.load()
+
+    def __contains__(self, tex):
+        with self.lock:
+            self.ensure_loaded()
+            return get_tex_key(tex) in self.entries
+
+    def __len__(self):
+        with self.lock:
+            self.ensure_loaded()
+            return len(self.entries)
+
+    def get(self, tex):
+        """
+        Returns the path data of tex as a list of read-only (n, 3) arrays, one
+        per subpath, or None if it isn't in the store.
+        """
+        key = get_tex_key(tex)
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                return self.cache[key]
+            self.ensure_loaded()
+            if key not in self.entries:
+                return None
+            path_data = self.read_entry(self.entries[key])
+            self.cache[key] = path_data
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+            return path_data
+
+    def read_entry(self, entry):
+        path_data = []
+        start = entry["offset"]
+        for length in entry["lengths"]:
+            subpath = np.array(self.points[start:start + length], dtype=float)
+            subpath.setflags(write=False)
+            path_data.append(subpath)
+            start += length
+        return path_data
+
+    def add(self, tex, path_data):
+        self.add_many([(tex, path_data)])
+
+    def add_many(self, items):
+        """
+        Appends the path data of each (tex, path_data) pair in items to the
+        store, replacing the entries of TeX strings that were already in it.
+        """
+        with self.lock:
+            self.ensure_loaded()
+            os.makedirs(self.directory, exist_ok=True)
+            if self.points is not None:
+                offset = len(self.points)
+            else:
+                offset = 0
+            # Drop the memory map before the file it maps grows.
+            self.points = None
+            with open(self.get_points_path(), "ab") as f:
+                for tex, path_data in items:
+                    subpaths = [
+                        np.array(subpath, dtype=POINT_DTYPE).reshape((-1, 3))
+                        for subpath in path_data
+                    ]
+                    for subpath in subpaths:
+                        f.write(subpath.tobytes())
+                    key = get_tex_key(tex)
+                    self.entries[key] = {
+                        "tex": tex,
+                        "offset": offset,
+                        "lengths": [len(subpath) for subpath in subpaths],
+                    }
+                    self.cache.pop(key, None)
+                    offset += sum(len(subpath) for subpath in subpaths)
+            self.write_index()
+            self.load()
+
+    def write_index(self):
+        temp_path = self.get_index_path() + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(
+                {"version": INDEX_VERSION, "entries": self.entries},
+                f,
+                indent=1,
+                sort_keys=True,
+            )
+        os.replace(temp_path, self.get_index_path())
+
+
+def convert_legacy_directory(legacy_directory, store):
+    """
+    Adds the points in a directory of the old format to store and returns the
+    number of TeX strings which were converted.
+    """
+    items = []
+    for file_name in sorted(os.listdir(legacy_directory)):
+        with open(os.path.join(legacy_directory, file_name)) as f:
+            path_data = ast.literal_eval(f.read())
+        if file_name == LEGACY_CURRENT_DIR_FILE_NAME:
+            tex = "."
+        else:
+            tex = file_name
+        items.append((tex, path_data))
+    store.add_many(items)
+    return len(items)
+
+
+default_store = None
+
+
+def get_default_store():
+    global default_store
+    if default_store is None:
+        default_store = TexPointStore()
+    return default_store
+
+
+def main():
+    if len(sys.argv) not in (2, 3):
+        print(
+            "Usage: python -m manimlib.web.tex_point_store "
+            "<old_directory> [<store_directory>]"
+        )
+        sys.exit(2)
+    if len(sys.argv) == 3:
+        store = TexPointStore(sys.argv[2])
+    else:
+        store = get_default_store()
+    count = convert_legacy_directory(sys.argv[1], store)
+    print(f"Converted {count} TeX strings into {store.directory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Fills the TeX point store with every TeX string a scene module will request,
+so that rendering doesn't have to run latex for them one at a time.
+
+The strings are collected in two ways. Statically, each call to a TeX Mobject
+class with only literal arguments is evaluated. Dynamically, the scenes are
+rendered in a dry run during which tex_to_points only records the strings it
+is asked for. The misses are then converted in parallel by a process pool.
+"""
+import ast
+import concurrent.futures
+import contextlib
+import contextvars
+import io
+import os
+import tempfile
+import time
+
+import manimlib.config
+import manimlib.constants as consts
+import manimlib.web.utils
+from manimlib.web.tex_point_store import get_default_store
+
+TEX_MOBJECT_CLASS_NAMES = [
+    "SingleStringTexMobject",
+    "TexMobject",
+    "TextMobject",
+    "BulletedList",
+    "TexMobjectFromPresetString",
+    "Title",
+]
+DEFAULT_TEX_DIR = os.path.join(tempfile.gettempdir(), "manim_tex_prewarm")
+
+
+def get_static_tex_calls(code):
+    """
+    Returns (class name, args, kwargs) for each call in code to one of the
+    TeX Mobject classes whose arguments are all literals.
+    """
+    ret = []
+    for node in ast.walk(ast.parse(code)):
+        if not isinstance(node, ast.Call):
+            continue
+        if not isinstance(node.func, ast.Name):
+            continue
+        if node.func.id not in TEX_MOBJECT_CLASS_NAMES:
+            continue
+        try:
+            args = [ast.literal_eval(arg) for arg in node.args]
+            kwargs = {
+                keyword.arg: ast.literal_eval(keyword.value)
+                for keyword in node.keywords
+            }
+        except ValueError:
+            continue
+        if None in kwargs:
+            # The call unpacks a dict.
+            continue
+        ret.append((node.func.id, args, kwargs))
+    return ret
+
+
+def record_tex_strings(code, scene_names):
+    recorded_tex_strings = {}
+    errors = []
+    manimlib.web.utils.tex_recorder.set(recorded_tex_strings)
+    with contextlib.redirect_stdout(io.StringIO()):
+        module = manimlib.config.get_module(code)
+        for class_name, args, kwargs in get_static_tex_calls(code):
+            try:
+                getattr(module, class_name)(*args, **kwargs)
+            except Exception as e:
+                errors.append(f"{class_name}{tuple(args)}: {e!r}")
+        for scene_name in scene_names:
+            try:
+                scene = manimlib.get_scene(code, [scene_name])
+                scene.render()
+            except Exception as e:
+                errors.append(f"{scene_name}: {e!r}")
+    return recorded_tex_strings, errors
+
+
+def collect_tex_strings(code, scene_names=None):
+    """
+    Returns a dict mapping the TeX strings requested by the given scenes of
+    code (all of them by default), in the order they were first requested,
+    to the template they were requested with, along with a list of the
+    errors raised while collecting them.
+    """
+    if scene_names is None:
+        scene_names = manimlib.get_scene_choices(code)
+    # Run in an empty context so that the dry run gets a session of its own.
+    return contextvars.Context().run(record_tex_strings, code, scene_names)
+
+
+def svg_string_to_path_data(svg_string):
+    """
+    Converts the svg generated for a TeX string into the path data expected
+    by SingleStringTexMobject.generate_points, i.e. one list of points per
+    path, centered and scaled as for a TeX Mobject.
+    """
+    from manimlib.mobject.svg.svg_mobject import SVGMobject
+    from manimlib.mobject.svg.tex_mobject import TEX_MOB_SCALE_FACTOR
+    mob = SVGMobject(svg_string=svg_string, height=None)
+    mob.scale(TEX_MOB_SCALE_FACTOR)
+    return [
+        submob.points.tolist()
+        for submob in mob.family_members_with_points()
+    ]
+
+
+def generate_tex_points(tex, template_tex_file_body, tex_dir):
+    """
+    Runs latex on tex in the given template, as the TeX Mobject which
+    requested it would, and converts the result to path data. Returns tex,
+    the path data (or None if it failed), an error message, and the time
+    taken.
+    """
+    from manimlib.utils.tex_file_writing import tex_to_svg_file
+    start_time = time.time()
+    consts.TEX_DIR = tex_dir
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            svg_file = tex_to_svg_file(tex, template_tex_file_body)
+            with open(svg_file) as f:
+                path_data = svg_string_to_path_data(f.read())
+    except Exception as e:
+        return tex, None, repr(e), time.time() - start_time
+    return tex, path_data, None, time.time() - start_time
+
+
+def prewarm_tex_strings(tex_strings, store=None, processes=None, tex_dir=DEFAULT_TEX_DIR):
+    """
+    Adds the points of each string in tex_strings, a dict mapping them to
+    their templates, which is missing from store (the default store by
+    default), running latex in a pool of processes. Strings without a
+    template use that of TexMobject.
+    Returns a list of (tex, status, seconds) tuples, where status is "hit",
+    "miss" or "failed: <error>".
+    """
+    if store is None:
+        store = get_default_store()
+    report = []
+    misses = []
+    for tex in tex_strings:
+        start_time = time.time()
+        if store.get(tex) is not None:
+            report.append((tex, "hit", time.time() - start_time))
+        else:
+            misses.append(tex)
+    if not misses:
+        return report
+    os.makedirs(tex_dir, exist_ok=True)
+    new_items = []
+    with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+        futures = [
+            executor.submit(
+                generate_tex_points,
+                tex,
+                tex_strings[tex] or consts.TEMPLATE_TEX_FILE_BODY,
+                tex_dir,
+            )
+            for tex in misses
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            tex, path_data, error, seconds = future.result()
+            if path_data is None:
+                report.append((tex, f"failed: {error}", seconds))
+            else:
+                new_items.append((tex, path_data))
+                report.append((tex, "miss", seconds))
+    if new_items:
+        store.add_many(new_items)
+    return report
+
+
+def print_report(report, errors, wall_time):
+    for tex, status, seconds in report:
+        print(f"{seconds:8.3f}s  {status:<6}  {tex}")
+    for error in errors:
+        print(f"Error while collecting TeX strings: {error}")
+    num_hits = sum(1 for _, status, _ in report if status == "hit")
+    num_failed = sum(1 for _, status, _ in report if status.startswith("failed"))
+    num_misses = len(report) - num_hits
+    print(
+        f"{len(report)} TeX strings: {num_hits} hits, {num_misses} misses "
+        f"({num_failed} failed) in {wall_time:.3f}s"
+    )
+
+
+def prewarm_tex_cache(code, scene_names=None, processes=None, tex_dir=DEFAULT_TEX_DIR):
+    start_time = time.time()
+    tex_strings, errors = collect_tex_strings(code, scene_names)
+    report = prewarm_tex_strings(
+        tex_strings,
+        processes=processes,
+        tex_dir=tex_dir,
+    )
+    print_report(report, errors, time.time() - start_time)
+    return report
@@ -1,198 +1,548 @@
 import sys
 import collections
+import contextvars
 import numpy as np
 import copy
 import itertools as it
+import weakref
 if sys.platform == "emscripten":
     import js
     import pyodide
 else:
     from manimlib.web.web_mock import tex2points
 from collections import defaultdict
+from manimlib.utils.space_ops import rotation_matrix
 
-past_hierarchy_when_diffed = defaultdict(lambda: collections.defaultdict(list))
-# Maps a given Mobject ID to a list of IDs of its past or present parent
-# Mobjects that were diffed while it was part of their hierarchy but not
-# considered to be required.
-past_diffed_parents = defaultdict(list)
 # Format string used in place of the Mobject ID for Mobjects that were copied
 # from one the user created.
 COPIED_MOBJECT_FORMAT = "<copy of {}>"
 # String used in place of the Mobject ID for Mobjects that weren't created by
 # the user.
 UNKNOWN_MOBJECT = "<unknown_mobject>"
-# Maps a given Mobject ID to the serialization of the Mobject as it existed
-# when it was first created.
-initial_mobject_serializations = {}
-# Maps a given Mobject ID to the serialization of the Mobject as it existed
-# at the latter of when it was created and when it was last diffed.
-prior_mobject_serializations = {}
-# Maps a given Mobjects ID to the Mobject itself.
-current_mobjects = {}
-# Maps a given Mobject class to the number of Mobjects of that class that have
-# been created.
-mobject_class_counts = defaultdict(lambda: 1)
-# Maps a given Mobject name to the number of copies of that Mobject that have
-# been created.
-mobject_copy_counts = defaultdict(lambda: 1)
-# Maps a given Mobject ID to a human-readable name for that Mobject.
-mobject_ids_to_names = {}
-# List of transformations applied to Mobjects in the order they are applied.
-transformation_list = []
-next_unserialized_transformation_index = 0
-web_scene = None
+
+
+class RenderSession(object):
+    """
+    Holds the registration state of a single render. The session in use is
+    kept in a context variable, so that Scenes rendered concurrently in
+    different threads or tasks each have their own.
+    """
+    def __init__(self, scene=None):
+        # Maps a given Mobject ID to a dict mapping the IDs of the Mobjects
+        # in its family to the IDs of its family when it was diffed while not
+        # considered to be required.
+        self.past_hierarchy_when_diffed = defaultdict(lambda: defaultdict(list))
+        # Maps a given Mobject ID to a list of IDs of its past or present
+        # parent Mobjects that were diffed while it was part of their
+        # hierarchy but not considered to be required.
+        self.past_diffed_parents = defaultdict(list)
+        # Maps a given Mobject ID to the serialization of the Mobject as it
+        # existed when it was first created.
+        self.initial_mobject_serializations = {}
+        # Maps a given Mobject ID to the serialization of the Mobject as it
+        # existed at the latter of when it was created and when it was last
+        # diffed.
+        self.prior_mobject_serializations = {}
+        # Maps a given Mobjects ID to the Mobject itself.
+        self.current_mobjects = {}
+        # Maps a given Mobject class to the number of Mobjects of that class
+        # that have been created.
+        self.mobject_class_counts = defaultdict(lambda: 1)
+        # Maps a given Mobject name to the number of copies of that Mobject
+        # that have been created.
+        self.mobject_copy_counts = defaultdict(lambda: 1)
+        # Maps a given Mobject ID to a human-readable name for that Mobject.
+        self.mobject_ids_to_names = {}
+        # List of transformations applied to Mobjects in the order they are
+        # applied.
+        self.transformation_list = []
+        self.next_unserialized_transformation_index = 0
+        # Maps the index of a given transformation in transformation_list to
+        # the 4x4 matrix of the affine map it applies to its Mobject's points
+        # (or None if it isn't affine), along with the IDs of the Mobject's
+        # ancestors at the time. Entries are dropped once the transformation
+        # is serialized.
+        self.transformation_affine_data = {}
+        # Indices in transformation_list before which the hierarchy of some
+        # Mobject changed, so that transformations can't be compacted across
+        # them.
+        self.transformation_barriers = set()
+        # Maps a given Mobject ID to the order in which it was registered.
+        self.mobject_registration_indices = {}
+        # Set of IDs of Mobjects whose serialization may have changed since
+        # they were last diffed.
+        self.dirty_mobject_ids = set()
+        # Set of IDs of the Mobjects in the family of a Mobject added to the
+        # Scene.
+        self.scene_family_ids = set()
+        # Set of the Mobjects with a member of their family in
+        # scene_family_ids, i.e. those whose hierarchy is on screen. This
+        # holds weak references, since Mobjects that were never registered
+        # can be freed while still in it.
+        self.scene_hierarchy_mobjects = weakref.WeakSet()
+        # Whether the two sets above must be rebuilt from the Scene before
+        # use.
+        self.scene_index_stale = True
+        # Maps a given Mobject ID to whether it was required when its family
+        # was last processed by check_required. Entries are dropped whenever
+        # the hierarchy of the Mobject changes, so that it will be processed
+        # again.
+        self.checked_mobject_families = {}
+        # IDs of the Mobjects which were marked as required since they were
+        # last streamed, in the order they were marked.
+        self.newly_required_mobject_ids = []
+        # Maps a given Mobject ID to the parts of streamed diffs which were
+        # left out because the Mobject wasn't required yet, as (sequence
+        # number, attribute, renamed entry) tuples.
+        self.withheld_diffs = defaultdict(list)
+        # Maps a given Mobject ID to the index in its withheld_diffs of the
+        # entry into which the changes of its serialization other than its
+        # submobjects are merged.
+        self.withheld_merged_diff_indices = {}
+        # The number of calls to register_mobject.
+        self.num_mobject_registrations = 0
+        self.web_scene = scene
+
+
+current_session = contextvars.ContextVar("current_session")
+
+
+# Dict mapping the TeX strings requested from tex_to_points while recording
+# a dry run, in the order they were first requested, to the template they
+# were first requested with, or None when not recording.
+tex_recorder = contextvars.ContextVar("tex_recorder", default=None)
+
+
+def get_session():
+    """
+    Returns the RenderSession of the current context, starting a new one if
+    there is none.
+    """
+    try:
+        return current_session.get()
+    except LookupError:
+        session = RenderSession()
+        current_session.set(session)
+        return session
+
 
 def reset_data(scene):
-    global \
-        initial_mobject_serializations, \
-        prior_mobject_serializations, \
-        current_mobjects, \
-        mobject_class_counts, \
-        mobject_ids_to_names, \
-        transformation_list, \
-        next_unserialized_transformation_index, \
-        web_scene
-    initial_mobject_serializations = {}
-    prior_mobject_serializations = {}
-    current_mobjects = {}
-    mobject_class_counts = defaultdict(lambda: 1)
-    mobject_ids_to_names = {}
-    transformation_list = []
-    next_unserialized_transformation_index = 0
-    web_scene = scene
+    """
+    Starts a new RenderSession for scene in the current context and returns
+    it.
+    """
+    session = RenderSession(scene)
+    current_session.set(session)
+    return session
 
 def get_unserialized_transformations():
-    global next_unserialized_transformation_index
-    ret = transformation_list[next_unserialized_transformation_index:]
-    next_unserialized_transformation_index = len(transformation_list)
+    session = get_session()
+    ret = compact_transformations(
+        session.next_unserialized_transformation_index,
+        len(session.transformation_list),
+    )
+    session.next_unserialized_transformation_index = len(session.transformation_list)
+    session.transformation_barriers = set()
     return ret
 
-def register_transformation(mob, *transformation):
-    if hasattr(mob, "delegate_for_original") and mob.delegate_for_original:
-        mob_id = id(mob.original)
+
+"""
+Folds each run of affine transformations applied to the same Mobject in
+transformation_list[start:end] into a single ('matrix', matrix)
+transformation, which takes the place of the first transformation of the run.
+A transformation may only join the run of its Mobject if no transformation was
+applied to one of the Mobject's ancestors or descendants, and no hierarchy was
+changed, since the run began. ('func', function) transformations aren't
+affine, so they are left as they are and end the run of their Mobject.
+"""
+def compact_transformations(start, end):
+    session = get_session()
+    ret = []
+    # Each run is [position in ret, Mobject ID, matrix, length].
+    runs = []
+    # Maps a given Mobject ID to its run which may still be extended.
+    open_runs = {}
+    # Maps a given Mobject ID to the IDs of its descendants with open runs.
+    open_descendant_ids = defaultdict(set)
+    for index in range(start, end):
+        transformation = session.transformation_list[index]
+        mob_id = transformation[1]
+        matrix, ancestor_ids = session.transformation_affine_data.pop(index)
+        if index in session.transformation_barriers:
+            open_runs = {}
+            open_descendant_ids = defaultdict(set)
+        for related_id in it.chain(ancestor_ids, open_descendant_ids.pop(mob_id, ())):
+            open_runs.pop(related_id, None)
+        run = open_runs.pop(mob_id, None)
+        if matrix is not None and run is not None:
+            run[2] = np.dot(matrix, run[2])
+            run[3] += 1
+        else:
+            ret.append(transformation)
+            if matrix is None:
+                continue
+            run = [len(ret) - 1, mob_id, matrix, 1]
+            runs.append(run)
+        open_runs[mob_id] = run
+        for ancestor_id in ancestor_ids:
+            open_descendant_ids[ancestor_id].add(mob_id)
+    for position, mob_id, matrix, length in runs:
+        if length > 1:
+            ret[position] = (ret[position][0], mob_id, 'matrix', matrix)
+    return ret
+
+
+def get_affine_matrix(transformation, about_point=None):
+    """
+    Returns the 4x4 matrix, acting on homogeneous coordinates, of the map
+    that transformation applies to points, or None if it isn't affine.
+    """
+    command = transformation[0]
+    ret = np.identity(4)
+    if command == "shift":
+        ret[:3, 3] = transformation[1]
+        return ret
+    elif command == "scale":
+        linear = np.diag(transformation[1] * np.ones(3))
+    elif command == "rotate":
+        linear = rotation_matrix(transformation[1], transformation[2])
+    elif command == "stretch":
+        linear = np.identity(3)
+        linear[transformation[2], transformation[2]] = transformation[1]
     else:
-        mob_id = id(mob)
-    if mob_id not in current_mobjects:
+        return None
+    if about_point is None:
+        about_point = np.zeros(3)
+    ret[:3, :3] = linear
+    ret[:3, 3] = about_point - np.dot(linear, about_point)
+    return ret
+
+
+def get_ancestor_ids(mob):
+    ret = set()
+    stack = list(mob.parents)
+    while stack:
+        ancestor = stack.pop()
+        if id(ancestor) not in ret:
+            ret.add(id(ancestor))
+            stack.extend(ancestor.parents)
+    return ret
+
+
+def register_transformation(mob, *transformation, about_point=None):
+    session = get_session()
+    if hasattr(mob, "delegate_for_original") and mob.delegate_for_original:
+        mob = mob.original
+    mob_id = id(mob)
+    if mob_id not in session.current_mobjects:
         # This Mobject's registration was skipped, so its registration should be
         # skipped as well.
         return
     check_required(mob_id)
-    transformation_list.append((
-        len(transformation_list),
+    session.transformation_affine_data[len(session.transformation_list)] = (
+        get_affine_matrix(transformation, about_point),
+        get_ancestor_ids(mob),
+    )
+    session.transformation_list.append((
+        len(session.transformation_list),
         mob_id,
         *transformation,
     ))
 
 def register_mobject(mob, copy_tag=""):
+    session = get_session()
+    session.num_mobject_registrations += 1
     mob_id = id(mob)
-    if mob_id not in current_mobjects:
-        current_mobjects[mob_id] = mob
+    if mob_id not in session.current_mobjects:
+        session.current_mobjects[mob_id] = mob
+        session.mobject_registration_indices[mob_id] = len(session.mobject_registration_indices)
         name_mobject(mob, copy_tag=copy_tag)
 
-    initial_mobject_serializations[mob_id] = serialize_mobject(mob)
-    prior_mobject_serializations[mob_id] = \
-            copy.deepcopy(initial_mobject_serializations[mob_id])
+    serialization = serialize_mobject(mob)
+    if mob_id in session.initial_mobject_serializations:
+        # Registering a Mobject again, as the __init__ of each class in its
+        # hierarchy does, doesn't change whether it's required.
+        serialization['required'] = \
+                session.initial_mobject_serializations[mob_id]['required']
+    session.initial_mobject_serializations[mob_id] = serialization
+    session.prior_mobject_serializations[mob_id] = copy.deepcopy(serialization)
+    # The prior serialization was just taken, so there is nothing to diff.
+    session.dirty_mobject_ids.discard(mob_id)
+    # Its family may have changed since it was last checked.
+    forget_checked_families(mob)
+
+
+def mark_mobject_dirty(mob):
+    """
+    Records that a change was made to mob which may be visible in its
+    serialization (e.g. its style or submobject list), so that it will be
+    diffed the next time the Scene computes a diff.
+    """
+    get_session().dirty_mobject_ids.add(id(mob))
+
+
+def register_submobjects_change(mob, removed, added):
+    """
+    Called after the submobject list of mob changes, with the submobjects
+    that were removed from and added to it.
+    """
+    session = get_session()
+    mark_mobject_dirty(mob)
+    forget_checked_families(mob)
+    session.transformation_barriers.add(len(session.transformation_list))
+    if session.scene_index_stale:
+        return
+    if removed and mob in session.scene_hierarchy_mobjects:
+        # The removed submobjects may still be on screen through other
+        # parents, so start over.
+        invalidate_scene_index()
+    elif id(mob) in session.scene_family_ids:
+        add_to_scene_index(added)
+    elif any(submob in session.scene_hierarchy_mobjects for submob in added):
+        add_to_scene_hierarchy(mob)
+
+
+def get_dirty_mobject_ids():
+    """
+    Returns the IDs of the registered Mobjects which have been marked dirty
+    since the last call, in the order in which they were registered, and
+    clears the dirty set.
+    """
+    session = get_session()
+    ret = sorted(
+        filter(lambda mob_id: mob_id in session.current_mobjects, session.dirty_mobject_ids),
+        key=lambda mob_id: session.mobject_registration_indices[mob_id],
+    )
+    session.dirty_mobject_ids = set()
+    return ret
 
 
 def name_mobject(mob, copy_tag=""):
+    session = get_session()
     class_name = mob.__class__.__name__
     if hasattr(mob, "original"):
-        original_mob_name = mobject_ids_to_names[id(mob.original)]
+        original_mob_name = session.mobject_ids_to_names[id(mob.original)]
         tagged_name = original_mob_name + f"#{copy_tag}"
-        mob_name = tagged_name + f"{mobject_copy_counts[tagged_name]}"
-        mobject_copy_counts[tagged_name] += 1
+        mob_name = tagged_name + f"{session.mobject_copy_counts[tagged_name]}"
+        session.mobject_copy_counts[tagged_name] += 1
     else:
-        mob_name = f"{class_name}{mobject_class_counts[class_name]}"
-        mobject_class_counts[class_name] += 1
-    mobject_ids_to_names[id(mob)] = mob_name
+        mob_name = f"{class_name}{session.mobject_class_counts[class_name]}"
+        session.mobject_class_counts[class_name] += 1
+    session.mobject_ids_to_names[id(mob)] = mob_name
 
 
 def rename_initial_mobject_serializations():
+    session = get_session()
     new_mobject_dict = {}
-    for mob_id in initial_mobject_serializations:
-        new_serialization = initial_mobject_serializations[mob_id]
-        if not initial_mobject_serializations[mob_id]['required']:
+    for mob_id in session.initial_mobject_serializations:
+        if not session.initial_mobject_serializations[mob_id]['required']:
             continue
-        if "submobjects" in new_serialization:
-            new_serialization["submobjects"] = list(map(
-                lambda submob_id: mobject_ids_to_names[submob_id],
-                new_serialization["submobjects"],
-            ))
-        if "args" in new_serialization:
-            new_args = []
-            for arg in new_serialization["args"]:
-                if arg in mobject_ids_to_names:
-                    new_args.append(mobject_ids_to_names[arg])
-                else:
-                    new_args.append(arg)
-            new_serialization["args"] = new_args
-        new_mobject_dict[mobject_ids_to_names[mob_id]] = new_serialization
+        new_mobject_dict[session.mobject_ids_to_names[mob_id]] = \
+                rename_mobject_serialization(session.initial_mobject_serializations[mob_id])
     return new_mobject_dict
 
 
+def rename_mobject_serialization(serialization):
+    session = get_session()
+    new_serialization = dict(serialization)
+    if "submobjects" in new_serialization:
+        new_serialization["submobjects"] = list(map(
+            lambda submob_id: session.mobject_ids_to_names[submob_id],
+            new_serialization["submobjects"],
+        ))
+    if "args" in new_serialization:
+        new_args = []
+        for arg in new_serialization["args"]:
+            if arg in session.mobject_ids_to_names:
+                new_args.append(session.mobject_ids_to_names[arg])
+            else:
+                new_args.append(arg)
+        new_serialization["args"] = new_args
+    return new_serialization
+
+
 def rename_diff(diff):
+    session = get_session()
     new_diff = copy.deepcopy(diff)
     if "submobjects" in new_diff and new_diff["submobjects"]:
         starting_submobjects, ending_submobjects = new_diff["submobjects"]
-        new_starting_submobjects = list(map(lambda submob_id: mobject_ids_to_names[submob_id], starting_submobjects))
+        new_starting_submobjects = list(map(lambda submob_id: session.mobject_ids_to_names[submob_id], starting_submobjects))
         new_ending_submobjects = []
         for submob_id in ending_submobjects:
-            if submob_id in mobject_ids_to_names:
-                new_ending_submobjects.append(mobject_ids_to_names[submob_id])
+            if submob_id in session.mobject_ids_to_names:
+                new_ending_submobjects.append(session.mobject_ids_to_names[submob_id])
             else:
                 # The Mobject contains a submobject that wasn't created by the
                 # user (e.g. it was created in Mobject.align_submobjects).
                 new_ending_submobjects.append(UNKNOWN_MOBJECT)
             new_diff["submobjects"] = (new_starting_submobjects, new_ending_submobjects)
     if "args" in new_diff and new_diff["args"]:
-        new_diff["args"] = list(map(lambda submob_id: mobject_ids_to_names[submob_id], new_diff["args"]))
+        new_diff["args"] = list(map(lambda submob_id: session.mobject_ids_to_names[submob_id], new_diff["args"]))
     return new_diff
 
 
 def rename_diffs(diffs):
-    new_diffs = []
-    for diff in diffs:
-        new_diff = {}
-        for attr in diff:
+    return [rename_scene_diff(diff) for diff in diffs]
+
+
+"""
+Renames a single diff, leaving out the Mobjects which aren't required. If
+sequence_number is given, the parts that were left out are kept in
+withheld_diffs so that they can be streamed if the Mobject becomes required.
+"""
+def rename_scene_diff(diff, sequence_number=None):
+    session = get_session()
+    new_diff = {}
+    for attr in diff:
+        if attr == "mobjects":
+            new_diff["mobjects"] = {}
+            for mob_id in diff["mobjects"]:
+                mob_name = session.mobject_ids_to_names[mob_id]
+                mob_diff = rename_diff(diff["mobjects"][mob_id])
+                if session.initial_mobject_serializations[mob_id]['required']:
+                    new_diff["mobjects"][mob_name] = mob_diff
+                elif sequence_number is not None:
+                    withhold_mobject_diff(
+                        mob_id, sequence_number, mob_name, mob_diff)
+        elif attr == "transformations":
+            # This is the transformation list. Transformations have the form
+            # (index, mob_id, *params) before renaming.
+            new_transformations = []
+            for transformation in diff[attr]:
+                mob_id = transformation[1]
+                if mob_id in session.mobject_ids_to_names:
+                    new_transformation = (
+                        transformation[0],
+                        session.mobject_ids_to_names[mob_id],
+                        *transformation[2:],
+                    )
+                else:
+                    # The scene serialized the transformation of a Mobject
+                    # that was neither created by nor copied from the user
+                    # (e.g.  a copy of a copy).
+                    new_transformation = (
+                        transformation[0],
+                        UNKNOWN_MOBJECT,
+                        *transformation[2:],
+                    )
+                if session.initial_mobject_serializations[mob_id]['required']:
+                    new_transformations.append(new_transformation)
+                elif sequence_number is not None:
+                    session.withheld_diffs[mob_id].append(
+                        (sequence_number, "transformations", new_transformation))
+            if new_transformations:
+                new_diff["transformations"] = new_transformations
+        else:
+            print(f"Unknown diff attribute {attr}")
+    return new_diff
+
+
+def withhold_mobject_diff(mob_id, sequence_number, mob_name, mob_diff):
+    """
+    Keeps the renamed diff of a Mobject which isn't required yet in
+    withheld_diffs. A Mobject that isn't required was never on screen, so
+    only the net change of each attribute other than its submobjects
+    matters, and those are merged into a single entry at the latest
+    sequence number. Changes to submobjects are kept in order, since they
+    decide which Mobjects the transformations of their parents move.
+    """
+    session = get_session()
+    withheld = session.withheld_diffs[mob_id]
+    if "submobjects" in mob_diff:
+        withheld.append((
+            sequence_number,
+            "mobjects",
+            (mob_name, {"submobjects": mob_diff["submobjects"]}),
+        ))
+        mob_diff = {
+            attr: value for attr, value in mob_diff.items()
+            if attr != "submobjects"
+        }
+        if not mob_diff:
+            return
+    index = session.withheld_merged_diff_indices.get(mob_id)
+    if index is not None:
+        _, _, (_, merged_diff) = withheld.pop(index)
+        mob_diff = merge_mobject_diffs(merged_diff, mob_diff)
+    session.withheld_merged_diff_indices[mob_id] = len(withheld)
+    withheld.append((sequence_number, "mobjects", (mob_name, mob_diff)))
+
+
+def merge_mobject_diffs(diff1, diff2):
+    """
+    Returns the diff taking a Mobject from the start of diff1 to the end of
+    diff2, for diffs of attributes other than submobjects.
+    """
+    ret = dict(diff1)
+    for attr, value in diff2.items():
+        if attr not in ret:
+            ret[attr] = value
+        elif attr in ["style", "config"]:
+            ret[attr] = {
+                **value,
+                **{
+                    key: (ret[attr][key][0], value[key][1])
+                    for key in value if key in ret[attr]
+                },
+                **{
+                    key: ret[attr][key]
+                    for key in ret[attr] if key not in value
+                },
+            }
+        else:
+            ret[attr] = (ret[attr][0], value[1])
+    return ret
+
+
+def release_withheld_diffs():
+    """
+    Drops the diffs withheld for Mobjects which never became required, once
+    nothing more will be streamed.
+    """
+    session = get_session()
+    session.withheld_diffs = defaultdict(list)
+    session.withheld_merged_diff_indices = {}
+
+
+def pop_newly_required_mobjects():
+    """
+    Returns the renamed initial serializations of the Mobjects which became
+    required since the last call, along with a list of the diffs which were
+    withheld from earlier records because those Mobjects weren't required
+    yet. The withheld diffs are in the order they were computed and are meant
+    to be applied before the record that they're sent with.
+    """
+    session = get_session()
+    mobjects = {}
+    withheld = defaultdict(dict)
+    for mob_id in sorted(
+        session.newly_required_mobject_ids,
+        key=lambda mob_id: session.mobject_registration_indices.get(mob_id, -1),
+    ):
+        serialization = rename_mobject_serialization(session.initial_mobject_serializations[mob_id])
+        del serialization['required']
+        mobjects[session.mobject_ids_to_names[mob_id]] = serialization
+        session.withheld_merged_diff_indices.pop(mob_id, None)
+        for sequence_number, attr, entry in session.withheld_diffs.pop(mob_id, []):
+            diff = withheld[sequence_number]
             if attr == "mobjects":
-                new_diff["mobjects"] = {}
-                for mob_id in diff["mobjects"]:
-                    if not initial_mobject_serializations[mob_id]['required']:
-                        continue
-                    new_diff["mobjects"][mobject_ids_to_names[mob_id]] = rename_diff(diff["mobjects"][mob_id])
-            elif attr == "transformations":
-                # This is the transformation list. Transformations have the form
-                # (index, mob_id, *params) before renaming.
-                new_transformations = []
-                for transformation in diff[attr]:
-                    mob_id = transformation[1]
-                    if not initial_mobject_serializations[mob_id]['required']:
-                        continue
-                    mob_name = mobject_ids_to_names[mob_id]
-                    if mob_id in mobject_ids_to_names:
-                        new_transformations.append((
-                            transformation[0],
-                            mob_name,
-                            *transformation[2:],
-                        ))
-                    else:
-                        # The scene serialized the transformation of a Mobject
-                        # that was neither created by nor copied from the user
-                        # (e.g.  a copy of a copy).
-                        new_transformations.append((
-                            transformation[0],
-                            UNKNOWN_MOBJECT,
-                            *transformation[2:],
-                        ))
-                if new_transformations:
-                    new_diff["transformations"] = new_transformations
+                mob_name, mob_diff = entry
+                diff.setdefault("mobjects", {}).setdefault(mob_name, {}) \
+                        .update(mob_diff)
             else:
-                print(f"Unknown diff attribute {attr}")
-        new_diffs.append(new_diff)
-    return new_diffs
+                diff.setdefault("transformations", []).append(entry)
+    session.newly_required_mobject_ids = []
+    withheld_diff_list = []
+    for sequence_number in sorted(withheld):
+        diff = withheld[sequence_number]
+        if "transformations" in diff:
+            diff["transformations"].sort(key=lambda transformation: transformation[0])
+        withheld_diff_list.append(diff)
+    return mobjects, withheld_diff_list
 
 
 def rename_animation_info_list(animation_info_list):
+    session = get_session()
     new_info_list = []
     for animation_group in animation_info_list:
         new_animation_group = []
@@ -201,14 +551,14 @@ def rename_animation_info_list(animation_info_list):
             config = animation["config"]
             new_args = []
             for arg in args:
-                if arg in mobject_ids_to_names:
-                    new_args.append(mobject_ids_to_names[arg])
+                if arg in session.mobject_ids_to_names:
+                    new_args.append(session.mobject_ids_to_names[arg])
                 else:
                     new_args.append(arg)
             new_config = {}
             for key, val in config.items():
-                if val in mobject_ids_to_names:
-                    new_config[key] = mobject_ids_to_names[val]
+                if val in session.mobject_ids_to_names:
+                    new_config[key] = session.mobject_ids_to_names[val]
                 else:
                     new_config[key] = val
             new_animation_group.append({
@@ -248,7 +598,13 @@ def get_mobject_style(mob):
         "strokeWidth": mob.get_stroke_width(),
     }
 
-def tex_to_points(tex):
+def tex_to_points(tex, template_tex_file_body=None):
+    recorded_tex_strings = tex_recorder.get()
+    if recorded_tex_strings is not None:
+        # This is a dry run, so only record the request and use whatever is
+        # already cached.
+        recorded_tex_strings.setdefault(tex, template_tex_file_body)
+        return tex2points(tex, log_misses=False)
     if sys.platform == "emscripten":
         return pyodide.as_nested_list(js.texToPoints(tex))
     else:
@@ -391,7 +747,8 @@ def mobject_serialization_diff(starting_serialization, ending_serialization):
                 else:
                     if starting_value != ending_value:
                         config_diff[config_attr] = (starting_value, ending_value)
-            ret["config"] = config_diff
+            if config_diff:
+                ret["config"] = config_diff
         else:
             try:
                 if starting_attr != ending_attr:
@@ -418,9 +775,73 @@ def diff_contains_mobject_name(diff, mobject_name):
     return False
 
 def mark_ids_required(mob_ids):
+    session = get_session()
     for mob_id in mob_ids:
-        if mob_id in initial_mobject_serializations:
-            initial_mobject_serializations[mob_id]['required'] = True
+        if mob_id in session.initial_mobject_serializations:
+            if not session.initial_mobject_serializations[mob_id]['required']:
+                session.newly_required_mobject_ids.append(mob_id)
+            session.initial_mobject_serializations[mob_id]['required'] = True
+
+def invalidate_scene_index():
+    get_session().scene_index_stale = True
+
+
+def rebuild_scene_index():
+    session = get_session()
+    session.scene_family_ids = set()
+    session.scene_hierarchy_mobjects = weakref.WeakSet()
+    session.scene_index_stale = False
+    if session.web_scene is not None:
+        add_to_scene_index(getattr(session.web_scene, "mobjects", []))
+
+
+def register_scene_addition(mobjects):
+    """
+    Called after mobjects are added to the Scene.
+    """
+    session = get_session()
+    if not session.scene_index_stale:
+        add_to_scene_index(mobjects)
+
+
+def add_to_scene_index(mobjects):
+    session = get_session()
+    for mob in mobjects:
+        for submob in mob.get_family():
+            if id(submob) not in session.scene_family_ids:
+                session.scene_family_ids.add(id(submob))
+                add_to_scene_hierarchy(submob)
+
+
+def add_to_scene_hierarchy(mob):
+    session = get_session()
+    # If a Mobject is in scene_hierarchy_mobjects then so are all of its
+    # ancestors, so the walk up can stop there.
+    stack = [mob]
+    while stack:
+        ancestor = stack.pop()
+        if ancestor not in session.scene_hierarchy_mobjects:
+            session.scene_hierarchy_mobjects.add(ancestor)
+            stack.extend(ancestor.parents)
+
+
+def forget_checked_families(mob):
+    """
+    Drops the check_required results for mob and its ancestors, whose
+    families contain mob.
+    """
+    session = get_session()
+    if not session.checked_mobject_families:
+        return
+    visited = set()
+    stack = [mob]
+    while stack:
+        ancestor = stack.pop()
+        if id(ancestor) not in visited:
+            visited.add(id(ancestor))
+            session.checked_mobject_families.pop(id(ancestor), None)
+            stack.extend(ancestor.parents)
+
 
 """
 Updates the required status and required parent history of Mobjects in the
@@ -430,28 +851,23 @@ the Scene. If a Mobject is required then all Mobjects in its hierarchy are also
 required.
 """
 def check_required(mob_id):
-    added_mobject_ids = []
-    for mob in web_scene.mobjects:
-        added_mobject_ids.extend(map(lambda mob: id(mob), mob.get_family()))
-
-    required = False
-    queue = [mob_id]
-    while queue:
-        parent_id = queue.pop()
-        if parent_id in added_mobject_ids:
-            required = True
-            break
-        parent_mobject = current_mobjects.get(parent_id, None)
-        if parent_mobject:
-            for child_id in map(lambda mob: id(mob), parent_mobject.submobjects):
-                queue.append(child_id)
-
-    family_ids = list(map(lambda mob: id(mob), current_mobjects[mob_id].get_family()))
+    session = get_session()
+    if session.scene_index_stale:
+        rebuild_scene_index()
+    required = session.current_mobjects[mob_id] in session.scene_hierarchy_mobjects
+    if session.checked_mobject_families.get(mob_id, None) == required:
+        # Nothing changed since the family was last processed.
+        return
+
+    family_ids = list(map(lambda mob: id(mob), session.current_mobjects[mob_id].get_family()))
     if required:
         mark_ids_required(family_ids)
-        for parent_id in past_diffed_parents[mob_id]:
-            mark_ids_required(past_hierarchy_when_diffed[parent_id][mob_id])
+        for parent_id in session.past_diffed_parents[mob_id]:
+            mark_ids_required(session.past_hierarchy_when_diffed[parent_id][mob_id])
     else:
         for submob_id in family_ids:
-            past_diffed_parents[submob_id].append(mob_id)
-            past_hierarchy_when_diffed[mob_id][submob_id] = family_ids
+            session.past_diffed_parents[submob_id].append(mob_id)
+            session.past_hierarchy_when_diffed[mob_id][submob_id] = family_ids
+            # The submobject has a new past parent to mark when it's required.
+            session.checked_mobject_families.pop(submob_id, None)
+    session.checked_mobject_families[mob_id] = required
@@ -1,11 +1,9 @@
-import os.path
-
-def tex2points(tex):
-    if tex == '.':
-        tex = 'LINUX_CURRENT_DIR'
-    try:
-        with open(os.path.join('manimlib', 'web', 'tex_points', tex)) as f:
-            return eval(f.read())
-    except FileNotFoundError:
-        print(f"No points cached for {tex}")
+def tex2points(tex, log_misses=True):
+    # Imported here so that the store module can also be run as a script.
+    from manimlib.web.tex_point_store import get_default_store
+    path_data = get_default_store().get(tex)
+    if path_data is None:
+        if log_misses:
+            print(f"No points cached for {tex}")
         return []
+    return path_data
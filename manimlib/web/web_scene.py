@@ -20,11 +20,12 @@ from manimlib.mobject.svg.tex_mobject import (
     TextMobject,
     SingleStringTexMobject,
 )
+import manimlib.web.stream
 import manimlib.web.utils
 
 
 class Scene(PyScene):
-    def __init__(self, **kwargs):
+    def __init__(self, diff_sink=None, render_cache=None, render_cache_key=None, **kwargs):
         self.render_kwargs = kwargs
         # A list of Mobject diffs representing changes made outside of
         # Animations.
@@ -33,33 +34,113 @@ class Scene(PyScene):
         self.animation_diffs = []
         # A list of serializations of the Animations that were played.
         self.animation_info_list = []
-        reset_data(self)
+        # IDs of the Mobjects that were added to the Scene the last time a
+        # diff was computed.
+        self.added_mobject_ids_when_diffed = set()
+        # Sink to which a renamed record is streamed after each call to play
+        # or wait, or None to collect the diffs above until the Scene is torn
+        # down.
+        self.diff_sink = None if diff_sink is None else manimlib.web.stream.RecordSink(diff_sink)
+        # The number of records that were streamed to diff_sink.
+        self.num_streamed_records = 0
+        # RenderCache in which the results are stored under render_cache_key
+        # once the Scene is rendered, or None.
+        self.render_cache = render_cache
+        self.render_cache_key = render_cache_key
+        # The RenderSession holding the registration state of this Scene.
+        self.session = reset_data(self)
 
     def render(self):
-        # Regular Scenes render upon instantiation.
-        return super(Scene, self).__init__(**self.render_kwargs)
+        # Mobjects created while rendering are registered with this Scene's
+        # session, even if another Scene was created since.
+        token = manimlib.web.utils.current_session.set(self.session)
+        try:
+            # Regular Scenes render upon instantiation.
+            super(Scene, self).__init__(**self.render_kwargs)
+        finally:
+            manimlib.web.utils.current_session.reset(token)
+        if self.render_cache is not None:
+            self.render_cache.store(self.render_cache_key, self)
 
     def play(self, *args, **kwargs):
-        self.scene_diffs.append(self.compute_diff())
-        super(Scene, self).play(
-            *args,
-            animation_info_list=self.animation_info_list,
-            **kwargs,
-        )
-        self.animation_diffs.append(self.compute_diff())
+        with self.profile_record("play"):
+            with self.profile_phase("compute_diff"):
+                scene_diff = self.compute_diff()
+            animation_info_list = []
+            super(Scene, self).play(
+                *args,
+                animation_info_list=animation_info_list,
+                **kwargs,
+            )
+            with self.profile_phase("compute_diff"):
+                animation_diff = self.compute_diff()
+            self.record_diffs(scene_diff, animation_info_list, animation_diff)
 
     def wait(self, duration=DEFAULT_WAIT_TIME, stop_condition=None):
-        self.animation_info_list.append(serialize_wait(duration, stop_condition))
-        self.scene_diffs.append(self.compute_diff())
-        super(Scene, self).wait(duration=duration, stop_condition=stop_condition)
-        self.animation_diffs.append(self.compute_diff())
+        with self.profile_record("wait"):
+            animation_info_list = [serialize_wait(duration, stop_condition)]
+            with self.profile_phase("compute_diff"):
+                scene_diff = self.compute_diff()
+            super(Scene, self).wait(duration=duration, stop_condition=stop_condition)
+            with self.profile_phase("compute_diff"):
+                animation_diff = self.compute_diff()
+            self.record_diffs(scene_diff, animation_info_list, animation_diff)
+
+    def record_diffs(self, scene_diff, animation_info_list, animation_diff):
+        if self.diff_sink is None:
+            self.scene_diffs.append(scene_diff)
+            self.animation_info_list.extend(animation_info_list)
+            self.animation_diffs.append(animation_diff)
+        else:
+            self.stream_record(scene_diff, animation_info_list, animation_diff)
+
+    def stream_record(self, scene_diff, animation_info_list, animation_diff):
+        """
+        Renames the diffs computed around a call to play or wait and writes
+        them to diff_sink as a self-contained record. Mobjects are introduced
+        by the first record in which they are required, along with any of
+        their diffs that were left out of earlier records.
+        """
+        index = self.num_streamed_records
+        scene_diff = manimlib.web.utils.rename_scene_diff(
+            scene_diff,
+            sequence_number=2 * index,
+        )
+        animation_diff = manimlib.web.utils.rename_scene_diff(
+            animation_diff,
+            sequence_number=2 * index + 1,
+        )
+        animations = manimlib.web.utils.rename_animation_info_list(animation_info_list)
+        mobjects, withheld_diffs = \
+                manimlib.web.utils.pop_newly_required_mobjects()
+        self.diff_sink.write({
+            "index": index,
+            "mobjects": mobjects,
+            "withheldDiffs": withheld_diffs,
+            "sceneDiff": scene_diff,
+            "animations": animations[0] if animations else [],
+            "animationDiff": animation_diff,
+        })
+        self.num_streamed_records += 1
 
     def compute_diff(self):
+        """
+        Diffs the Mobjects which were marked dirty since the last diff, along
+        with those which were added to or removed from the Scene.
+        """
         ret = {}
         mobject_diffs = {}
-        for mob_id, mob in manimlib.web.utils.current_mobjects.items():
-            prior_serialization = manimlib.web.utils.prior_mobject_serializations[mob_id]
-            current_serialization = serialize_mobject(mob, added=mob in self.mobjects)
+        added_mobject_ids = set(map(id, self.mobjects))
+        for mob_id in added_mobject_ids ^ self.added_mobject_ids_when_diffed:
+            self.session.dirty_mobject_ids.add(mob_id)
+        self.added_mobject_ids_when_diffed = added_mobject_ids
+        for mob_id in manimlib.web.utils.get_dirty_mobject_ids():
+            mob = self.session.current_mobjects[mob_id]
+            prior_serialization = self.session.prior_mobject_serializations[mob_id]
+            current_serialization = serialize_mobject(
+                mob,
+                added=mob_id in added_mobject_ids,
+            )
             diff = mobject_serialization_diff(
                 prior_serialization,
                 current_serialization,
@@ -72,13 +153,20 @@ class Scene(PyScene):
                     mobject_diffs[id(mob.original)] = current_diff
                 else:
                     mobject_diffs[mob_id] = diff
-            manimlib.web.utils.prior_mobject_serializations[mob_id] = current_serialization
+            self.session.prior_mobject_serializations[mob_id] = current_serialization
         if mobject_diffs:
             ret["mobjects"] = mobject_diffs
         ret["transformations"] = get_unserialized_transformations()
         return ret
 
     def tear_down(self):
+        if self.diff_sink is not None:
+            # Everything was already streamed.
+            self.initial_mobject_serializations = {}
+            manimlib.web.utils.release_withheld_diffs()
+            self.diff_sink.close()
+            self.session.web_scene = None
+            return super(Scene, self).tear_down()
         self.initial_mobject_serializations = \
                 manimlib.web.utils.rename_initial_mobject_serializations()
         self.scene_diffs = manimlib.web.utils.rename_diffs(self.scene_diffs)
@@ -86,5 +174,5 @@ class Scene(PyScene):
         for mobject_name in self.initial_mobject_serializations:
             del self.initial_mobject_serializations[mobject_name]['required']
         self.animation_info_list = manimlib.web.utils.rename_animation_info_list(self.animation_info_list)
-        manimlib.web.utils.web_scene = None
+        self.session.web_scene = None
         return super(Scene, self).tear_down()
@@ -0,0 +1,321 @@
+"""
+Long-running workers which import the library once and render many scenes.
+
+Jobs and replies are framed as lines of JSON (NDJSON). A job looks like
+
+    {"id": 1, "code": "...", "scene_name": "SquareToCircle"}
+
+and may also set "keyframes_only" and "stream". A worker replies to each job
+with a single line
+
+    {"id": 1, "ok": true, "result": {"initial_mobject_serializations": ...}}
+
+or {"id": 1, "ok": false, "error": "..."} if the scene couldn't be rendered.
+When "stream" is set, each record the Scene streams is first sent as
+{"id": 1, "record": {...}}, and the final reply has no result.
+
+A single worker reads jobs from stdin and writes replies to stdout. A
+WorkerPool forks a number of workers from a server process which imported the
+library once, hands each job to whichever one is free, and replaces a worker
+once it has rendered max_jobs_per_worker jobs so that the memory each one
+holds onto stays bounded. If a worker dies while rendering a job, that job is
+replied to with an error. The pool can serve jobs over a UNIX socket with
+serve_unix_socket.
+"""
+import contextlib
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import queue
+import socketserver
+import sys
+import threading
+import traceback
+
+import manimlib
+import manimlib.imports
+from manimlib.render_cache import CACHED_SCENE_ATTRIBUTES
+from manimlib.web.stream import encode_value
+
+DEFAULT_MAX_JOBS_PER_WORKER = 100
+
+
+def encode_message(message):
+    return json.dumps(message, default=encode_value) + "\n"
+
+
+def render_job(job, send):
+    """
+    Renders the scene requested by job, passing each message for it to send.
+    Anything the scene prints goes to stderr.
+    """
+    job_id = job.get("id")
+    if job.get("stream", False):
+        def diff_sink(record):
+            send({"id": job_id, "record": record})
+    else:
+        diff_sink = None
+    # Keep get_scene from prompting for a scene on the jobs' stdin.
+    stdin = sys.stdin
+    sys.stdin = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            scene = manimlib.get_scene(
+                job["code"],
+                [job["scene_name"]],
+                diff_sink=diff_sink,
+                keyframes_only=job.get("keyframes_only", False),
+            )
+            if scene is None:
+                raise Exception(f"Failed to render {job['scene_name']}")
+            scene.render()
+    except SystemExit:
+        # get_module and get_scenes_to_render exit after printing the error.
+        send({
+            "id": job_id,
+            "ok": False,
+            "error": f"Failed to render {job['scene_name']}",
+        })
+        return
+    except Exception as e:
+        send({
+            "id": job_id,
+            "ok": False,
+            "error": "".join(traceback.format_exception_only(type(e), e)).strip(),
+        })
+        return
+    finally:
+        sys.stdin = stdin
+    reply = {"id": job_id, "ok": True}
+    if diff_sink is None:
+        reply["result"] = {
+            attr: getattr(scene, attr)
+            for attr in CACHED_SCENE_ATTRIBUTES
+        }
+    send(reply)
+
+
+def serve_stdio(input_file=None, output_file=None, max_jobs=None):
+    """
+    Renders each job read from input_file (stdin by default), writing the
+    replies to output_file (stdout by default). Returns after max_jobs jobs
+    or at the end of input_file.
+    """
+    if input_file is None:
+        input_file = sys.stdin
+    if output_file is None:
+        output_file = sys.stdout
+
+    def send(message):
+        output_file.write(encode_message(message))
+        output_file.flush()
+
+    for num_jobs, line in enumerate(input_file, start=1):
+        if not line.strip():
+            continue
+        render_job(json.loads(line), send)
+        if max_jobs is not None and num_jobs >= max_jobs:
+            break
+
+
+def run_pool_worker(job_queue, message_queue, max_jobs, current_job_id):
+    # Exit quietly when the pool is interrupted.
+    try:
+        for _ in range(max_jobs):
+            job = job_queue.get()
+            if job is None:
+                break
+            # Lets the pool reply for the job if this worker dies.
+            current_job_id.value = job["id"]
+            # Messages are sent as JSON since the diffs may hold functions,
+            # which can't be pickled.
+            render_job(job, lambda message: message_queue.put(encode_message(message)))
+            current_job_id.value = -1
+    except KeyboardInterrupt:
+        pass
+
+
+class WorkerPool(object):
+    """
+    Preforked worker processes sharing a queue of jobs. submit() returns a
+    queue.Queue which receives each message for the job, ending with the one
+    whose "ok" is set.
+    """
+    def __init__(self, num_workers=None, max_jobs_per_worker=DEFAULT_MAX_JOBS_PER_WORKER):
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        self.num_workers = num_workers
+        self.max_jobs_per_worker = max_jobs_per_worker
+        # Workers are forked from a server process which imports the library
+        # once, which keeps them warm. Unlike this process, it runs no
+        # threads, so it is safe to fork replacements from.
+        self.context = multiprocessing.get_context("forkserver")
+        self.context.set_forkserver_preload(["manimlib.worker"])
+        self.job_queue = self.context.Queue()
+        self.message_queue = self.context.Queue()
+        self.workers = []
+        # Maps each worker to the shared value holding the id of the job it's
+        # rendering, or -1 while it isn't rendering one.
+        self.current_job_ids = {}
+        # Maps the id of a pending job to the queue its messages are put on.
+        self.pending_jobs = {}
+        self.job_ids = itertools.count()
+        self.num_recycled_workers = 0
+        self.lock = threading.Lock()
+        self.closed = False
+        self.threads = [
+            threading.Thread(target=self.dispatch_messages, daemon=True),
+            threading.Thread(target=self.maintain_workers, daemon=True),
+        ]
+
+    def start(self):
+        for _ in range(self.num_workers):
+            self.start_worker()
+        for thread in self.threads:
+            thread.start()
+        return self
+
+    def start_worker(self):
+        current_job_id = self.context.Value("q", -1, lock=False)
+        worker = self.context.Process(
+            target=run_pool_worker,
+            args=(
+                self.job_queue,
+                self.message_queue,
+                self.max_jobs_per_worker,
+                current_job_id,
+            ),
+            daemon=True,
+        )
+        worker.start()
+        self.workers.append(worker)
+        self.current_job_ids[worker] = current_job_id
+
+    def maintain_workers(self):
+        """
+        Replaces the workers which exited, whether after reaching
+        max_jobs_per_worker or by dying mid-job.
+        """
+        while not self.closed:
+            for worker in list(self.workers):
+                worker.join(timeout=0.1)
+                if worker.is_alive() or self.closed:
+                    continue
+                with self.lock:
+                    self.workers.remove(worker)
+                    job_id = self.current_job_ids.pop(worker).value
+                    self.num_recycled_workers += 1
+                    self.start_worker()
+                if job_id >= 0:
+                    self.reply_to_lost_job(job_id, worker.exitcode)
+
+    def reply_to_lost_job(self, job_id, exitcode):
+        """
+        Replies with an error for the job a worker was rendering when it
+        exited. The reply goes through the message queue after anything the
+        worker sent, so it's dropped by dispatch_messages if the worker
+        managed to reply itself.
+        """
+        self.message_queue.put(encode_message({
+            "id": job_id,
+            "ok": False,
+            "error": f"Worker exited with code {exitcode} while rendering",
+        }))
+
+    def dispatch_messages(self):
+        while True:
+            line = self.message_queue.get()
+            if line is None:
+                break
+            message = json.loads(line)
+            with self.lock:
+                if "ok" in message:
+                    replies = self.pending_jobs.pop(message["id"], None)
+                else:
+                    replies = self.pending_jobs.get(message["id"])
+            if replies is not None:
+                replies.put(message)
+
+    def submit(self, code, scene_name, keyframes_only=False, stream=False):
+        job_id = next(self.job_ids)
+        replies = queue.Queue()
+        with self.lock:
+            self.pending_jobs[job_id] = replies
+        self.job_queue.put({
+            "id": job_id,
+            "code": code,
+            "scene_name": scene_name,
+            "keyframes_only": keyframes_only,
+            "stream": stream,
+        })
+        return replies
+
+    def render(self, code, scene_name, keyframes_only=False):
+        """
+        Renders scene_name and returns the final reply for it.
+        """
+        replies = self.submit(code, scene_name, keyframes_only=keyframes_only)
+        return replies.get()
+
+    def close(self):
+        self.closed = True
+        for _ in self.workers:
+            self.job_queue.put(None)
+        for worker in self.workers:
+            worker.join()
+        self.message_queue.put(None)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class PoolRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            job = json.loads(line)
+            replies = self.server.pool.submit(
+                job["code"],
+                job["scene_name"],
+                keyframes_only=job.get("keyframes_only", False),
+                stream=job.get("stream", False),
+            )
+            while True:
+                message = replies.get()
+                # Reply with the client's own id rather than the pool's.
+                message["id"] = job.get("id")
+                self.wfile.write(encode_message(message).encode("utf-8"))
+                self.wfile.flush()
+                if "ok" in message:
+                    break
+
+
+class PoolServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, pool):
+        self.pool = pool
+        super().__init__(path, PoolRequestHandler)
+
+
+def serve_unix_socket(path, num_workers=None, max_jobs_per_worker=DEFAULT_MAX_JOBS_PER_WORKER):
+    """
+    Serves jobs sent to the UNIX socket at path with a WorkerPool. Each
+    connection may send any number of jobs, which are handled in order.
+    """
+    if os.path.exists(path):
+        os.remove(path)
+    with WorkerPool(num_workers, max_jobs_per_worker) as pool:
+        with PoolServer(path, pool) as server:
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os.remove(path)
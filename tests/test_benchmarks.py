@@ -0,0 +1,96 @@
+import importlib.util
+import os
+
+import pytest
+
+BENCHMARKS_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"
+)
+
+CODE = """
+from manimlib.imports import *
+
+class BenchmarkedScene(Scene):
+    def construct(self):
+        self.play(ShowCreation(Square()))
+
+class FailingScene(Scene):
+    def construct(self):
+        raise ValueError("no")
+"""
+
+
+@pytest.fixture(scope="module")
+def suite():
+    spec = importlib.util.spec_from_file_location(
+        "suite", os.path.join(BENCHMARKS_DIRECTORY, "suite.py")
+    )
+    suite = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(suite)
+    return suite
+
+
+@pytest.fixture
+def scene_file(tmp_path):
+    path = tmp_path / "scenes.py"
+    path.write_text(CODE)
+    return str(path)
+
+
+def get_results(**scenes):
+    return {"scenes": scenes}
+
+
+def get_entry(wall_time=1.0, peak_rss_kib=1000, num_registrations=10,
+              diff_bytes=100):
+    return {
+        "wall_time": wall_time,
+        "peak_rss_kib": peak_rss_kib,
+        "num_registrations": num_registrations,
+        "diff_bytes": diff_bytes,
+    }
+
+
+def test_measurement_runs_in_a_fresh_process(suite, scene_file):
+    entry = suite.run_measurement(scene_file, "BenchmarkedScene")
+    assert set(entry) == set(suite.METRICS)
+    assert entry["wall_time"] > 0
+    assert entry["peak_rss_kib"] > 0
+    assert entry["num_registrations"] >= 1
+    assert entry["diff_bytes"] > 0
+
+
+def test_failing_scenes_are_recorded_with_their_error(suite, scene_file):
+    entry = suite.run_measurement(scene_file, "FailingScene")
+    assert "error" in entry
+
+
+def test_compare_flags_metrics_grown_beyond_the_threshold(suite, capsys):
+    baseline = get_results(Same=get_entry(), Slower=get_entry())
+    results = get_results(
+        Same=get_entry(wall_time=1.05),
+        Slower=get_entry(wall_time=1.5, diff_bytes=200),
+        New=get_entry(),
+    )
+    assert suite.compare_results(baseline, results, 0.1) == 2
+    lines = dict(
+        line.strip().split(": ", 1) for line in capsys.readouterr().out.splitlines()
+    )
+    assert "REGRESSION" not in lines["Same"]
+    assert "wall_time +50.0% REGRESSION" in lines["Slower"]
+    assert "diff_bytes +100.0% REGRESSION" in lines["Slower"]
+    assert lines["New"] == "new"
+
+
+def test_compare_counts_scenes_which_stopped_rendering(suite, capsys):
+    baseline = get_results(
+        Broken=get_entry(), StillBroken={"error": "x"}, Fixed={"error": "x"},
+    )
+    results = get_results(
+        Broken={"error": "y"}, StillBroken={"error": "x"}, Fixed=get_entry(),
+    )
+    assert suite.compare_results(baseline, results, 0.1) == 1
+    output = capsys.readouterr().out
+    assert "Broken: REGRESSION now fails: y" in output
+    assert "StillBroken: still fails" in output
+    assert "Fixed: fixed" in output
@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from manimlib.utils.bezier import bezier
+from manimlib.utils.bezier import de_casteljau_levels
+from manimlib.utils.bezier import evaluate_beziers
+from manimlib.utils.bezier import evaluate_each_bezier
+from manimlib.utils.bezier import partial_bezier_points
+from manimlib.utils.bezier import partial_beziers
+from manimlib.utils.rate_functions import running_start
+from manimlib.utils.simple_functions import choose
+
+
+def bezier_point(points, t):
+    """
+    The point of the bezier curve with the given control points at t, as
+    given by its definition.
+    """
+    n = len(points) - 1
+    return sum(
+        choose(n, k) * ((1 - t)**(n - k)) * (t**k) * np.array(point, dtype=float)
+        for k, point in enumerate(points)
+    )
+
+
+def get_curves(num_curves=5, degree=3, dim=3):
+    return np.random.default_rng(0).normal(size=(num_curves, degree + 1, dim))
+
+
+TS = np.linspace(0, 1, 6)
+
+
+@pytest.mark.parametrize("t", [0, 0.3, 1])
+def test_bezier_at_a_number(t):
+    for curve in get_curves():
+        np.testing.assert_allclose(bezier(curve)(t), bezier_point(curve, t))
+
+
+@pytest.mark.parametrize("points", [
+    [0, 0, 0, 1, 1, 1],
+    [0, 0, 0.2, 0.2, 1, 1, 1],
+])
+def test_bezier_at_an_array_of_numbers(points):
+    values = bezier(points)(TS)
+    assert values.shape == TS.shape
+    np.testing.assert_allclose(values, [bezier_point(points, t) for t in TS])
+
+
+def test_running_start_at_an_array_of_alphas():
+    alphas = np.linspace(0, 1, 5)
+    np.testing.assert_allclose(
+        running_start(alphas), [running_start(alpha) for alpha in alphas]
+    )
+
+
+def test_evaluate_beziers():
+    curves = get_curves()
+    points = evaluate_beziers(curves, TS)
+    assert points.shape == (len(curves), len(TS), 3)
+    for curve, curve_points in zip(curves, points):
+        for t, point in zip(TS, curve_points):
+            np.testing.assert_allclose(point, bezier_point(curve, t))
+
+
+def test_evaluate_each_bezier():
+    curves = get_curves(num_curves=len(TS))
+    points = evaluate_each_bezier(curves, TS)
+    for curve, t, point in zip(curves, TS, points):
+        np.testing.assert_allclose(point, bezier_point(curve, t))
+
+
+@pytest.mark.parametrize("t", [0.4, np.linspace(0, 1, 5)])
+def test_de_casteljau_levels_end_at_the_points_of_the_curves(t):
+    curves = get_curves()
+    levels = de_casteljau_levels(curves, t)
+    assert [level.shape[1] for level in levels] == [4, 3, 2, 1]
+    for curve, t, point in zip(curves, np.broadcast_to(t, len(curves)), levels[-1]):
+        np.testing.assert_allclose(point[0], bezier_point(curve, t))
+
+
+@pytest.mark.parametrize("a, b", [
+    (0, 1),
+    (0.2, 0.7),
+    (0.5, 0.5),
+    (0.3, 1),
+    (1, 1),
+    (np.linspace(0, 0.8, 5), np.linspace(0.2, 1, 5)),
+])
+def test_partial_beziers_trace_the_same_curves(a, b):
+    curves = get_curves()
+    pieces = partial_beziers(curves, a, b)
+    assert pieces.shape == curves.shape
+    a_s, b_s = np.broadcast_to(a, len(curves)), np.broadcast_to(b, len(curves))
+    for curve, piece, a, b in zip(curves, pieces, a_s, b_s):
+        for t in TS:
+            np.testing.assert_allclose(
+                bezier_point(piece, t),
+                bezier_point(curve, a + t * (b - a)),
+                atol=1e-12,
+            )
+        np.testing.assert_allclose(partial_bezier_points(curve, a, b), piece)
@@ -0,0 +1,139 @@
+import gc
+import weakref
+
+import pytest
+
+from manimlib.utils.config_ops import digest_config
+from manimlib.utils.config_ops import filtered_locals
+from manimlib.utils.config_ops import merge_dicts_recursively
+from manimlib.utils.config_ops import _static_config_cache
+
+
+def digest_config_uncached(obj, kwargs, caller_locals={}):
+    """
+    digest_config as it was before merged CONFIGs were cached.
+    """
+    classes_in_hierarchy = [obj.__class__]
+    static_configs = []
+    while len(classes_in_hierarchy) > 0:
+        Class = classes_in_hierarchy.pop()
+        classes_in_hierarchy += Class.__bases__
+        if hasattr(Class, "CONFIG"):
+            static_configs.append(Class.CONFIG)
+    caller_locals = filtered_locals(caller_locals)
+    all_dicts = [kwargs, caller_locals, obj.__dict__]
+    all_dicts += static_configs
+    obj.__dict__ = merge_dicts_recursively(*reversed(all_dicts))
+
+
+class Base(object):
+    CONFIG = {
+        "color": "white",
+        "style": {"width": 1, "opacity": 1},
+        "points": [],
+        "plain_dict": {"a": 1},
+    }
+
+
+class Child(Base):
+    CONFIG = {
+        "color": "blue",
+        "style": {"width": 2},
+        "extra": 3,
+    }
+
+
+class Mixin(object):
+    CONFIG = {
+        "style": {"dash": True},
+        "mixin_only": "yes",
+    }
+
+
+class GrandChild(Mixin, Child):
+    CONFIG = {
+        "style": {"opacity": 0.5},
+    }
+
+
+def digest_both(Class, kwargs, caller_locals={}, attrs={}):
+    cached, uncached = Class(), Class()
+    for obj in cached, uncached:
+        obj.__dict__.update(attrs)
+    digest_config(cached, dict(kwargs), dict(caller_locals))
+    digest_config_uncached(uncached, dict(kwargs), dict(caller_locals))
+    return cached, uncached
+
+
+@pytest.mark.parametrize("Class", [Base, Child, GrandChild])
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"color": "red"},
+    {"style": {"width": 5}},
+    {"style": 7, "new_key": [1]},
+])
+def test_cached_digest_config_matches_uncached(Class, kwargs):
+    for _ in range(2):
+        cached, uncached = digest_both(Class, kwargs)
+        assert cached.__dict__ == uncached.__dict__
+
+
+def test_caller_locals_and_attributes_match_uncached():
+    cached, uncached = digest_both(
+        GrandChild,
+        {"color": "red"},
+        caller_locals={"self": None, "kwargs": {}, "extra": 4},
+        attrs={"style": {"width": 9}, "mixin_only": "no"},
+    )
+    assert cached.__dict__ == uncached.__dict__
+    assert cached.extra == 4
+    assert cached.style["width"] == 9
+
+
+def test_kwargs_override_config():
+    obj = GrandChild()
+    digest_config(obj, {"color": "red", "style": {"width": 5}})
+    assert obj.color == "red"
+    assert obj.style == {"width": 5, "opacity": 0.5, "dash": True}
+    assert GrandChild.CONFIG["style"] == {"opacity": 0.5}
+
+
+def test_merged_dicts_are_not_shared():
+    obj1, obj2 = GrandChild(), GrandChild()
+    digest_config(obj1, {})
+    digest_config(obj2, {})
+    obj1.style["width"] = 100
+    assert obj2.style["width"] == 2
+    assert Child.CONFIG["style"] == {"width": 2}
+
+
+def test_unmerged_mutable_defaults_are_shared_as_before():
+    cached, uncached = digest_both(Child, {})
+    assert cached.points is Base.CONFIG["points"]
+    assert uncached.points is Base.CONFIG["points"]
+    assert cached.plain_dict is uncached.plain_dict
+
+
+def test_reassigned_config_is_picked_up():
+    class Temporary(Child):
+        CONFIG = {"extra": 4}
+
+    obj = Temporary()
+    digest_config(obj, {})
+    assert obj.extra == 4
+    Temporary.CONFIG = {"extra": 5}
+    obj = Temporary()
+    digest_config(obj, {})
+    assert obj.extra == 5
+
+
+def test_cache_does_not_keep_classes_alive():
+    class Temporary(Child):
+        CONFIG = {"extra": 4}
+
+    digest_config(Temporary(), {})
+    assert Temporary in _static_config_cache
+    class_ref = weakref.ref(Temporary)
+    del Temporary
+    gc.collect()
+    assert class_ref() is None
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from manimlib.mobject.functions import FunctionGraph
+from manimlib.mobject.functions import _get_distances_to_segments
+from manimlib.utils.simple_functions import vectorized_function
+
+
+def get_anchors(graph):
+    return np.vstack([graph.points[::4], graph.points[-1:]])
+
+
+def get_max_distance_to_graph(graph, function, x_min, x_max):
+    anchors = get_anchors(graph)
+    x = np.linspace(x_min, x_max, 100001)
+    curve_points = np.array([x, function(x), 0 * x]).T
+    indices = np.searchsorted(anchors[:, 0], x).clip(1, len(anchors) - 1)
+    return _get_distances_to_segments(
+        curve_points, anchors[indices - 1], anchors[indices]
+    ).max()
+
+
+@pytest.mark.parametrize("function,x_min,x_max", [
+    (np.sin, -7, 7),
+    (lambda x: np.tanh(50 * x), -1, 1),
+    (lambda x: np.sin(1 / x), 0.05, 1),
+])
+def test_adaptive_sampling_stays_within_tolerance(function, x_min, x_max):
+    graph = FunctionGraph(
+        vectorized_function(function),
+        x_min=x_min,
+        x_max=x_max,
+        use_adaptive_sampling=True,
+    )
+    distance = get_max_distance_to_graph(graph, function, x_min, x_max)
+    assert distance <= graph.adaptive_sampling_tolerance
+
+
+def test_adaptive_sampling_is_no_worse_than_step_size():
+    function = vectorized_function(lambda x: np.tanh(50 * x))
+    graphs = [
+        FunctionGraph(function, x_min=-1, x_max=1, use_adaptive_sampling=flag)
+        for flag in [False, True]
+    ]
+    x = np.linspace(-1, 1, 100001)
+    errors = [
+        np.abs(np.interp(x, *get_anchors(graph)[:, :2].T) - function(x)).max()
+        for graph in graphs
+    ]
+    assert errors[1] <= errors[0] + 1e-6
+    assert len(get_anchors(graphs[1])) < len(get_anchors(graphs[0]))
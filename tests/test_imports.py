@@ -0,0 +1,74 @@
+import subprocess
+import sys
+import textwrap
+import threading
+import types
+
+import manimlib.lazy_imports
+from manimlib.config import get_module
+
+
+def test_star_import_provides_lazily_imported_names():
+    namespace = {}
+    exec("from manimlib.imports import *", namespace)
+    for module_name, names in manimlib.lazy_imports.LAZY_IMPORTS.items():
+        for name in names:
+            assert name in namespace, f"{module_name}.{name}"
+    for name in ["FunctionGraph", "Axes", "GraphScene", "np", "Color"]:
+        assert name in namespace
+
+
+def test_star_import_leaves_out_module_internals():
+    namespace = {}
+    exec("from manimlib.imports import *", namespace)
+    for name in [
+        "glyph_templates",
+        "get_glyph_template",
+        "alignment_plan_cache",
+        "static_config_cache",
+        "get_star_import_names",
+        "defer_star_imports",
+        "collections",
+        "weakref",
+    ]:
+        assert name not in namespace
+
+
+def test_scene_code_imports_lazy_modules_only_once_used():
+    code = textwrap.dedent("""
+        import sys
+        from manimlib.config import get_module
+        module = get_module(
+            "from manimlib.imports import *\\n"
+            "axes = Axes\\n"
+        )
+        assert "manimlib.mobject.coordinate_systems" in sys.modules
+        assert "manimlib.scene.graph_scene" not in sys.modules
+        assert "GraphScene" not in vars(module)
+    """)
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_star_import_during_get_module_in_another_thread():
+    started, star_imported = threading.Event(), threading.Event()
+    sync = types.ModuleType("import_test_sync")
+    sync.started, sync.star_imported = started, star_imported
+    sys.modules["import_test_sync"] = sync
+    code = (
+        "import import_test_sync\n"
+        "from manimlib.imports import *\n"
+        "import_test_sync.started.set()\n"
+        "assert import_test_sync.star_imported.wait(10)\n"
+    )
+    thread = threading.Thread(target=get_module, args=(code,))
+    thread.start()
+    try:
+        assert started.wait(10)
+        namespace = {}
+        exec("from manimlib.imports import *", namespace)
+        lazy_names = manimlib.lazy_imports.get_lazy_name_table()
+        assert set(lazy_names) <= set(namespace)
+    finally:
+        star_imported.set()
+        thread.join()
+        del sys.modules["import_test_sync"]
@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+
+from manimlib.constants import RIGHT
+from manimlib.constants import UP
+from manimlib.mobject.geometry import Circle
+from manimlib.mobject.geometry import Square
+from manimlib.mobject.types.vectorized_mobject import VGroup
+from manimlib.mobject.types.vectorized_mobject import VMobject
+
+
+def get_square_group(use_packed_points):
+    return VGroup(
+        *[Square().shift(2 * i * UP) for i in range(3)],
+        use_packed_points=use_packed_points,
+    )
+
+
+@pytest.mark.parametrize("use_packed_points", [False, True])
+def test_bounding_box_follows_shifted_submobject(use_packed_points):
+    group = get_square_group(use_packed_points)
+    assert group.get_top()[1] == pytest.approx(5)
+    group[0].shift(10 * UP)
+    assert group.get_top()[1] == pytest.approx(11)
+
+
+@pytest.mark.parametrize("use_packed_points", [False, True])
+def test_bounding_box_follows_points_edited_in_place(use_packed_points):
+    group = get_square_group(use_packed_points)
+    assert group.get_bottom()[1] == pytest.approx(-1)
+    group[0].points[:] -= 10 * UP
+    assert group.get_bottom()[1] == pytest.approx(-11)
+    assert group[0].get_bottom()[1] == pytest.approx(-11)
+
+
+@pytest.mark.parametrize("use_packed_points", [False, True])
+def test_width_follows_points_scaled_in_place(use_packed_points):
+    square = Square()
+    group = VGroup(square, use_packed_points=use_packed_points)
+    assert square.get_width() == pytest.approx(2)
+    assert group.get_width() == pytest.approx(2)
+    square.points[:, 0] *= 2
+    assert square.get_width() == pytest.approx(4)
+    assert group.get_width() == pytest.approx(4)
+    assert group.get_center() == pytest.approx(np.zeros(3))
+
+
+def test_boundary_box_follows_anchors_moved_in_place():
+    square = Square()
+    square.get_top()
+    # Moving a handle changes the points without moving any anchor.
+    square.points[1] += 5 * UP
+    assert square.get_top()[1] == pytest.approx(1)
+    square.points[0] += 5 * UP
+    assert square.get_top()[1] == pytest.approx(6)
+
+
+def test_packed_bounding_box_matches_unpacked():
+    packed = get_square_group(True)
+    unpacked = get_square_group(False)
+    for group in packed, unpacked:
+        group.get_center()
+        group[1].shift(3 * UP)
+        group.rotate(0.3)
+    np.testing.assert_allclose(
+        packed.get_bounding_box(), unpacked.get_bounding_box()
+    )
+
+
+def test_vectorized_apply_complex_function_matches_pointwise():
+    vectorized = Square().apply_complex_function(
+        np.exp, vectorized=True, about_point=UP
+    )
+    pointwise = Square().apply_complex_function(
+        np.exp, vectorized=False, about_point=UP
+    )
+    np.testing.assert_allclose(vectorized.points, pointwise.points)
+
+
+def test_copies_leave_caches_and_buffers_behind():
+    group = get_square_group(True)
+    group.get_center()
+    group[0].append_vectorized_mobject(Square())
+    state = group[0].__getstate__()
+    for key in ["_bounding_boxes", "_packed_points", "_points_buffer"]:
+        assert key not in state
+    copy = group.deepcopy()
+    np.testing.assert_allclose(copy[0].points, group[0].points)
+    copy[0].shift(UP)
+    assert group.get_top()[1] == pytest.approx(5)
+    assert copy.get_top()[1] == pytest.approx(5)
+
+
+def test_alignment_plan_cache_is_bounded_by_size(monkeypatch):
+    from manimlib.mobject.types import vectorized_mobject
+
+    def align(n_curves):
+        square, circle = Square(), Circle(num_components=n_curves + 1)
+        square.align_points(circle)
+
+    monkeypatch.setattr(vectorized_mobject, "_alignment_plan_cache", {})
+    monkeypatch.setattr(vectorized_mobject, "_alignment_plan_cache_bytes", 0)
+    align(8)
+    plan_size = vectorized_mobject._alignment_plan_cache_bytes
+    monkeypatch.setattr(
+        vectorized_mobject, "_MAX_ALIGNMENT_PLAN_CACHE_BYTES", 5 * plan_size
+    )
+    for n_curves in range(9, 20):
+        align(n_curves)
+        assert vectorized_mobject._alignment_plan_cache_bytes <= 5 * plan_size
+    assert vectorized_mobject._alignment_plan_cache_bytes == sum(
+        size for plan, size in vectorized_mobject._alignment_plan_cache.values()
+    )
+    # The most recently used plans are the ones kept
+    n_points_kept = [
+        key[2][-1][1] for key in vectorized_mobject._alignment_plan_cache
+    ]
+    assert 1 < len(n_points_kept) <= 5
+    assert n_points_kept == sorted(n_points_kept)
+    assert n_points_kept[-1] == len(Circle(num_components=20).points)
+
+
+def test_add_points_as_corners_needs_a_start():
+    with pytest.raises(Exception, match="with no points"):
+        VMobject().add_points_as_corners([UP, RIGHT])
@@ -0,0 +1,26 @@
+from manimlib.mobject import numbers
+from manimlib.mobject.numbers import DecimalNumber
+
+
+def test_glyph_templates_are_bounded_and_reused(monkeypatch):
+    monkeypatch.setattr(numbers, "_glyph_templates", {})
+    monkeypatch.setattr(numbers, "_MAX_GLYPH_TEMPLATES", 3)
+    one = numbers._get_glyph_template("1")
+    for char in "2341":
+        numbers._get_glyph_template(char)
+        assert len(numbers._glyph_templates) <= 3
+    assert numbers._get_glyph_template("1") is not one
+    four = numbers._get_glyph_template("4")
+    numbers._get_glyph_template("5")
+    assert numbers._get_glyph_template("4") is four
+    assert [key[0] for key in numbers._glyph_templates] == ["1", "5", "4"]
+
+
+def test_decimal_number_survives_evicted_templates(monkeypatch):
+    monkeypatch.setattr(numbers, "_glyph_templates", {})
+    monkeypatch.setattr(numbers, "_MAX_GLYPH_TEMPLATES", 2)
+    decimal = DecimalNumber(1.25)
+    decimal.set_value(3.75)
+    assert decimal.get_value() == 3.75
+    assert len(decimal.submobjects) == 4
+    assert len(numbers._glyph_templates) <= 2
@@ -0,0 +1,131 @@
+import contextlib
+import io
+import json
+
+import pytest
+
+import manimlib
+from manimlib.profiling import PHASE_LABELS
+from manimlib.profiling import Profiler
+
+CODE = """
+from manimlib.imports import *
+
+class ProfiledScene(Scene):
+    def construct(self):
+        square = Square()
+        self.play(ShowCreation(square))
+        self.wait()
+"""
+
+
+class FakeScene(object):
+    def get_mobject_family_members(self):
+        return []
+
+
+@pytest.fixture(scope="module")
+def profiler():
+    profiler = Profiler(trace_memory=False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        scene = manimlib.get_scene(CODE, ["ProfiledScene"], profiler=profiler)
+        scene.render()
+    return profiler
+
+
+def test_records_each_play_and_wait(profiler):
+    assert [record["kind"] for record in profiler.records] == ["play", "wait"]
+    play, wait = profiler.records
+    for name in [
+        "compile_play_args_to_animation_list",
+        "begin_animations",
+        "progress_through_animations",
+        "interpolate",
+        "finish_animations",
+        "compute_diff",
+    ]:
+        assert play["phases"][name] > 0
+    assert "compute_diff" in wait["phases"]
+    assert play["num_mobjects"] == 1
+    assert play["num_points"] > 0
+    assert play["peak_memory"] is None
+    for record in profiler.records:
+        assert record["seconds"] >= record["phases"]["compute_diff"]
+
+
+def test_chrome_trace_holds_records_and_phases(profiler, tmp_path):
+    path = tmp_path / "trace.json"
+    profiler.write_chrome_trace(str(path))
+    with open(path) as f:
+        trace = json.load(f)
+    events = trace["traceEvents"]
+    for event in events:
+        assert event["ph"] == "X"
+        assert event["cat"] in ["record", "phase"]
+        assert event["dur"] >= 0
+        assert set(event) >= {"name", "ts", "pid", "tid"}
+    records = [event for event in events if event["cat"] == "record"]
+    assert [event["name"] for event in records] == ["play", "wait"]
+    assert [event["args"]["index"] for event in records] == [0, 1]
+    # Every phase happened within the play or wait it was part of.
+    for event in events:
+        if event["cat"] == "phase":
+            assert any(
+                record["ts"] <= event["ts"] and
+                event["ts"] + event["dur"] <= record["ts"] + record["dur"]
+                for record in records
+            )
+
+
+def test_phase_totals_add_up_records(profiler):
+    totals = profiler.get_phase_totals()
+    for name, seconds in totals.items():
+        assert seconds == pytest.approx(sum(
+            record["phases"].get(name, 0) for record in profiler.records
+        ))
+    output = io.StringIO()
+    profiler.print_summary(file=output)
+    lines = output.getvalue().splitlines()
+    assert lines[3].startswith("2 records in ")
+    for name, label in PHASE_LABELS.items():
+        if name in totals:
+            line = next(line for line in lines if line.endswith(f"  {name}"))
+            assert line.split()[0] == f"{label}:"
+            milliseconds = float(line.split()[1][:-2])
+            assert milliseconds == pytest.approx(totals[name] * 1000, abs=0.01)
+
+
+def test_nested_phases_count_towards_the_current_record():
+    profiler = Profiler(trace_memory=False)
+    with profiler.phase("outside"):
+        pass
+    with profiler.record("play", FakeScene()) as record:
+        with profiler.phase("interpolate"):
+            with profiler.phase("update_frame"):
+                pass
+        with profiler.phase("interpolate"):
+            pass
+    assert profiler.current_record is None
+    assert set(record["phases"]) == {"interpolate", "update_frame"}
+    assert record["phases"]["interpolate"] >= record["phases"]["update_frame"]
+    assert record["seconds"] >= record["phases"]["interpolate"]
+    names = [event["name"] for event in profiler.trace_events]
+    assert names == ["outside", "update_frame", "interpolate", "interpolate", "play"]
+
+
+def test_record_is_kept_when_the_call_raises():
+    profiler = Profiler(trace_memory=False)
+    with pytest.raises(ValueError):
+        with profiler.record("wait", FakeScene()):
+            raise ValueError
+    assert [record["kind"] for record in profiler.records] == ["wait"]
+    assert profiler.current_record is None
+
+
+def test_peak_memory_is_traced_on_request():
+    profiler = Profiler()
+    with profiler.record("play", FakeScene()):
+        data = bytearray(2**20)
+    del data
+    profiler.stop()
+    assert profiler.records[0]["peak_memory"] >= 2**20
@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from manimlib.render_cache import RenderCache
+from manimlib.render_cache import get_render_cache_key
+
+
+class Results(object):
+    initial_mobject_serializations = {"Square1": {"className": "Square"}}
+    scene_diffs = [{}]
+    animation_diffs = [{}]
+    animation_info_list = [[]]
+
+
+def test_entries_round_trip(tmp_path):
+    cache = RenderCache(str(tmp_path / "cache"))
+    assert cache.store("key", Results())
+    cached_scene = cache.load("key")
+    assert cached_scene.initial_mobject_serializations == \
+        Results.initial_mobject_serializations
+    assert oct(os.stat(cache.get_entry_path("key")).st_mode & 0o777) == "0o600"
+
+
+def test_directory_writable_by_others_is_refused(tmp_path):
+    directory = tmp_path / "cache"
+    directory.mkdir()
+    directory.chmod(0o777)
+    with pytest.raises(PermissionError):
+        RenderCache(str(directory))
+
+
+def test_entries_writable_by_others_are_ignored(tmp_path):
+    cache = RenderCache(str(tmp_path / "cache"))
+    cache.store("key", Results())
+    os.chmod(cache.get_entry_path("key"), 0o666)
+    assert cache.load("key") is None
+    assert os.path.exists(cache.get_entry_path("key"))
+
+
+@pytest.mark.parametrize("corrupt", [
+    lambda data: data[:len(data) // 2],
+    lambda data: b"",
+    # Unpickling raises AttributeError
+    lambda data: b"cmanimlib.render_cache\nNoSuchThing\n.",
+    # Unpickling gives something other than the results
+    lambda data: b"N.",
+])
+def test_bad_entries_are_misses_and_removed(tmp_path, corrupt):
+    cache = RenderCache(str(tmp_path / "cache"))
+    cache.store("key", Results())
+    path = cache.get_entry_path("key")
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(corrupt(data))
+    assert cache.load("key") is None
+    assert cache.misses == 1
+    assert not os.path.exists(path)
+
+
+def test_key_depends_on_tex_point_store(monkeypatch, tmp_path):
+    from manimlib.web.tex_point_store import TexPointStore
+    import manimlib.web.tex_point_store as tex_point_store
+    store = TexPointStore(str(tmp_path / "store"))
+    monkeypatch.setattr(tex_point_store, "default_store", store)
+    key = get_render_cache_key("code", ["Scene"], {})
+    store.add_many([("x", [[[0, 0, 0], [1, 1, 0]]])])
+    assert get_render_cache_key("code", ["Scene"], {}) != key
@@ -0,0 +1,70 @@
+import contextlib
+import io
+
+import numpy as np
+import pytest
+
+import manimlib
+
+CODE = """
+from manimlib.imports import *
+
+class PhaseFlowScene(Scene):
+    def construct(self):
+        square = Square()
+        self.play(PhaseFlow(lambda p: np.array([-p[1], p[0], 0]), square))
+
+class SuccessionScene(Scene):
+    def construct(self):
+        square = Square()
+        self.play(Succession(
+            Rotate(square, PI / 6),
+            Rotate(square, PI / 6),
+        ))
+
+class UpdaterScene(Scene):
+    def construct(self):
+        square = Square()
+        circle = Circle()
+        circle.add_updater(lambda m: m.shift(0.01 * RIGHT))
+        self.add(circle)
+        self.play(ShowCreation(square))
+
+class AlphaFuncScene(Scene):
+    def construct(self):
+        square = Square()
+        self.play(UpdateFromAlphaFunc(
+            square, lambda m, alpha: m.set_width(1 + alpha)
+        ))
+"""
+
+
+def render_points(scene_name, keyframes_only):
+    with contextlib.redirect_stdout(io.StringIO()):
+        scene = manimlib.get_scene(
+            CODE, [scene_name], keyframes_only=keyframes_only
+        )
+        scene.render()
+    return [mob.points for mob in scene.get_mobject_family_members()]
+
+
+@pytest.mark.parametrize("scene_name", [
+    "PhaseFlowScene",
+    "SuccessionScene",
+    "UpdaterScene",
+    "AlphaFuncScene",
+])
+def test_keyframes_only_keeps_path_dependent_results(scene_name):
+    every_frame = render_points(scene_name, False)
+    keyframes = render_points(scene_name, True)
+    assert len(every_frame) == len(keyframes)
+    for points1, points2 in zip(every_frame, keyframes):
+        np.testing.assert_allclose(points1, points2)
+
+
+def test_only_alpha_dependent_updates_can_skip_frames():
+    from manimlib.animation.update import UpdateFromAlphaFunc
+    from manimlib.animation.update import UpdateFromFunc
+    from manimlib.mobject.geometry import Square
+    assert not UpdateFromAlphaFunc(Square(), lambda m, a: m).is_path_dependent()
+    assert UpdateFromFunc(Square(), lambda m: m).is_path_dependent()
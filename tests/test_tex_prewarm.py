@@ -0,0 +1,18 @@
+import manimlib.constants as consts
+from manimlib.web.tex_prewarm import collect_tex_strings
+
+CODE = """
+from manimlib.imports import *
+
+class TexScene(Scene):
+    def construct(self):
+        self.add(TexMobject("x^2"), TextMobject("Hello"))
+"""
+
+
+def test_tex_strings_are_collected_with_their_templates():
+    # Without points in the store, building the scene fails once the
+    # strings are requested, which doesn't keep them from being recorded.
+    tex_strings, _ = collect_tex_strings(CODE)
+    assert tex_strings["x^2"] == consts.TEMPLATE_TEX_FILE_BODY
+    assert tex_strings["\\textrm{Hello}"] == consts.TEMPLATE_TEXT_FILE_BODY
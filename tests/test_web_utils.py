@@ -0,0 +1,57 @@
+import contextvars
+
+import manimlib.web.utils as web_utils
+from manimlib.mobject.geometry import Square
+
+
+def run_in_new_session(function):
+    def wrapper():
+        def run():
+            web_utils.reset_data(None)
+            return function(web_utils.get_session())
+        return contextvars.Context().run(run)
+    wrapper.__name__ = function.__name__
+    return wrapper
+
+
+@run_in_new_session
+def test_registering_again_keeps_mobject_required(session):
+    square = Square()
+    mob_id = id(square)
+    web_utils.mark_ids_required([mob_id])
+    web_utils.register_mobject(square)
+    assert session.initial_mobject_serializations[mob_id]["required"]
+
+
+def style_diff(start, end):
+    return {"style": {"fillOpacity": (start, end)}}
+
+
+@run_in_new_session
+def test_withheld_style_diffs_are_merged(session):
+    mob_id = 1
+    web_utils.withhold_mobject_diff(mob_id, 0, "Square1", style_diff(0, 0.5))
+    session.withheld_diffs[mob_id].append((1, "transformations", (0, "Square1")))
+    web_utils.withhold_mobject_diff(mob_id, 2, "Square1", {
+        **style_diff(0.5, 1),
+        "submobjects": ([], ["Circle1"]),
+    })
+    web_utils.withhold_mobject_diff(mob_id, 4, "Square1", {
+        "style": {"strokeWidth": (4, 2)},
+    })
+    assert session.withheld_diffs[mob_id] == [
+        (1, "transformations", (0, "Square1")),
+        (2, "mobjects", ("Square1", {"submobjects": ([], ["Circle1"])})),
+        (4, "mobjects", ("Square1", {"style": {
+            "fillOpacity": (0, 1),
+            "strokeWidth": (4, 2),
+        }})),
+    ]
+
+
+@run_in_new_session
+def test_withheld_diffs_are_released(session):
+    web_utils.withhold_mobject_diff(1, 0, "Square1", style_diff(0, 1))
+    web_utils.release_withheld_diffs()
+    assert not session.withheld_diffs
+    assert not session.withheld_merged_diff_indices
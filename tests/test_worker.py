@@ -0,0 +1,42 @@
+import queue
+
+import pytest
+
+from manimlib.worker import WorkerPool
+
+CODE = """
+import os
+from manimlib.imports import *
+
+class SquareScene(Scene):
+    def construct(self):
+        self.add(Square())
+
+class DyingScene(Scene):
+    def construct(self):
+        os._exit(3)
+"""
+
+
+def test_job_of_dying_worker_gets_error_reply():
+    with WorkerPool(num_workers=1) as pool:
+        replies = pool.submit(CODE, "DyingScene")
+        reply = replies.get(timeout=60)
+        assert reply["ok"] is False
+        assert "code 3" in reply["error"]
+        # The worker which died was replaced.
+        reply = pool.submit(CODE, "SquareScene").get(timeout=60)
+        assert reply["ok"] is True
+
+
+def test_recycled_workers_reply_once():
+    with WorkerPool(num_workers=1, max_jobs_per_worker=1) as pool:
+        lost_jobs = []
+        pool.reply_to_lost_job = lambda *args: lost_jobs.append(args)
+        for _ in range(2):
+            replies = pool.submit(CODE, "SquareScene")
+            assert replies.get(timeout=60)["ok"] is True
+            with pytest.raises(queue.Empty):
+                replies.get(timeout=0.5)
+        assert pool.num_recycled_workers >= 1
+        assert lost_jobs == []